@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Tuple, Literal, Optional, Dict, Any
 
 
@@ -34,6 +35,12 @@ class SongSection:
     bpm_override: Optional[int] = None
 
 
+@lru_cache(maxsize=128)
+def section_display_name(name: str) -> str:
+    """Format a section name for display, e.g. "pre_chorus" -> "Pre Chorus"."""
+    return name.replace("_", " ").title()
+
+
 @dataclass
 class Song:
     title: str
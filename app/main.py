@@ -1,19 +1,61 @@
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QPushButton, QLabel, QComboBox, 
                               QSlider, QGroupBox, QStackedWidget, QMessageBox,
                               QSplashScreen)
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont, QPixmap, QIcon
+from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtGui import QFont, QPixmap, QIcon, QStandardItemModel, QStandardItem
 
-from core.patterns import load_patterns, load_songs
+from core.patterns import load_patterns, load_songs, StrumPattern, Step
 from core.metronome import Metronome
 from core.audio_engine import AudioEngine
 from ui.practice_view import PracticeView
 from ui.song_view import SongView
+from ui.styles import APP_QSS
+
+
+def _build_combo_model(rows, parent=None):
+    """Build a combo box model from ``(text, data)`` rows in a single batch."""
+    model = QStandardItemModel(parent)
+    items = []
+    for text, data in rows:
+        item = QStandardItem(text)
+        item.setData(data, Qt.UserRole)
+        items.append(item)
+    model.invisibleRootItem().appendRows(items)
+    return model
+
+
+_FONT_TITLE = QFont("Arial", 20, QFont.Bold)
+_FONT_WELCOME = QFont("Arial", 16)
+
+# Built-in pattern used when patterns.yaml cannot be loaded
+_FALLBACK_PATTERNS = {
+    "rock_8": StrumPattern(
+        id="rock_8",
+        name="Рок-восьмушки (встроенный)",
+        time_sig=(4, 4),
+        steps_per_bar=8,
+        steps=[
+            Step(0.0, "D", 0.7),
+            Step(0.125, "U"),
+            Step(0.25, "D", 1.0),
+            Step(0.375, "U"),
+            Step(0.5, "D", 0.7),
+            Step(0.625, "U"),
+            Step(0.75, "D", 1.0),
+            Step(0.875, "U")
+        ],
+        bpm_default=92,
+        bpm_min=60,
+        bpm_max=140,
+        notes="Базовый рок-ритм с акцентами на 2 и 4 доли"
+    ),
+}
 
 
 class MainWindow(QMainWindow):
@@ -24,6 +66,7 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("GStrummer - Гитарные ритмы")
         self.setGeometry(100, 100, 1200, 800)
         self.setMinimumSize(1000, 700)
+        self._status_bar = self.statusBar()
         
         # Initialize core components
         self.audio_engine = AudioEngine()
@@ -37,6 +80,9 @@ class MainWindow(QMainWindow):
         self.current_pattern = None
         self.current_song = None
         
+        # Rendered preview HTML per pattern_id (patterns are immutable after load)
+        self._preview_cache: dict[str, str] = {}
+        
         self.init_ui()
         self.setup_connections()
         
@@ -44,9 +90,17 @@ class MainWindow(QMainWindow):
         self.apply_stylesheet()
         
     def load_data(self):
-        """Load patterns and songs with comprehensive error handling."""
+        """Load patterns and songs with comprehensive error handling.
+
+        Both YAML files are read and parsed concurrently; errors are
+        re-raised from ``result()`` so they are handled on the GUI thread.
+        """
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            patterns_future = pool.submit(load_patterns, "app/data/patterns.yaml")
+            songs_future = pool.submit(load_songs, "app/data/songs.yaml")
+
         try:
-            self.patterns = load_patterns("app/data/patterns.yaml")
+            self.patterns = patterns_future.result()
             print(f"Loaded {len(self.patterns)} patterns")
         except Exception as e:
             print(f"Error loading patterns: {e}")
@@ -56,7 +110,7 @@ class MainWindow(QMainWindow):
             self.patterns = self.create_fallback_patterns()
             
         try:
-            self.songs = load_songs("app/data/songs.yaml")
+            self.songs = songs_future.result()
             print(f"Loaded {len(self.songs)} songs")
         except Exception as e:
             print(f"Error loading songs: {e}")
@@ -64,33 +118,8 @@ class MainWindow(QMainWindow):
             self.songs = []
         
     def create_fallback_patterns(self):
-        """Create basic fallback patterns if YAML loading fails."""
-        from core.patterns import StrumPattern, Step
-        
-        rock_steps = [
-            Step(0.0, "D", 0.7),
-            Step(0.125, "U"),
-            Step(0.25, "D", 1.0),
-            Step(0.375, "U"),
-            Step(0.5, "D", 0.7),
-            Step(0.625, "U"),
-            Step(0.75, "D", 1.0),
-            Step(0.875, "U")
-        ]
-        
-        rock_pattern = StrumPattern(
-            id="rock_8",
-            name="Рок-восьмушки (встроенный)",
-            time_sig=(4, 4),
-            steps_per_bar=8,
-            steps=rock_steps,
-            bpm_default=92,
-            bpm_min=60,
-            bpm_max=140,
-            notes="Базовый рок-ритм с акцентами на 2 и 4 доли"
-        )
-        
-        return {"rock_8": rock_pattern}
+        """Return basic fallback patterns if YAML loading fails."""
+        return dict(_FALLBACK_PATTERNS)
         
     def init_ui(self):
         """Initialize the main UI."""
@@ -108,14 +137,13 @@ class MainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         layout.addWidget(self.stacked_widget)
         
-        # Create views
+        # Create views (practice view is built on first use)
         self.main_menu = self.create_main_menu()
-        self.practice_view = PracticeView(self.audio_engine, self.metronome)
+        self.practice_view = None
         self.song_view = SongView(self.audio_engine, self.metronome)
         
         # Add views to stack
         self.stacked_widget.addWidget(self.main_menu)
-        self.stacked_widget.addWidget(self.practice_view)
         self.stacked_widget.addWidget(self.song_view)
         
         # Start with main menu
@@ -128,30 +156,37 @@ class MainWindow(QMainWindow):
         
         # App title
         title = QLabel("🎸 GStrummer")
-        title.setFont(QFont("Arial", 20, QFont.Bold))
-        title.setStyleSheet("color: #2c3e50; margin: 10px;")
+        title.setFont(_FONT_TITLE)
+        title.setObjectName("appTitle")
         header_layout.addWidget(title)
         
         header_layout.addStretch()
         
         # Version info
         version_label = QLabel("v1.0")
-        version_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        version_label.setObjectName("appVersion")
         header_layout.addWidget(version_label)
         
         return header_widget
         
     def setup_connections(self):
         """Setup signal connections."""
-        # Practice view connections
-        self.practice_view.back_requested.connect(self.show_main_menu)
-        
         # Song view connections
         self.song_view.back_requested.connect(self.show_main_menu)
         
         # Metronome connections for status updates
-        self.metronome.started.connect(lambda: self.statusBar().showMessage("Метроном запущен"))
-        self.metronome.stopped.connect(lambda: self.statusBar().showMessage("Метроном остановлен"))
+        self.metronome.started.connect(self._on_metronome_started)
+        self.metronome.stopped.connect(self._on_metronome_stopped)
+        
+    @Slot()
+    def _on_metronome_started(self):
+        """Report metronome start in the status bar."""
+        self._status_bar.showMessage("Метроном запущен")
+        
+    @Slot()
+    def _on_metronome_stopped(self):
+        """Report metronome stop in the status bar."""
+        self._status_bar.showMessage("Метроном остановлен")
         
     def create_main_menu(self):
         """Create the main menu interface with improved styling."""
@@ -161,9 +196,9 @@ class MainWindow(QMainWindow):
         
         # Welcome message
         welcome = QLabel("Добро пожаловать в GStrummer!")
-        welcome.setFont(QFont("Arial", 16))
+        welcome.setFont(_FONT_WELCOME)
         welcome.setAlignment(Qt.AlignCenter)
-        welcome.setStyleSheet("margin: 20px; color: #34495e;")
+        welcome.setObjectName("welcomeLabel")
         layout.addWidget(welcome)
         
         # Main content in horizontal layout
@@ -179,49 +214,19 @@ class MainWindow(QMainWindow):
         
         practice_btn = QPushButton("🎵 Практика ритмов")
         practice_btn.setMinimumHeight(50)
-        practice_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
+        practice_btn.setObjectName("practiceButton")
         practice_btn.clicked.connect(self.show_practice)
         mode_layout.addWidget(practice_btn)
         
         quiz_btn = QPushButton("🎲 Викторина (скоро)")
         quiz_btn.setMinimumHeight(40)
         quiz_btn.setEnabled(False)
-        quiz_btn.setStyleSheet("background-color: #bdc3c7; color: #7f8c8d; border-radius: 6px;")
+        quiz_btn.setObjectName("quizButton")
         mode_layout.addWidget(quiz_btn)
         
         song_btn = QPushButton("🎤 Песни")
         song_btn.setMinimumHeight(50)
-        song_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
+        song_btn.setObjectName("songButton")
         song_btn.clicked.connect(self.show_songs)
         mode_layout.addWidget(song_btn)
         
@@ -236,21 +241,19 @@ class MainWindow(QMainWindow):
         
         self.pattern_combo = QComboBox()
         self.pattern_combo.setMinimumHeight(35)
-        for pattern_id, pattern in self.patterns.items():
-            self.pattern_combo.addItem(pattern.name, pattern_id)
-        self.pattern_combo.currentTextChanged.connect(self.on_pattern_preview)
+        self.pattern_combo.blockSignals(True)
+        self.pattern_combo.setModel(_build_combo_model(
+            ((pattern.name, pattern_id) for pattern_id, pattern in self.patterns.items()),
+            self.pattern_combo,
+        ))
+        self.pattern_combo.blockSignals(False)
+        self.pattern_combo.currentIndexChanged.connect(self.on_pattern_preview)
         pattern_layout.addWidget(self.pattern_combo)
         
         # Pattern preview info
         self.pattern_preview = QLabel("Выберите ритм для предпросмотра")
         self.pattern_preview.setWordWrap(True)
-        self.pattern_preview.setStyleSheet("""
-            background-color: #ecf0f1;
-            border: 1px solid #bdc3c7;
-            border-radius: 6px;
-            padding: 10px;
-            margin-top: 10px;
-        """)
+        self.pattern_preview.setObjectName("patternPreview")
         pattern_layout.addWidget(self.pattern_preview)
         
         left_layout.addWidget(pattern_group)
@@ -270,8 +273,12 @@ class MainWindow(QMainWindow):
             
             self.song_combo = QComboBox()
             self.song_combo.setMinimumHeight(35)
-            for song in self.songs:
-                self.song_combo.addItem(f"{song.artist} - {song.title}")
+            self.song_combo.blockSignals(True)
+            self.song_combo.setModel(_build_combo_model(
+                ((f"{song.artist} - {song.title}", None) for song in self.songs),
+                self.song_combo,
+            ))
+            self.song_combo.blockSignals(False)
             song_layout.addWidget(self.song_combo)
             
             right_layout.addWidget(song_group)
@@ -290,13 +297,7 @@ class MainWindow(QMainWindow):
         """
         
         tips_label = QLabel(tips_text)
-        tips_label.setStyleSheet("""
-            background-color: #fff3cd;
-            border: 1px solid #ffeaa7;
-            border-radius: 6px;
-            padding: 15px;
-            color: #856404;
-        """)
+        tips_label.setObjectName("tipsLabel")
         tips_layout.addWidget(tips_label)
         
         right_layout.addWidget(tips_group)
@@ -311,28 +312,33 @@ class MainWindow(QMainWindow):
         
         return widget
     
-    def on_pattern_preview(self):
+    @Slot(int)
+    def on_pattern_preview(self, index=-1):
         """Update pattern preview when selection changes."""
         pattern_id = self.pattern_combo.currentData()
         if pattern_id and pattern_id in self.patterns:
-            pattern = self.patterns[pattern_id]
-            
-            time_sig = f"{pattern.time_sig[0]}/{pattern.time_sig[1]}"
-            preview_text = f"""
+            preview_text = self._preview_cache.get(pattern_id)
+            if preview_text is None:
+                pattern = self.patterns[pattern_id]
+                
+                time_sig = f"{pattern.time_sig[0]}/{pattern.time_sig[1]}"
+                preview_text = f"""
 <b>{pattern.name}</b><br>
 <b>Размер:</b> {time_sig} | <b>Темп:</b> {pattern.bpm_default} BPM ({pattern.bpm_min}-{pattern.bpm_max})<br>
 <b>Шагов в такте:</b> {pattern.steps_per_bar}<br><br>
 <i>{pattern.notes}</i>
-            """.strip()
+                """.strip()
+                self._preview_cache[pattern_id] = preview_text
             
             self.pattern_preview.setText(preview_text)
     
     def show_main_menu(self):
         """Show the main menu and stop any practice."""
-        self.stacked_widget.setCurrentIndex(0)
+        self.stacked_widget.setCurrentWidget(self.main_menu)
         self.metronome.stop()
-        self.practice_view.cleanup()
-        self.statusBar().showMessage("Готов к работе")
+        if self.practice_view is not None:
+            self.practice_view.cleanup()
+        self._status_bar.showMessage("Готов к работе")
     
     def show_practice(self):
         """Show practice view with selected pattern."""
@@ -340,6 +346,11 @@ class MainWindow(QMainWindow):
         if pattern_id and pattern_id in self.patterns:
             self.current_pattern = self.patterns[pattern_id]
             
+            if self.practice_view is None:
+                self.practice_view = PracticeView(self.audio_engine, self.metronome)
+                self.practice_view.back_requested.connect(self.show_main_menu)
+                self.stacked_widget.addWidget(self.practice_view)
+            
             # Setup practice view
             self.practice_view.set_pattern(self.current_pattern)
             self.practice_view.set_patterns(self.patterns)
@@ -347,8 +358,8 @@ class MainWindow(QMainWindow):
             # Select the same pattern in practice view
             self.practice_view.transport.select_pattern(pattern_id)
             
-            self.stacked_widget.setCurrentIndex(1)
-            self.statusBar().showMessage(f"Практика: {self.current_pattern.name}")
+            self.stacked_widget.setCurrentWidget(self.practice_view)
+            self._status_bar.showMessage(f"Практика: {self.current_pattern.name}")
         else:
             QMessageBox.warning(self, "Выбор ритма", 
                               "Пожалуйста, выберите ритм для практики")
@@ -360,66 +371,12 @@ class MainWindow(QMainWindow):
         self.song_view.set_songs(self.songs)
         
         # Switch to song view
-        self.stacked_widget.setCurrentIndex(2)
-        self.statusBar().showMessage("Режим: Изучение песен")
+        self.stacked_widget.setCurrentWidget(self.song_view)
+        self._status_bar.showMessage("Режим: Изучение песен")
     
     def apply_stylesheet(self):
         """Apply global stylesheet to the application."""
-        style = """
-        QMainWindow {
-            background-color: #f8f9fa;
-        }
-        
-        QGroupBox {
-            font-weight: bold;
-            font-size: 14px;
-            color: #2c3e50;
-            border: 2px solid #bdc3c7;
-            border-radius: 8px;
-            margin-top: 10px;
-            padding-top: 10px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            padding: 0 10px;
-            background-color: #f8f9fa;
-        }
-        
-        QComboBox {
-            border: 1px solid #bdc3c7;
-            border-radius: 4px;
-            padding: 5px;
-            background-color: white;
-        }
-        
-        QComboBox:focus {
-            border: 2px solid #3498db;
-        }
-        
-        QPushButton {
-            border: 1px solid #bdc3c7;
-            border-radius: 6px;
-            padding: 8px 16px;
-            background-color: #ecf0f1;
-            font-size: 12px;
-        }
-        
-        QPushButton:hover {
-            background-color: #d5dbdb;
-        }
-        
-        QPushButton:pressed {
-            background-color: #bdc3c7;
-        }
-        
-        QPushButton:disabled {
-            color: #95a5a6;
-            background-color: #f8f9fa;
-        }
-        """
-        self.setStyleSheet(style)
+        QApplication.instance().setStyleSheet(APP_QSS)
     
     def closeEvent(self, event):
         """Handle application close event."""
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -13,6 +15,19 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont
 
+_FONT_POPUP_TITLE = QFont("Arial", 16, QFont.Weight.Bold)
+
+
+@contextmanager
+def _signals_blocked(*widgets):
+    """Temporarily block Qt signals on ``widgets`` during programmatic updates."""
+    previous = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, was_blocked in zip(widgets, previous):
+            widget.blockSignals(was_blocked)
+
 
 class AudioSettingsPopup(QDialog):
     """Popup window with detailed audio settings controls."""
@@ -58,7 +73,7 @@ class AudioSettingsPopup(QDialog):
 
         # Title
         title = QLabel("🔊 Audio Settings")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setFont(_FONT_POPUP_TITLE)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title.setStyleSheet("color: #2c3e50; margin-bottom: 10px;")
         layout.addWidget(title)
@@ -292,38 +307,22 @@ class AudioSettingsPopup(QDialog):
     def set_instrument(self, instrument: str, available: list[str]):
         """Update available instruments and current selection."""
         self._available_instruments = available
-        self.instrument_combo.clear()
-        for name in available:
-            self.instrument_combo.addItem(name)
-        idx = self.instrument_combo.findText(instrument)
-        if idx >= 0:
-            self.instrument_combo.setCurrentIndex(idx)
+        with _signals_blocked(self.instrument_combo):
+            self.instrument_combo.clear()
+            for name in available:
+                self.instrument_combo.addItem(name)
+            idx = self.instrument_combo.findText(instrument)
+            if idx >= 0:
+                self.instrument_combo.setCurrentIndex(idx)
         self._instrument = instrument
 
     def _get_dialog_stylesheet(self):
-        """Get stylesheet for the dialog."""
+        """Get dialog-specific overrides on top of the application stylesheet."""
         return """
         QDialog {
             background-color: #f8f9fa;
         }
         
-        QGroupBox {
-            font-weight: bold;
-            font-size: 14px;
-            color: #2c3e50;
-            border: 2px solid #bdc3c7;
-            border-radius: 8px;
-            margin-top: 10px;
-            padding-top: 10px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            padding: 0 10px;
-            background-color: #f8f9fa;
-        }
-        
         QSlider::groove:horizontal {
             border: 1px solid #bdc3c7;
             height: 8px;
@@ -350,22 +349,14 @@ class AudioSettingsPopup(QDialog):
         }
         
         QPushButton {
-            border: 1px solid #bdc3c7;
-            border-radius: 6px;
-            background-color: #ecf0f1;
             padding: 5px 10px;
             font-size: 14px;
         }
         
         QPushButton:hover {
-            background-color: #d5dbdb;
             border: 2px solid #3498db;
         }
         
-        QPushButton:pressed {
-            background-color: #bdc3c7;
-        }
-        
         QPushButton:checked {
             background-color: #e74c3c;
             border: 2px solid #c0392b;
@@ -406,10 +397,11 @@ class AudioSettingsPopup(QDialog):
         self._master_volume = volume
         self._master_muted = muted
 
-        self.master_slider.setValue(int(volume * 100))
-        self.master_label.setText(f"{int(volume * 100)}%")
-        self.master_mute_btn.setChecked(muted)
-        self.master_mute_btn.setText("🔇" if muted else "🔊")
+        with _signals_blocked(self.master_slider, self.master_mute_btn):
+            self.master_slider.setValue(int(volume * 100))
+            self.master_label.setText(f"{int(volume * 100)}%")
+            self.master_mute_btn.setChecked(muted)
+            self.master_mute_btn.setText("🔇" if muted else "🔊")
 
     def set_click_volume(self, volume: float, muted: bool, enabled: bool):
         """Set click volume values."""
@@ -417,13 +409,16 @@ class AudioSettingsPopup(QDialog):
         self._click_muted = muted
         self._click_enabled = enabled
 
-        self.click_slider.setValue(int(volume * 100))
-        self.click_slider.setEnabled(enabled)
-        self.click_label.setText(f"{int(volume * 100)}%")
-        self.click_mute_btn.setChecked(muted)
-        self.click_mute_btn.setText("🔇" if muted else "🎵")
-        self.click_mute_btn.setEnabled(enabled)
-        self.click_enable_cb.setChecked(enabled)
+        with _signals_blocked(
+            self.click_slider, self.click_mute_btn, self.click_enable_cb
+        ):
+            self.click_slider.setValue(int(volume * 100))
+            self.click_slider.setEnabled(enabled)
+            self.click_label.setText(f"{int(volume * 100)}%")
+            self.click_mute_btn.setChecked(muted)
+            self.click_mute_btn.setText("🔇" if muted else "🎵")
+            self.click_mute_btn.setEnabled(enabled)
+            self.click_enable_cb.setChecked(enabled)
 
     def set_strum_volume(self, volume: float, muted: bool, enabled: bool):
         """Set strum volume values."""
@@ -431,10 +426,13 @@ class AudioSettingsPopup(QDialog):
         self._strum_muted = muted
         self._strum_enabled = enabled
 
-        self.strum_slider.setValue(int(volume * 100))
-        self.strum_slider.setEnabled(enabled)
-        self.strum_label.setText(f"{int(volume * 100)}%")
-        self.strum_mute_btn.setChecked(muted)
-        self.strum_mute_btn.setText("🔇" if muted else "🎸")
-        self.strum_mute_btn.setEnabled(enabled)
-        self.strum_enable_cb.setChecked(enabled)
+        with _signals_blocked(
+            self.strum_slider, self.strum_mute_btn, self.strum_enable_cb
+        ):
+            self.strum_slider.setValue(int(volume * 100))
+            self.strum_slider.setEnabled(enabled)
+            self.strum_label.setText(f"{int(volume * 100)}%")
+            self.strum_mute_btn.setChecked(muted)
+            self.strum_mute_btn.setText("🔇" if muted else "🎸")
+            self.strum_mute_btn.setEnabled(enabled)
+            self.strum_enable_cb.setChecked(enabled)
@@ -2,6 +2,8 @@ from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
+_FONT_STATUS = QFont("Arial", 9)
+
 
 class AudioStatusWidget(QWidget):
     """Widget showing audio system status."""
@@ -9,6 +11,7 @@ class AudioStatusWidget(QWidget):
     def __init__(self, audio_engine, parent=None):
         super().__init__(parent)
         self.audio = audio_engine
+        self._last_state = None  # (available, device_name) last rendered
         self.init_ui()
         self.update_status()
         
@@ -18,19 +21,28 @@ class AudioStatusWidget(QWidget):
         layout.setContentsMargins(5, 2, 5, 2)
         
         self.status_label = QLabel()
-        self.status_label.setFont(QFont("Arial", 9))
+        self.status_label.setFont(_FONT_STATUS)
         layout.addWidget(self.status_label)
         
         layout.addStretch()
         
     def update_status(self):
-        """Update the audio status display."""
-        if self.audio.is_available():
+        """Update the audio status display if the audio state has changed."""
+        available = self.audio.is_available()
+        device_name = None
+        if available:
             device_info = self.audio.get_device_info()
             if device_info and hasattr(device_info, 'get'):
                 device_name = device_info.get('name', 'Unknown')
             else:
                 device_name = "Available"
+
+        state = (available, device_name)
+        if state == self._last_state:
+            return
+        self._last_state = state
+
+        if available:
             self.status_label.setText(f"🔊 Audio: {device_name}")
             self.status_label.setStyleSheet("color: green;")
         else:
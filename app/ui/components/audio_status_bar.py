@@ -1,8 +1,50 @@
+from contextlib import contextmanager
 from typing import List
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QSize, Signal, Slot
 from PySide6.QtWidgets import QHBoxLayout, QPushButton, QWidget
 
+from app.ui.icons import get_emoji_icon
+from .audio_settings_popup import AudioSettingsPopup
+
+_ICON_SIZE = QSize(22, 22)
+
+
+_STATUS_BAR_QSS = """
+QPushButton#audioToggle {
+    border: 1px solid #bdc3c7;
+    border-radius: 6px;
+    background-color: #ecf0f1;
+    font-size: 16px;
+    font-weight: bold;
+}
+QPushButton#audioToggle:hover {
+    background-color: #d5dbdb;
+    border: 2px solid #3498db;
+}
+QPushButton#audioToggle:pressed {
+    background-color: #bdc3c7;
+}
+QPushButton#audioToggle:checked {
+    background-color: #e74c3c;
+    border: 2px solid #c0392b;
+    color: white;
+}
+QPushButton#audioSettings {
+    border: 1px solid #95a5a6;
+    border-radius: 6px;
+    background-color: #f8f9fa;
+    font-size: 14px;
+}
+QPushButton#audioSettings:hover {
+    background-color: #e9ecef;
+    border: 2px solid #6c757d;
+}
+QPushButton#audioSettings:pressed {
+    background-color: #dee2e6;
+}
+"""
+
 
 class AudioStatusBar(QWidget):
     """Compact audio status bar with icon indicators and settings popup."""
@@ -13,24 +55,31 @@ class AudioStatusBar(QWidget):
     mute_toggled = Signal(str, bool)  # volume_type, muted
     instrument_changed = Signal(str)  # instrument name
 
+    # Per-channel icon and tooltip label
+    _CHANNELS = {
+        "master": ("🔊", "Master Volume"),
+        "click": ("🎵", "Metronome"),
+        "strum": ("🎸", "Strum Sounds"),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Audio state tracking
-        self._master_muted = False
-        self._master_volume = 0.8
-        self._click_enabled = True
-        self._click_muted = False
-        self._click_volume = 0.7
-        self._strum_enabled = True
-        self._strum_muted = False
-        self._strum_volume = 0.5
+        # Audio state tracking, one entry per channel
+        self._state = {
+            "master": {"volume": 0.8, "muted": False, "enabled": True},
+            "click": {"volume": 0.7, "muted": False, "enabled": True},
+            "strum": {"volume": 0.5, "muted": False, "enabled": True},
+        }
         self._instrument = "guitar"
         self._available_instruments: List[str] = ["guitar"]
 
         # Popup window (created on demand)
         self._settings_popup = None
 
+        # Nesting depth of _batched(); icon refresh is deferred while > 0
+        self._suspend = 0
+
         self.init_ui()
         self.update_icon_states()
 
@@ -41,7 +90,8 @@ class AudioStatusBar(QWidget):
         layout.setSpacing(8)
 
         # Master volume status
-        self.master_btn = QPushButton("🔊")
+        self.master_btn = QPushButton()
+        self.master_btn.setIconSize(_ICON_SIZE)
         self.master_btn.setMinimumSize(35, 35)
         self.master_btn.setMaximumSize(45, 45)
         self.master_btn.setCheckable(True)
@@ -50,7 +100,8 @@ class AudioStatusBar(QWidget):
         layout.addWidget(self.master_btn)
 
         # Metronome status
-        self.click_btn = QPushButton("🎵")
+        self.click_btn = QPushButton()
+        self.click_btn.setIconSize(_ICON_SIZE)
         self.click_btn.setMinimumSize(35, 35)
         self.click_btn.setMaximumSize(45, 45)
         self.click_btn.setCheckable(True)
@@ -59,7 +110,8 @@ class AudioStatusBar(QWidget):
         layout.addWidget(self.click_btn)
 
         # Strum sounds status
-        self.strum_btn = QPushButton("🎸")
+        self.strum_btn = QPushButton()
+        self.strum_btn.setIconSize(_ICON_SIZE)
         self.strum_btn.setMinimumSize(35, 35)
         self.strum_btn.setMaximumSize(45, 45)
         self.strum_btn.setCheckable(True)
@@ -68,7 +120,9 @@ class AudioStatusBar(QWidget):
         layout.addWidget(self.strum_btn)
 
         # Settings button
-        self.settings_btn = QPushButton("🔧")
+        self.settings_btn = QPushButton()
+        self.settings_btn.setIcon(get_emoji_icon("🔧"))
+        self.settings_btn.setIconSize(_ICON_SIZE)
         self.settings_btn.setMinimumSize(35, 35)
         self.settings_btn.setMaximumSize(45, 45)
         self.settings_btn.setToolTip("Audio Settings (Click for detailed controls)")
@@ -78,127 +132,96 @@ class AudioStatusBar(QWidget):
         # Add stretch to keep icons compact
         layout.addStretch()
 
+        self._buttons = {
+            "master": self.master_btn,
+            "click": self.click_btn,
+            "strum": self.strum_btn,
+        }
+        # Last (emoji, tooltip) applied to each button
+        self._applied = {channel: (None, None) for channel in self._buttons}
+
         # Style the buttons
         self._apply_button_styles()
 
     def _apply_button_styles(self):
-        """Apply consistent styling to all buttons."""
-        button_style = """
-        QPushButton {
-            border: 1px solid #bdc3c7;
-            border-radius: 6px;
-            background-color: #ecf0f1;
-            font-size: 16px;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            background-color: #d5dbdb;
-            border: 2px solid #3498db;
-        }
-        QPushButton:pressed {
-            background-color: #bdc3c7;
-        }
-        QPushButton:checked {
-            background-color: #e74c3c;
-            border: 2px solid #c0392b;
-            color: white;
-        }
-        """
-
-        for btn in [self.master_btn, self.click_btn, self.strum_btn]:
-            btn.setStyleSheet(button_style)
-
-        # Settings button has different style
-        settings_style = """
-        QPushButton {
-            border: 1px solid #95a5a6;
-            border-radius: 6px;
-            background-color: #f8f9fa;
-            font-size: 14px;
-        }
-        QPushButton:hover {
-            background-color: #e9ecef;
-            border: 2px solid #6c757d;
-        }
-        QPushButton:pressed {
-            background-color: #dee2e6;
-        }
-        """
-        self.settings_btn.setStyleSheet(settings_style)
+        """Apply one stylesheet covering all status bar buttons."""
+        for btn in (self.master_btn, self.click_btn, self.strum_btn):
+            btn.setObjectName("audioToggle")
+        self.settings_btn.setObjectName("audioSettings")
+        self.setStyleSheet(_STATUS_BAR_QSS)
+
+    @contextmanager
+    def _batched(self):
+        """Defer icon refreshes until the outermost batch exits."""
+        self._suspend += 1
+        try:
+            yield
+        finally:
+            self._suspend -= 1
+        if self._suspend == 0:
+            self.update_icon_states()
 
     def update_icon_states(self):
         """Update icon display based on current audio states."""
-        # Master volume icon
-        if self._master_muted or self._master_volume == 0:
-            self.master_btn.setText("🔇")
-            self.master_btn.setChecked(True)
-            self.master_btn.setToolTip(
-                f"Master Volume: MUTED ({int(self._master_volume * 100)}%)"
-            )
-        else:
-            self.master_btn.setText("🔊")
-            self.master_btn.setChecked(False)
-            self.master_btn.setToolTip(
-                f"Master Volume: {int(self._master_volume * 100)}%"
-            )
+        if self._suspend:
+            return
 
-        # Metronome icon
-        if not self._click_enabled or self._click_muted:
-            self.click_btn.setText("🔇")
-            self.click_btn.setChecked(True)
-            if not self._click_enabled:
-                self.click_btn.setToolTip("Metronome: DISABLED")
-            else:
-                self.click_btn.setToolTip(
-                    f"Metronome: MUTED ({int(self._click_volume * 100)}%)"
-                )
-        else:
-            self.click_btn.setText("🎵")
-            self.click_btn.setChecked(False)
-            self.click_btn.setToolTip(f"Metronome: {int(self._click_volume * 100)}%")
-
-        # Strum sounds icon
-        if not self._strum_enabled or self._strum_muted:
-            self.strum_btn.setText("🔇")
-            self.strum_btn.setChecked(True)
-            if not self._strum_enabled:
-                self.strum_btn.setToolTip("Strum Sounds: DISABLED")
+        for channel, state in self._state.items():
+            icon, label = self._CHANNELS[channel]
+            percent = int(state["volume"] * 100)
+            if not state["enabled"]:
+                emoji, checked, tooltip = "🔇", True, f"{label}: DISABLED"
+            elif state["muted"] or (channel == "master" and state["volume"] == 0):
+                emoji, checked, tooltip = "🔇", True, f"{label}: MUTED ({percent}%)"
             else:
-                self.strum_btn.setToolTip(
-                    f"Strum Sounds: MUTED ({int(self._strum_volume * 100)}%)"
-                )
-        else:
-            self.strum_btn.setText("🎸")
-            self.strum_btn.setChecked(False)
-            self.strum_btn.setToolTip(f"Strum Sounds: {int(self._strum_volume * 100)}%")
-
+                emoji, checked, tooltip = icon, False, f"{label}: {percent}%"
+
+            # Only touch properties that changed. Checked state is read back
+            # from the button because Qt toggles it on click by itself.
+            button = self._buttons[channel]
+            if button.isChecked() != checked:
+                button.setChecked(checked)
+            if self._applied[channel] != (emoji, tooltip):
+                last_emoji, last_tooltip = self._applied[channel]
+                if emoji != last_emoji:
+                    button.setIcon(get_emoji_icon(emoji))
+                if tooltip != last_tooltip:
+                    button.setToolTip(tooltip)
+                self._applied[channel] = (emoji, tooltip)
+
+    @Slot()
     def _toggle_master_mute(self):
         """Toggle master volume mute state."""
-        self._master_muted = not self._master_muted
+        master = self._state["master"]
+        master["muted"] = not master["muted"]
         self.update_icon_states()
 
         # Emit signal with effective volume (0 if muted)
-        effective_volume = 0.0 if self._master_muted else self._master_volume
+        effective_volume = 0.0 if master["muted"] else master["volume"]
         self.volume_changed.emit("master", effective_volume)
-        self.mute_toggled.emit("master", self._master_muted)
+        self.mute_toggled.emit("master", master["muted"])
 
+    @Slot()
     def _toggle_click_enabled(self):
         """Toggle metronome enabled state."""
-        self._click_enabled = not self._click_enabled
-        self.update_icon_states()
-        self.enabled_changed.emit("click", self._click_enabled)
+        self._toggle_enabled("click")
 
+    @Slot()
     def _toggle_strum_enabled(self):
         """Toggle strum sounds enabled state."""
-        self._strum_enabled = not self._strum_enabled
+        self._toggle_enabled("strum")
+
+    def _toggle_enabled(self, channel: str):
+        """Flip a channel's enabled state and notify listeners."""
+        state = self._state[channel]
+        state["enabled"] = not state["enabled"]
         self.update_icon_states()
-        self.enabled_changed.emit("strum", self._strum_enabled)
+        self.enabled_changed.emit(channel, state["enabled"])
 
+    @Slot()
     def _open_settings_popup(self):
         """Open the detailed audio settings popup."""
         if self._settings_popup is None:
-            from .audio_settings_popup import AudioSettingsPopup
-
             self._settings_popup = AudioSettingsPopup(self)
 
             # Connect popup signals to our signals
@@ -209,72 +232,68 @@ class AudioStatusBar(QWidget):
                 self._on_popup_instrument_changed
             )
 
-        # Update popup with current values
+        # Update popup with current values; any echoed changes refresh once
         if self._settings_popup:
-            self._settings_popup.set_master_volume(
-                self._master_volume, self._master_muted
-            )
-            self._settings_popup.set_click_volume(
-                self._click_volume, self._click_muted, self._click_enabled
-            )
-            self._settings_popup.set_strum_volume(
-                self._strum_volume, self._strum_muted, self._strum_enabled
-            )
-            self._settings_popup.set_instrument(
-                self._instrument, self._available_instruments
+            master, click, strum = (
+                self._state["master"],
+                self._state["click"],
+                self._state["strum"],
             )
+            with self._batched():
+                self._settings_popup.set_master_volume(
+                    master["volume"], master["muted"]
+                )
+                self._settings_popup.set_click_volume(
+                    click["volume"], click["muted"], click["enabled"]
+                )
+                self._settings_popup.set_strum_volume(
+                    strum["volume"], strum["muted"], strum["enabled"]
+                )
+                self._settings_popup.set_instrument(
+                    self._instrument, self._available_instruments
+                )
 
         # Show popup
         self._settings_popup.show()
         self._settings_popup.raise_()
         self._settings_popup.activateWindow()
 
+    @Slot(str, float)
     def _on_popup_volume_changed(self, volume_type: str, value: float):
         """Handle volume changes from popup."""
-        if volume_type == "master":
-            self._master_volume = value
-        elif volume_type == "click":
-            self._click_volume = value
-        elif volume_type == "strum":
-            self._strum_volume = value
+        if volume_type in self._state:
+            self._state[volume_type]["volume"] = value
 
         self.update_icon_states()
         self.volume_changed.emit(volume_type, value)
 
+    @Slot(str, bool)
     def _on_popup_enabled_changed(self, audio_type: str, enabled: bool):
         """Handle enable/disable changes from popup."""
-        if audio_type == "click":
-            self._click_enabled = enabled
-        elif audio_type == "strum":
-            self._strum_enabled = enabled
+        if audio_type in ("click", "strum"):
+            self._state[audio_type]["enabled"] = enabled
 
         self.update_icon_states()
         self.enabled_changed.emit(audio_type, enabled)
 
+    @Slot(str, bool)
     def _on_popup_mute_toggled(self, volume_type: str, muted: bool):
         """Handle mute toggle from popup."""
-        if volume_type == "master":
-            self._master_muted = muted
-        elif volume_type == "click":
-            self._click_muted = muted
-        elif volume_type == "strum":
-            self._strum_muted = muted
+        # Both signals below may feed back into the setters; refresh once
+        with self._batched():
+            state = self._state.get(volume_type)
+            if state is not None:
+                state["muted"] = muted
 
-        self.update_icon_states()
-        self.mute_toggled.emit(volume_type, muted)
-
-        # Also emit volume signal with effective volume
-        if volume_type == "master":
-            effective_volume = 0.0 if muted else self._master_volume
-        elif volume_type == "click":
-            effective_volume = 0.0 if muted else self._click_volume
-        elif volume_type == "strum":
-            effective_volume = 0.0 if muted else self._strum_volume
-        else:
-            return
+            self.mute_toggled.emit(volume_type, muted)
 
-        self.volume_changed.emit(volume_type, effective_volume)
+            # Also emit volume signal with effective volume
+            if state is None:
+                return
+            effective_volume = 0.0 if muted else state["volume"]
+            self.volume_changed.emit(volume_type, effective_volume)
 
+    @Slot(str)
     def _on_popup_instrument_changed(self, instrument: str):
         """Handle instrument change from popup."""
         self._instrument = instrument
@@ -283,27 +302,26 @@ class AudioStatusBar(QWidget):
     # Public methods for external state updates
     def set_master_volume(self, volume: float, muted: bool = None):
         """Set master volume and optionally mute state."""
-        self._master_volume = max(0.0, min(1.0, volume))
-        if muted is not None:
-            self._master_muted = muted
-        self.update_icon_states()
+        self._set_channel("master", volume, muted)
 
     def set_click_volume(self, volume: float, muted: bool = None, enabled: bool = None):
         """Set click volume and optionally mute/enable state."""
-        self._click_volume = max(0.0, min(1.0, volume))
-        if muted is not None:
-            self._click_muted = muted
-        if enabled is not None:
-            self._click_enabled = enabled
-        self.update_icon_states()
+        self._set_channel("click", volume, muted, enabled)
 
     def set_strum_volume(self, volume: float, muted: bool = None, enabled: bool = None):
         """Set strum volume and optionally mute/enable state."""
-        self._strum_volume = max(0.0, min(1.0, volume))
+        self._set_channel("strum", volume, muted, enabled)
+
+    def _set_channel(
+        self, channel: str, volume: float, muted: bool = None, enabled: bool = None
+    ):
+        """Store a channel's volume and any given mute/enable state."""
+        state = self._state[channel]
+        state["volume"] = max(0.0, min(1.0, volume))
         if muted is not None:
-            self._strum_muted = muted
+            state["muted"] = muted
         if enabled is not None:
-            self._strum_enabled = enabled
+            state["enabled"] = enabled
         self.update_icon_states()
 
     def set_available_instruments(self, instruments: List[str]):
@@ -317,17 +335,10 @@ class AudioStatusBar(QWidget):
 
     def get_audio_states(self) -> dict:
         """Get current audio states for debugging."""
+        master = self._state["master"]
         return {
-            "master": {"volume": self._master_volume, "muted": self._master_muted},
-            "click": {
-                "volume": self._click_volume,
-                "muted": self._click_muted,
-                "enabled": self._click_enabled,
-            },
-            "strum": {
-                "volume": self._strum_volume,
-                "muted": self._strum_muted,
-                "enabled": self._strum_enabled,
-            },
+            "master": {"volume": master["volume"], "muted": master["muted"]},
+            "click": dict(self._state["click"]),
+            "strum": dict(self._state["strum"]),
             "instrument": self._instrument,
         }
@@ -1,51 +1,131 @@
 """Enhanced chord display widget with fretboard diagrams."""
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QPainter, QPen, QBrush, QColor
+from PySide6.QtCore import Qt, QPointF, QTimer, Slot
+from PySide6.QtGui import (
+    QFont,
+    QPainter,
+    QPen,
+    QBrush,
+    QColor,
+    QPixmap,
+    QPixmapCache,
+    QStaticText,
+    QTransform,
+)
 from typing import List
 
 from app.core.chord_library import get_chord_diagram, chord_difficulty_color
 
+# Progressions repeat the same handful of chords; diagrams are immutable.
+_cached_get_chord_diagram = lru_cache(maxsize=128)(get_chord_diagram)
+
 
 class ChordWidget(QWidget):
     """Widget displaying a single chord with name and fretboard diagram."""
 
+    # Paint resources shared by every frame
+    _BG_HL = QColor("#4CAF50")
+    _BG_NORMAL = QColor("#f0f0f0")
+    _BORDER_HL = QPen(QColor("#45a049"), 2)
+    _BORDER_NORMAL = QPen(QColor("#ddd"), 2)
+    _TEXT_HL = QPen(QColor("white"))
+    _TEXT_NORMAL = QPen(QColor("#333"))
+    _PEN_MISSING = QPen(QColor("#999"))
+    _PEN_STRING = QPen(QColor("#C0C0C0"), 1)
+    _PEN_FRET = QPen(QColor("#666"), 1)
+    _PEN_NUT = QPen(QColor("#666"), 2)
+    _PEN_MUTED = QPen(QColor("#e74c3c"), 2)
+    _PEN_OPEN = QPen(QColor("#27ae60"), 2)
+    _PEN_FINGER = QPen(QColor("#3498db"))
+    _BRUSH_FINGER = QBrush(QColor("#3498db"))
+    _NO_BRUSH = QBrush(Qt.BrushStyle.NoBrush)
+    _FONT_NAME = QFont("Arial", 14, QFont.Weight.Bold)
+    _FONT_MISSING = QFont("Arial", 9)
+
     def __init__(self, chord_name: str):
         super().__init__()
         self.chord_name = chord_name
-        self.chord_diagram = get_chord_diagram(chord_name)
+        self.chord_diagram = _cached_get_chord_diagram(chord_name)
+        self._name_static = self._make_name_text(chord_name)
         self.is_highlighted = False
+        # Mini fretboard line positions for the current size, built lazily
+        self._geom = None
         self.setMinimumSize(100, 140)
         self.setMaximumSize(140, 180)
 
+    @classmethod
+    def _make_name_text(cls, chord_name: str) -> QStaticText:
+        """Lay out the chord name once so painting skips text shaping."""
+        text = QStaticText(chord_name)
+        text.setTextFormat(Qt.TextFormat.PlainText)
+        text.prepare(QTransform(), cls._FONT_NAME)
+        return text
+
+    def resizeEvent(self, event):
+        """Drop fretboard geometry computed for the old size."""
+        self._geom = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
-        """Paint the chord widget with name and diagram."""
+        """Paint the chord widget from the application-wide pixmap cache."""
+        dpr = self.devicePixelRatioF()
+        key = (
+            f"chord:{self.chord_name}:{self.width()}x{self.height()}"
+            f":{int(self.is_highlighted)}@{dpr}"
+        )
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self._render_pixmap(dpr)
+            QPixmapCache.insert(key, pixmap)
+
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+
+    def _render_pixmap(self, dpr: float) -> QPixmap:
+        """Render the chord card into a transparent pixmap."""
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        self._paint_chord(painter)
+        painter.end()
+        return pixmap
+
+    def _paint_chord(self, painter: QPainter):
+        """Paint the chord card with name and diagram."""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Background
-        bg_color = QColor("#4CAF50") if self.is_highlighted else QColor("#f0f0f0")
-        border_color = QColor("#45a049") if self.is_highlighted else QColor("#ddd")
-        text_color = QColor("white") if self.is_highlighted else QColor("#333")
-
-        painter.setBrush(QBrush(bg_color))
-        painter.setPen(QPen(border_color, 2))
+        if self.is_highlighted:
+            painter.setBrush(self._BG_HL)
+            painter.setPen(self._BORDER_HL)
+        else:
+            painter.setBrush(self._BG_NORMAL)
+            painter.setPen(self._BORDER_NORMAL)
         painter.drawRoundedRect(2, 2, self.width() - 4, self.height() - 4, 8, 8)
 
         # Chord name
-        painter.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        painter.setPen(QPen(text_color))
-        name_rect = painter.boundingRect(
-            0, 5, self.width(), 25, Qt.AlignmentFlag.AlignCenter, self.chord_name
+        painter.setFont(self._FONT_NAME)
+        painter.setPen(self._TEXT_HL if self.is_highlighted else self._TEXT_NORMAL)
+        name_size = self._name_static.size()
+        painter.drawStaticText(
+            QPointF(
+                (self.width() - name_size.width()) / 2,
+                5 + (25 - name_size.height()) / 2,
+            ),
+            self._name_static,
         )
-        painter.drawText(name_rect, Qt.AlignmentFlag.AlignCenter, self.chord_name)
 
         # Difficulty indicator
         if self.chord_diagram:
             difficulty_color = chord_difficulty_color(self.chord_diagram.difficulty)
-            painter.setBrush(QBrush(QColor(difficulty_color)))
-            painter.setPen(QPen(QColor(difficulty_color)))
+            difficulty_color = QColor(difficulty_color)
+            painter.setBrush(difficulty_color)
+            painter.setPen(difficulty_color)
             dot_size = 8
             painter.drawEllipse(self.width() - 15, 8, dot_size, dot_size)
 
@@ -55,8 +135,8 @@ class ChordWidget(QWidget):
             )
         else:
             # No diagram available
-            painter.setPen(QPen(QColor("#999")))
-            painter.setFont(QFont("Arial", 9))
+            painter.setPen(self._PEN_MISSING)
+            painter.setFont(self._FONT_MISSING)
             painter.drawText(
                 10,
                 35,
@@ -76,43 +156,60 @@ class ChordWidget(QWidget):
         num_strings = 6
         num_frets = 4
 
-        string_spacing = width / (num_strings - 1)
-        fret_spacing = height / (num_frets + 1)
+        if self._geom is None:
+            string_spacing = width / (num_strings - 1)
+            fret_spacing = height / (num_frets + 1)
+            # Integer positions; with x >= 4 the +-3/4 offsets below land on the
+            # same pixels as truncating the float positions after offsetting
+            self._geom = (
+                tuple(int(x + i * string_spacing) for i in range(num_strings)),
+                tuple(int(y + i * fret_spacing) for i in range(num_frets + 1)),
+                # Finger dot tops for frets 1..num_frets
+                tuple(
+                    int(y + (fret - 0.5) * fret_spacing - 4)
+                    for fret in range(1, num_frets + 1)
+                ),
+            )
+        string_xs, fret_ys, finger_ys = self._geom
 
         # Draw strings (vertical lines)
-        painter.setPen(QPen(QColor("#C0C0C0"), 1))
-        for i in range(num_strings):
-            string_x = x + i * string_spacing
-            painter.drawLine(int(string_x), y, int(string_x), y + height)
+        painter.setPen(self._PEN_STRING)
+        for string_x in string_xs:
+            painter.drawLine(string_x, y, string_x, y + height)
 
         # Draw frets (horizontal lines)
-        painter.setPen(QPen(QColor("#666"), 1))
-        for i in range(num_frets + 1):
-            fret_y = y + i * fret_spacing
-            line_width = 2 if i == 0 else 1  # Thicker nut
-            painter.setPen(QPen(QColor("#666"), line_width))
-            painter.drawLine(x, int(fret_y), x + width, int(fret_y))
+        for i, fret_y in enumerate(fret_ys):
+            painter.setPen(self._PEN_NUT if i == 0 else self._PEN_FRET)  # Thicker nut
+            painter.drawLine(x, fret_y, x + width, fret_y)
 
         # Draw finger positions
-        for string_idx, fret in enumerate(self.chord_diagram.frets):
-            string_x = x + string_idx * string_spacing
-
+        for string_x, fret in zip(string_xs, self.chord_diagram.frets):
             if fret == -1:  # Muted string
-                painter.setPen(QPen(QColor("#e74c3c"), 2))
-                painter.drawLine(int(string_x - 3), y - 8, int(string_x + 3), y - 2)
-                painter.drawLine(int(string_x + 3), y - 8, int(string_x - 3), y - 2)
+                painter.setPen(self._PEN_MUTED)
+                painter.drawLine(string_x - 3, y - 8, string_x + 3, y - 2)
+                painter.drawLine(string_x + 3, y - 8, string_x - 3, y - 2)
             elif fret == 0:  # Open string
-                painter.setBrush(QBrush(Qt.BrushStyle.NoBrush))
-                painter.setPen(QPen(QColor("#27ae60"), 2))
-                painter.drawEllipse(int(string_x - 4), y - 9, 8, 8)
+                painter.setBrush(self._NO_BRUSH)
+                painter.setPen(self._PEN_OPEN)
+                painter.drawEllipse(string_x - 4, y - 9, 8, 8)
             elif 1 <= fret <= num_frets:  # Fretted note
-                fret_y = y + (fret - 0.5) * fret_spacing
-                painter.setBrush(QBrush(QColor("#3498db")))
-                painter.setPen(QPen(QColor("#3498db")))
-                painter.drawEllipse(int(string_x - 4), int(fret_y - 4), 8, 8)
+                painter.setBrush(self._BRUSH_FINGER)
+                painter.setPen(self._PEN_FINGER)
+                painter.drawEllipse(string_x - 4, finger_ys[fret - 1], 8, 8)
+
+    def set_chord_name(self, chord_name: str):
+        """Show a different chord, reusing this widget."""
+        if chord_name == self.chord_name:
+            return
+        self.chord_name = chord_name
+        self.chord_diagram = _cached_get_chord_diagram(chord_name)
+        self._name_static = self._make_name_text(chord_name)
+        self.update()
 
     def set_highlighted(self, highlighted: bool):
-        """Set highlight state and update display."""
+        """Set highlight state and update display if it changed."""
+        if highlighted == self.is_highlighted:
+            return
         self.is_highlighted = highlighted
         self.update()
 
@@ -125,6 +222,20 @@ class ChordDisplayWidget(QWidget):
         self.current_song = None
         self.current_section = None
         self.chord_labels = []
+        self._current_chords: List[str] = []
+        self._hl_idx = -1
+
+        # (song, section, chords) from the last chord-source resolution
+        self._chord_source = None
+
+        # Highlight requests arriving within one event-loop pass are
+        # collapsed; only the latest index is applied.
+        self._pending_idx = -1
+        self._highlight_timer = QTimer(self)
+        self._highlight_timer.setSingleShot(True)
+        self._highlight_timer.setInterval(0)
+        self._highlight_timer.timeout.connect(self._apply_pending_highlight)
+
         self.init_ui()
 
     def init_ui(self):
@@ -141,7 +252,7 @@ class ChordDisplayWidget(QWidget):
         self.no_chords_label = QLabel("Аккорды не загружены")
         self.no_chords_label.setFont(QFont("Arial", 14))
         self.no_chords_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.no_chords_label.setStyleSheet("color: #666; font-style: italic;")
+        self.no_chords_label.setObjectName("noChordsLabel")
         layout.addWidget(self.no_chords_label)
 
         layout.addStretch()
@@ -158,57 +269,111 @@ class ChordDisplayWidget(QWidget):
 
     def update_chord_display(self):
         """Update the chord display based on current song and section."""
-        # Clear existing chord labels
-        self.clear_chords()
-
         if not self.current_song:
+            self.clear_chords()
             self.show_no_chords("Песня не выбрана")
             return
 
-        # Get chords from current section or song
-        chords: List[str] = []
-        if self.current_section:
-            if hasattr(self.current_section, "chords"):
-                chords = self.current_section.chords
-            elif hasattr(self.current_section, "progression"):
-                chords = self.current_section.progression
-        elif getattr(self.current_song, "progression", []):
-            chords = self.current_song.progression
-        elif getattr(self.current_song, "all_chords", []):
-            chords = self.current_song.all_chords[:4]  # Show first 4 chords
-
+        chords = self._resolve_chords()
         if not chords:
+            self.clear_chords()
             self.show_no_chords("Аккорды не указаны")
             return
 
         # Hide no chords label
         self.no_chords_label.hide()
+        self._sync_chords(chords)
+
+    def _resolve_chords(self) -> List[str]:
+        """Return the chords to show, reusing the last lookup for the same inputs."""
+        song, section = self.current_song, self.current_section
+        cached = self._chord_source
+        if cached is not None and cached[0] is song and cached[1] is section:
+            return cached[2]
 
-        # Create chord widgets with diagrams
-        for i, chord in enumerate(chords):
+        # Get chords from current section or song
+        chords: List[str] = []
+        if section:
+            if hasattr(section, "chords"):
+                chords = section.chords
+            elif hasattr(section, "progression"):
+                chords = section.progression
+        elif getattr(song, "progression", []):
+            chords = song.progression
+        elif getattr(song, "all_chords", []):
+            chords = song.all_chords[:4]  # Show first 4 chords
+
+        self._chord_source = (song, section, chords)
+        return chords
+
+    def _sync_chords(self, chords: List[str]):
+        """Reuse existing chord widgets, creating or deleting only the delta."""
+        self.clear_highlight()
+        if chords == self._current_chords:
+            return
+
+        for widget, chord in zip(self.chord_labels, chords):
+            widget.set_chord_name(chord)
+
+        # Append just before the trailing stretch so no layout items shift
+        for chord in chords[len(self.chord_labels) :]:
             chord_widget = ChordWidget(chord)
             self.chord_labels.append(chord_widget)
-            self.chord_layout.insertWidget(len(self.chord_labels), chord_widget)
+            self.chord_layout.insertWidget(self.chord_layout.count() - 1, chord_widget)
 
-    def clear_chords(self):
-        """Clear all chord widgets."""
-        for widget in self.chord_labels:
+        self._remove_chord_widgets(len(chords))
+        self._current_chords = list(chords)
+
+    def _remove_chord_widgets(self, keep: int):
+        """Delete chord widgets past the first ``keep``."""
+        for widget in self.chord_labels[keep:]:
             widget.hide()
             self.chord_layout.removeWidget(widget)
             widget.deleteLater()
-        self.chord_labels.clear()
+        del self.chord_labels[keep:]
+
+    def clear_chords(self):
+        """Clear all chord widgets."""
+        self._remove_chord_widgets(0)
+        self._current_chords = []
+        self._highlight_timer.stop()
+        self._pending_idx = -1
+        self._hl_idx = -1
 
     def show_no_chords(self, message: str):
         """Show a message when no chords are available."""
         self.no_chords_label.setText(message)
         self.no_chords_label.show()
 
+    @Slot(int)
     def highlight_chord(self, chord_index: int):
         """Highlight a specific chord in the progression."""
-        for i, widget in enumerate(self.chord_labels):
-            widget.set_highlighted(i == chord_index)
+        self._pending_idx = chord_index
+        if chord_index == self._hl_idx and not self._highlight_timer.isActive():
+            return
+        self._highlight_timer.start()
+
+    @Slot()
+    def _apply_pending_highlight(self):
+        """Apply the most recently requested highlight."""
+        self._set_highlight(self._pending_idx)
+
+    def _set_highlight(self, chord_index: int):
+        """Move the highlight to ``chord_index`` immediately."""
+        if chord_index == self._hl_idx:
+            return
+        # Only the previously and newly highlighted widgets change
+        if 0 <= self._hl_idx < len(self.chord_labels):
+            self.chord_labels[self._hl_idx].set_highlighted(False)
+        if 0 <= chord_index < len(self.chord_labels):
+            self.chord_labels[chord_index].set_highlighted(True)
+        self._hl_idx = chord_index
 
     def clear_highlight(self):
         """Clear chord highlighting."""
-        for widget in self.chord_labels:
-            widget.set_highlighted(False)
+        self._highlight_timer.stop()
+        self._pending_idx = -1
+        self._set_highlight(-1)
+
+
+__all__ = ["ChordWidget", "ChordDisplayWidget"]
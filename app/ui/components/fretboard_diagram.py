@@ -2,26 +2,59 @@
 Fretboard diagram widget for displaying guitar chord fingerings.
 """
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont
-from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QPainter, QPainterPath, QPen, QBrush, QColor, QFont, QPixmap
+from PySide6.QtCore import Qt, QLine, QRect, QSize
 from typing import Optional
 
 from app.core.chord_library import ChordDiagram, get_chord_diagram, chord_difficulty_color
 
+# Chord diagrams are immutable; repeat lookups hit this cache
+_cached_get_chord_diagram = lru_cache(maxsize=256)(get_chord_diagram)
+
 
 class FretboardDiagramWidget(QWidget):
     """Widget for displaying guitar chord diagrams on a fretboard."""
     
+    # Paint resources shared by every frame
+    _FRETBOARD_COLOR = QColor("#8B4513")  # Brown
+    _FRETBOARD_PEN = QPen(_FRETBOARD_COLOR)
+    _STRING_PEN = QPen(QColor("#C0C0C0"), 2)  # Silver
+    _FRET_PEN_NUT = QPen(QColor("#2c3e50"), 3)
+    _FRET_PEN = QPen(QColor("#2c3e50"), 1)
+    _TEXT_PEN = QPen(QColor("#2c3e50"))
+    _PLACEHOLDER_PEN = QPen(QColor("#bdc3c7"))
+    _FINGER_BRUSH = QBrush(QColor("#3498db"))  # Blue
+    _FINGER_PEN = QPen(QColor("#3498db"))
+    _FINGER_TEXT_PEN = QPen(QColor("white"))
+    _BARRE_PEN = QPen(QColor("#3498db"), 4, Qt.PenStyle.SolidLine)
+    _OPEN_PEN = QPen(QColor("#27ae60"), 2)  # Green
+    _MUTE_PEN = QPen(QColor("#e74c3c"), 2)  # Red
+    _NO_BRUSH = QBrush(Qt.BrushStyle.NoBrush)
+    # Difficulty dot colors, snapshotted from chord_difficulty_color
+    _DIFFICULTY_QCOLOR = {
+        difficulty: QColor(chord_difficulty_color(difficulty))
+        for difficulty in ("beginner", "intermediate", "advanced")
+    }
+    _DEFAULT_DIFFICULTY_QCOLOR = QColor(chord_difficulty_color(""))
+    _PLACEHOLDER_FONT = QFont("Arial", 10)
+    _HEADER_FONT = QFont("Arial", 12, QFont.Weight.Bold)
+    _STRING_NAME_FONT = QFont("Arial", 8)
+    _FINGER_FONT = QFont("Arial", 8, QFont.Weight.Bold)
+    
     def __init__(self):
         super().__init__()
         self.chord_diagram: Optional[ChordDiagram] = None
+        # Fretboard, strings, frets and string names; rebuilt on resize
+        self._bg_pixmap: Optional[QPixmap] = None
         self.setMinimumSize(120, 160)
         self.setMaximumSize(200, 220)
         
     def set_chord(self, chord_name: str):
         """Set the chord to display."""
-        self.chord_diagram = get_chord_diagram(chord_name)
+        self.chord_diagram = _cached_get_chord_diagram(chord_name)
         self.update()
         
     def clear_chord(self):
@@ -29,27 +62,52 @@ class FretboardDiagramWidget(QWidget):
         self.chord_diagram = None
         self.update()
         
+    def resizeEvent(self, event):
+        """Drop the static background rendered for the old size."""
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+        
     def paintEvent(self, event):
         """Paint the fretboard diagram."""
         if not self.chord_diagram:
             self._paint_empty_state()
             return
             
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
         # Calculate layout
         margin = 20
         chord_area_height = 25
         diagram_width = self.width() - 2 * margin
         diagram_height = self.height() - 2 * margin - chord_area_height
+        fret_start_y = margin + chord_area_height
         
-        # Draw chord name and difficulty
-        self._paint_chord_header(painter, margin, chord_area_height)
+        if self._bg_pixmap is None:
+            self._bg_pixmap = self._render_static_background(
+                margin, fret_start_y, diagram_width, diagram_height
+            )
         
-        # Draw fretboard
-        fret_start_y = margin + chord_area_height
-        self._paint_fretboard(painter, margin, fret_start_y, diagram_width, diagram_height)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw chord name and difficulty unless only the fretboard is dirty
+        if event.region().intersects(QRect(0, 0, self.width(), chord_area_height)):
+            self._paint_chord_header(painter, margin, chord_area_height)
+        
+        # Draw chord-specific marks over the cached fretboard
+        self._paint_fretboard_dynamic(painter, margin, fret_start_y, diagram_width, diagram_height)
+        
+    def _render_static_background(self, x: int, y: int, width: int, height: int) -> QPixmap:
+        """Render the chord-independent fretboard into a widget-sized pixmap."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        # Only integer-aligned lines, rects and text: no antialiasing needed
+        painter = QPainter(pixmap)
+        self._paint_fretboard_static(painter, x, y, width, height)
+        painter.end()
+        return pixmap
         
     def _paint_empty_state(self):
         """Paint empty state when no chord is selected."""
@@ -57,167 +115,250 @@ class FretboardDiagramWidget(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw placeholder text
-        painter.setPen(QPen(QColor("#bdc3c7")))
-        painter.setFont(QFont("Arial", 10))
+        painter.setPen(self._PLACEHOLDER_PEN)
+        painter.setFont(self._PLACEHOLDER_FONT)
         rect = QRect(0, 0, self.width(), self.height())
         painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "Выберите\nаккорд")
         
     def _paint_chord_header(self, painter: QPainter, margin: int, header_height: int):
         """Paint chord name and difficulty indicator."""
         # Chord name
-        painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        painter.setPen(QPen(QColor("#2c3e50")))
+        painter.setFont(self._HEADER_FONT)
+        painter.setPen(self._TEXT_PEN)
         name_rect = QRect(margin, 0, self.width() - 2 * margin, header_height)
         painter.drawText(name_rect, Qt.AlignmentFlag.AlignCenter, self.chord_diagram.name)
         
         # Difficulty indicator (colored dot)
-        difficulty_color = chord_difficulty_color(self.chord_diagram.difficulty)
-        painter.setBrush(QBrush(QColor(difficulty_color)))
-        painter.setPen(QPen(QColor(difficulty_color)))
+        difficulty_color = self._DIFFICULTY_QCOLOR.get(
+            self.chord_diagram.difficulty, self._DEFAULT_DIFFICULTY_QCOLOR
+        )
+        painter.setBrush(difficulty_color)
+        painter.setPen(difficulty_color)
         dot_size = 8
         dot_x = self.width() - margin - dot_size
         dot_y = 5
         painter.drawEllipse(dot_x, dot_y, dot_size, dot_size)
         
-    def _paint_fretboard(self, painter: QPainter, x: int, y: int, width: int, height: int):
-        """Paint the fretboard diagram with finger positions."""
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _fretboard_geometry(x: int, y: int, width: int, height: int):
+        """Return integer string x positions, fret y positions and fret spacing."""
         num_frets = 4  # Show 4 frets
         num_strings = 6
         
         string_spacing = width / (num_strings - 1)
         fret_spacing = height / (num_frets + 1)  # +1 for nut
+        string_xs = tuple(int(x + i * string_spacing) for i in range(num_strings))
+        fret_ys = tuple(int(y + i * fret_spacing) for i in range(num_frets + 1))
+        return string_xs, fret_ys, fret_spacing
         
-        # Colors
-        fretboard_color = QColor("#8B4513")  # Brown
-        string_color = QColor("#C0C0C0")     # Silver
-        fret_color = QColor("#2c3e50")       # Dark
-        finger_color = QColor("#3498db")     # Blue
-        open_color = QColor("#27ae60")       # Green
-        mute_color = QColor("#e74c3c")       # Red
+    def _paint_fretboard_static(self, painter: QPainter, x: int, y: int, width: int, height: int):
+        """Paint the fretboard background, strings, frets and string names."""
+        string_xs, fret_ys, _ = self._fretboard_geometry(x, y, width, height)
         
         # Draw fretboard background
-        painter.setBrush(QBrush(fretboard_color))
-        painter.setPen(QPen(fretboard_color))
+        painter.setBrush(self._FRETBOARD_COLOR)
+        painter.setPen(self._FRETBOARD_PEN)
         painter.drawRect(x, y, width, height)
         
         # Draw strings (vertical lines)
-        painter.setPen(QPen(string_color, 2))
-        for i in range(num_strings):
-            string_x = x + i * string_spacing
-            painter.drawLine(int(string_x), y, int(string_x), y + height)
+        painter.setPen(self._STRING_PEN)
+        painter.drawLines([QLine(string_x, y, string_x, y + height) for string_x in string_xs])
         
         # Draw frets (horizontal lines)
-        painter.setPen(QPen(fret_color, 3))
+        painter.setPen(self._FRET_PEN_NUT)
         # Nut (thicker line)
         painter.drawLine(x, y, x + width, y)
         # Regular frets
-        painter.setPen(QPen(fret_color, 1))
-        for i in range(1, num_frets + 1):
-            fret_y = y + i * fret_spacing
-            painter.drawLine(x, int(fret_y), x + width, int(fret_y))
+        painter.setPen(self._FRET_PEN)
+        painter.drawLines([QLine(x, fret_y, x + width, fret_y) for fret_y in fret_ys[1:]])
+        
+        # Draw string names at bottom
+        painter.setFont(self._STRING_NAME_FONT)
+        painter.setPen(self._TEXT_PEN)
+        string_names = ["E", "A", "D", "G", "B", "E"]
+        for string_x, name in zip(string_xs, string_names):
+            text_rect = QRect(string_x - 10, y + height + 5, 20, 15)
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, name)
             
+    def _paint_fretboard_dynamic(self, painter: QPainter, x: int, y: int, width: int, height: int):
+        """Paint the barre, finger positions and open/mute symbols."""
+        string_xs, _, fret_spacing = self._fretboard_geometry(x, y, width, height)
+        
         # Draw barre if present
         if self.chord_diagram.barre:
-            self._paint_barre(painter, x, y, width, string_spacing, fret_spacing, self.chord_diagram.barre)
+            self._paint_barre(painter, x, y, width, fret_spacing, self.chord_diagram.barre)
         
-        # Draw finger positions
-        for string_idx, (fret, finger) in enumerate(zip(self.chord_diagram.frets, self.chord_diagram.fingers)):
-            string_x = x + string_idx * string_spacing
-            
+        # Group strings by mark so each pen/brush is set once
+        muted_xs = []
+        open_xs = []
+        fingers = []
+        for string_x, fret, finger in zip(string_xs, self.chord_diagram.frets, self.chord_diagram.fingers):
             if fret == -1:  # Muted string
-                self._paint_mute_symbol(painter, string_x, y - 15, mute_color)
+                muted_xs.append(string_x)
             elif fret == 0:  # Open string
-                self._paint_open_symbol(painter, string_x, y - 15, open_color)
+                open_xs.append(string_x)
             else:  # Fretted note
-                fret_y = y + (fret - 0.5) * fret_spacing
-                self._paint_finger_position(painter, string_x, fret_y, finger, finger_color)
-        
-        # Draw string names at bottom
-        painter.setFont(QFont("Arial", 8))
-        painter.setPen(QPen(QColor("#2c3e50")))
-        string_names = ["E", "A", "D", "G", "B", "E"]
-        for i, name in enumerate(string_names):
-            string_x = x + i * string_spacing
-            text_rect = QRect(int(string_x - 10), y + height + 5, 20, 15)
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, name)
+                fingers.append((string_x, y + (fret - 0.5) * fret_spacing, finger))
+                
+        if muted_xs:
+            self._paint_mute_symbols(painter, muted_xs, y - 15)
+        if open_xs:
+            self._paint_open_symbols(painter, open_xs, y - 15)
+        for string_x, fret_y, finger in fingers:
+            self._paint_finger_position(painter, string_x, fret_y, finger)
             
-    def _paint_barre(self, painter: QPainter, x: int, y: int, width: int, 
-                     string_spacing: float, fret_spacing: float, barre_fret: int):
+    def _paint_barre(self, painter: QPainter, x: int, y: int, width: int,
+                     fret_spacing: float, barre_fret: int):
         """Paint barre line across strings."""
-        painter.setPen(QPen(QColor("#3498db"), 4, Qt.PenStyle.SolidLine))
+        painter.setPen(self._BARRE_PEN)
         barre_y = y + (barre_fret - 0.5) * fret_spacing
         painter.drawLine(x, int(barre_y), x + width, int(barre_y))
         
-    def _paint_finger_position(self, painter: QPainter, x: float, y: float, 
-                              finger: int, color: QColor):
+    def _paint_finger_position(self, painter: QPainter, x: float, y: float, finger: int):
         """Paint a finger position dot."""
         if finger == 0:  # No finger
             return
             
         dot_size = 12
-        painter.setBrush(QBrush(color))
-        painter.setPen(QPen(color))
-        painter.drawEllipse(int(x - dot_size/2), int(y - dot_size/2), dot_size, dot_size)
+        pixmap = self._finger_pixmap(finger, dot_size, self.devicePixelRatioF())
+        # The pixmap has a one pixel margin for the antialiased outline
+        painter.drawPixmap(int(x - dot_size/2) - 1, int(y - dot_size/2) - 1, pixmap)
+        
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _finger_pixmap(finger: int, dot_size: int, dpr: float) -> QPixmap:
+        """Render a finger dot, numbered for positive fingers, once per size."""
+        pixmap = QPixmap(int((dot_size + 2) * dpr), int((dot_size + 2) * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(1, 1)
+        painter.setBrush(FretboardDiagramWidget._FINGER_BRUSH)
+        painter.setPen(FretboardDiagramWidget._FINGER_PEN)
+        painter.drawEllipse(0, 0, dot_size, dot_size)
         
         # Draw finger number
         if finger > 0:
-            painter.setFont(QFont("Arial", 8, QFont.Weight.Bold))
-            painter.setPen(QPen(QColor("white")))
-            text_rect = QRect(int(x - dot_size/2), int(y - dot_size/2), dot_size, dot_size)
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, str(finger))
+            painter.setFont(FretboardDiagramWidget._FINGER_FONT)
+            painter.setPen(FretboardDiagramWidget._FINGER_TEXT_PEN)
+            painter.drawText(QRect(0, 0, dot_size, dot_size), Qt.AlignmentFlag.AlignCenter, str(finger))
+        painter.end()
+        return pixmap
             
-    def _paint_open_symbol(self, painter: QPainter, x: float, y: float, color: QColor):
-        """Paint open string symbol (circle)."""
-        symbol_size = 10
-        painter.setBrush(QBrush(Qt.BrushStyle.NoBrush))
-        painter.setPen(QPen(color, 2))
-        painter.drawEllipse(int(x - symbol_size/2), int(y - symbol_size/2), symbol_size, symbol_size)
-        
-    def _paint_mute_symbol(self, painter: QPainter, x: float, y: float, color: QColor):
-        """Paint muted string symbol (X)."""
-        symbol_size = 8
-        painter.setPen(QPen(color, 2))
-        # Draw X
-        painter.drawLine(int(x - symbol_size/2), int(y - symbol_size/2),
-                        int(x + symbol_size/2), int(y + symbol_size/2))
-        painter.drawLine(int(x + symbol_size/2), int(y - symbol_size/2),
-                        int(x - symbol_size/2), int(y + symbol_size/2))
+    def _paint_open_symbols(self, painter: QPainter, xs: list, y: int):
+        """Paint open string symbols (circles) above the given strings."""
+        half = 5
+        painter.setBrush(self._NO_BRUSH)
+        painter.setPen(self._OPEN_PEN)
+        for x in xs:
+            painter.drawEllipse(x - half, y - half, 2 * half, 2 * half)
+        
+    def _paint_mute_symbols(self, painter: QPainter, xs: list, y: int):
+        """Paint muted string symbols (X) above the given strings."""
+        half = 4
+        painter.setPen(self._MUTE_PEN)
+        # Both strokes of every X in one call
+        lines = []
+        for x in xs:
+            lines.append(QLine(x - half, y - half, x + half, y + half))
+            lines.append(QLine(x + half, y - half, x - half, y + half))
+        painter.drawLines(lines)
 
 
 class ChordDisplayWidget(QWidget):
     """Widget that displays multiple chords with fretboard diagrams."""
     
+    # Paint resources shared by every frame
+    _PLACEHOLDER_PEN = QPen(QColor("#bdc3c7"))
+    _PLACEHOLDER_FONT = QFont("Arial", 12)
+    _HIGHLIGHT_BRUSH = QBrush(QColor(100, 200, 100, 50))
+    _HIGHLIGHT_PEN = QPen(QColor(100, 200, 100))
+    _NAME_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+    _NAME_PEN = QPen(QColor("#2c3e50"))
+    _STRING_PEN = QPen(QColor("#C0C0C0"), 1)
+    _FRET_PEN = QPen(QColor("#2c3e50"), 1)
+    _MUTE_PEN = QPen(QColor("#e74c3c"), 1)
+    _OPEN_PEN = QPen(QColor("#27ae60"), 1)
+    _FINGER_BRUSH = QBrush(QColor("#3498db"))
+    _FINGER_PEN = QPen(QColor("#3498db"))
+    _NO_BRUSH = QBrush(Qt.BrushStyle.NoBrush)
+    
     def __init__(self):
         super().__init__()
         self.chord_progression = []
         self.current_chord_index = 0
+        # Mini-diagram string/fret grid, shared by every cell of one size
+        self._grid_pixmap: Optional[QPixmap] = None
+        # Per-chord (x, chord_name, diagram) plus the shared cell size;
+        # rebuilt on progression change and resize
+        self._cells: list = []
+        self._cell_width = 0
+        self._cell_height = 0
         self.setMinimumHeight(160)
         
     def set_progression(self, chords: list):
         """Set the chord progression to display."""
         self.chord_progression = chords
         self.current_chord_index = 0
+        self._rebuild_cells()
         self.update()
         
     def set_current_chord(self, index: int):
         """Set the current chord index."""
         if 0 <= index < len(self.chord_progression):
-            self.current_chord_index = index
-            self.update()
+            self._move_current_chord(index)
             
     def advance_chord(self):
         """Advance to the next chord in progression."""
         if self.chord_progression:
-            self.current_chord_index = (self.current_chord_index + 1) % len(self.chord_progression)
-            self.update()
+            self._move_current_chord((self.current_chord_index + 1) % len(self.chord_progression))
             
+    def _move_current_chord(self, index: int):
+        """Change the current chord, repainting only the two affected cells."""
+        previous = self.current_chord_index
+        self.current_chord_index = index
+        self.update(self._cell_rect(previous))
+        self.update(self._cell_rect(index))
+        
+    def _rebuild_cells(self):
+        """Lay out the chord cells and resolve their diagrams for the current size."""
+        self._cells = []
+        num_chords = len(self.chord_progression)
+        if not num_chords:
+            return
+            
+        # Calculate layout for diagrams
+        diagram_width = min(120, (self.width() - 40) // num_chords)
+        total_width = num_chords * diagram_width
+        start_x = (self.width() - total_width) // 2
+        self._cell_width = diagram_width
+        self._cell_height = self.height() - 20
+        
+        for i, chord_name in enumerate(self.chord_progression):
+            x = start_x + i * diagram_width
+            self._cells.append((x, chord_name, _cached_get_chord_diagram(chord_name)))
+        
+    def _cell_rect(self, index: int) -> QRect:
+        """Return the area painted for one chord, highlight frame included."""
+        x = self._cells[index][0]
+        return QRect(x - 6, 0, self._cell_width + 8, self.height())
+            
+    def resizeEvent(self, event):
+        """Re-lay out the cells and drop the grid rendered for the old size."""
+        self._grid_pixmap = None
+        self._rebuild_cells()
+        super().resizeEvent(event)
+        
     def paintEvent(self, event):
         """Paint the chord progression with diagrams."""
         if not self.chord_progression:
             painter = QPainter(self)
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            painter.setPen(QPen(QColor("#bdc3c7")))
-            painter.setFont(QFont("Arial", 12))
+            painter.setPen(self._PLACEHOLDER_PEN)
+            painter.setFont(self._PLACEHOLDER_FONT)
             rect = QRect(0, 0, self.width(), self.height())
             painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "Нет прогрессии")
             return
@@ -225,69 +366,112 @@ class ChordDisplayWidget(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Calculate layout for diagrams
-        num_chords = len(self.chord_progression)
-        diagram_width = min(120, (self.width() - 40) // num_chords)
-        diagram_height = self.height() - 20
-        total_width = num_chords * diagram_width
-        start_x = (self.width() - total_width) // 2
+        diagram_width = self._cell_width
+        diagram_height = self._cell_height
+        dirty = event.region()
         
-        # Draw each chord diagram
-        for i, chord_name in enumerate(self.chord_progression):
-            x = start_x + i * diagram_width
+        # Draw each chord diagram whose cell needs repainting
+        for i, (x, chord_name, chord_diagram) in enumerate(self._cells):
+            if not dirty.intersects(self._cell_rect(i)):
+                continue
             
             # Highlight current chord
             if i == self.current_chord_index:
-                painter.setBrush(QBrush(QColor(100, 200, 100, 50)))
-                painter.setPen(QPen(QColor(100, 200, 100)))
+                painter.setBrush(self._HIGHLIGHT_BRUSH)
+                painter.setPen(self._HIGHLIGHT_PEN)
                 painter.drawRoundedRect(x - 5, 5, diagram_width, diagram_height - 10, 8, 8)
             
             # Draw chord name
-            painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-            painter.setPen(QPen(QColor("#2c3e50")))
+            painter.setFont(self._NAME_FONT)
+            painter.setPen(self._NAME_PEN)
             name_rect = QRect(x, 10, diagram_width, 20)
             painter.drawText(name_rect, Qt.AlignmentFlag.AlignCenter, chord_name)
             
-            # Get chord diagram and draw simplified version
-            chord_diagram = get_chord_diagram(chord_name)
+            # Draw simplified diagram
             if chord_diagram:
                 self._draw_mini_diagram(painter, x + 10, 35, diagram_width - 20, 90, chord_diagram)
                 
     def _draw_mini_diagram(self, painter: QPainter, x: int, y: int, width: int, height: int, 
                           chord: ChordDiagram):
         """Draw a simplified mini fretboard diagram."""
+        # Strings and frets come from the cached grid
+        grid = self._grid_pixmap
+        if grid is None or grid.deviceIndependentSize().toSize() != QSize(width + 2, height + 2):
+            grid = self._grid_pixmap = self._render_mini_grid(width, height)
+        painter.drawPixmap(x - 1, y - 1, grid)
+            
+        # Draw finger positions (simplified) from cached paths
+        muted, open_strings, fretted = self._mini_mark_paths(tuple(chord.frets), width, height)
+        painter.translate(x, y)
+        painter.setBrush(self._NO_BRUSH)
+        painter.setPen(self._MUTE_PEN)
+        painter.drawPath(muted)
+        painter.setPen(self._OPEN_PEN)
+        painter.drawPath(open_strings)
+        painter.setBrush(self._FINGER_BRUSH)
+        painter.setPen(self._FINGER_PEN)
+        painter.drawPath(fretted)
+        painter.translate(-x, -y)
+        
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _mini_mark_paths(frets: tuple, width: int, height: int):
+        """Return (muted, open, fretted) mark paths for one fingering at one size."""
         num_strings = 6
         num_frets = 3
         
         string_spacing = width / (num_strings - 1)
         fret_spacing = height / (num_frets + 1)
         
-        # Draw strings
-        painter.setPen(QPen(QColor("#C0C0C0"), 1))
-        for i in range(num_strings):
-            string_x = x + i * string_spacing
-            painter.drawLine(int(string_x), y, int(string_x), y + height)
-            
-        # Draw frets
-        painter.setPen(QPen(QColor("#2c3e50"), 1))
-        for i in range(num_frets + 1):
-            fret_y = y + i * fret_spacing
-            painter.drawLine(x, int(fret_y), x + width, int(fret_y))
-            
-        # Draw finger positions (simplified)
-        for string_idx, fret in enumerate(chord.frets):
-            string_x = x + string_idx * string_spacing
+        muted = QPainterPath()
+        open_strings = QPainterPath()
+        fretted = QPainterPath()
+        for string_idx, fret in enumerate(frets):
+            string_x = string_idx * string_spacing
             
             if fret == -1:  # Muted
-                painter.setPen(QPen(QColor("#e74c3c"), 1))
-                painter.drawLine(int(string_x - 3), y - 8, int(string_x + 3), y - 2)
-                painter.drawLine(int(string_x + 3), y - 8, int(string_x - 3), y - 2)
+                muted.moveTo(int(string_x - 3), -8)
+                muted.lineTo(int(string_x + 3), -2)
+                muted.moveTo(int(string_x + 3), -8)
+                muted.lineTo(int(string_x - 3), -2)
             elif fret == 0:  # Open
-                painter.setBrush(QBrush(Qt.BrushStyle.NoBrush))
-                painter.setPen(QPen(QColor("#27ae60"), 1))
-                painter.drawEllipse(int(string_x - 3), y - 8, 6, 6)
+                open_strings.addEllipse(int(string_x - 3), -8, 6, 6)
             elif 1 <= fret <= num_frets:  # Fretted
-                fret_y = y + (fret - 0.5) * fret_spacing
-                painter.setBrush(QBrush(QColor("#3498db")))
-                painter.setPen(QPen(QColor("#3498db")))
-                painter.drawEllipse(int(string_x - 3), int(fret_y - 3), 6, 6)
\ No newline at end of file
+                fret_y = (fret - 0.5) * fret_spacing
+                fretted.addEllipse(int(string_x - 3), int(fret_y - 3), 6, 6)
+        return muted, open_strings, fretted
+                
+    def _render_mini_grid(self, width: int, height: int) -> QPixmap:
+        """Render the mini-diagram strings and frets into a pixmap."""
+        num_strings = 6
+        num_frets = 3
+        
+        string_spacing = width / (num_strings - 1)
+        fret_spacing = height / (num_frets + 1)
+        
+        # One pixel of padding on every side keeps the edge lines intact
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int((width + 2) * dpr), int((height + 2) * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        # Integer-aligned 1px lines gain nothing from antialiasing
+        painter = QPainter(pixmap)
+        painter.translate(1, 1)
+        
+        # Draw strings
+        painter.setPen(self._STRING_PEN)
+        painter.drawLines([
+            QLine(int(i * string_spacing), 0, int(i * string_spacing), height)
+            for i in range(num_strings)
+        ])
+            
+        # Draw frets
+        painter.setPen(self._FRET_PEN)
+        painter.drawLines([
+            QLine(0, int(i * fret_spacing), width, int(i * fret_spacing))
+            for i in range(num_frets + 1)
+        ])
+        
+        painter.end()
+        return pixmap
\ No newline at end of file
@@ -2,12 +2,77 @@
 Practice coach widget that provides contextual hints and guidance for guitar learning.
 """
 
+from functools import lru_cache
+from itertools import pairwise
+from types import MappingProxyType
+
+import numpy as np
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QFont, QIcon
-from typing import Dict, List, Optional
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QFont, QTextDocument
+from typing import Dict, List, Optional, Tuple, Union
+
+from app.core.chord_library import get_chord_diagram
+
+# Chord diagrams are immutable; repeat lookups hit this cache
+_cached_get_chord_diagram = lru_cache(maxsize=256)(get_chord_diagram)
+
+_WELCOME_HTML = """
+        <b>Добро пожаловать в режим изучения песен! 🎸</b><br><br>
+        Выберите песню из списка выше, и я помогу вам освоить её пошагово.<br>
+        Начинайте медленно и постепенно увеличивайте темп.
+        """
+
+# Hint templates, filled with str.format_map
+_CHORD_DIFFICULTY_HTML = """
+        <b>Внимание: сложные аккорды!</b><br><br>
+        В песне "{title}" есть сложные аккорды: <b>{chords}</b><br><br>
+        <b>Совет:</b> Сначала потренируйтесь переходить между этими аккордами медленно,
+        без ритма. Только когда пальцы запомнят позиции, добавляйте бой.
+        """
+
+# Complex chords named in the difficulty hint before the scan stops
+_MAX_COMPLEX_CHORDS = 3
+
+_TEMPO_HTML = """
+        <b>Быстрый темп: {bpm} BPM</b><br><br>
+        Это довольно быстрая песня. Рекомендую:<br>
+        • Начать с темпа {start_bpm} BPM<br>
+        • Постепенно увеличивать на 5-10 BPM<br>
+        • Следить за чистотой смен аккордов<br>
+        """
+
+_SONG_OVERVIEW_HTML = """
+        <b>Песня: {title}</b> {emoji}<br>
+        <b>Исполнитель:</b> {artist}<br>
+        <b>Темп:</b> {bpm} BPM<br><br>
+        
+        <b>Подготовка:</b><br>
+        1. Проверьте аппликатуры всех аккордов<br>
+        2. Потренируйте переходы между аккордами<br>
+        3. Послушайте оригинал для понимания ритма<br>
+        """
+
+_TRANSITION_HEADER_HTML = """
+        <b>Переход {from_chord} → {to_chord}</b><br><br>
+        """
+_TRANSITION_KEEP_HTML = "✅ Не двигайте пальцы на струнах: {strings}<br>"
+_TRANSITION_MOVE_HTML = "👆 Переставьте пальцы на струнах: {strings}<br>"
+_TRANSITION_TIP_HTML = "<br><b>Совет:</b> Сначала уберите ненужные пальцы, затем поставьте новые."
+
+_RHYTHM_HTML = """
+            <b>Работа над ритмом</b><br><br>
+            Средняя погрешность: {accuracy:.1f} мс<br><br>
+            <b>Советы:</b><br>
+            • Сконцентрируйтесь на метрономе<br>
+            • Играйте медленнее, но точнее<br>
+            • Считайте вслух: "раз-и-два-и-три-и-четыре-и"<br>
+            """
 
-from app.core.chord_library import get_chord_diagram, BASIC_CHORDS
+_DIFFICULTY_EMOJI = MappingProxyType(
+    {"beginner": "🟢", "intermediate": "🟡", "advanced": "🔴"}
+)
 
 
 class PracticeCoach(QWidget):
@@ -15,11 +80,31 @@ class PracticeCoach(QWidget):
     
     hint_requested = Signal(str)  # Signal when user wants more details
     
+    _HINT_QSS = """
+            QTextEdit {
+                background-color: #f8f9fa;
+                border: 2px solid #e9ecef;
+                border-radius: 8px;
+                padding: 10px;
+                font-size: 11px;
+                color: #495057;
+            }
+        """
+    
+    # Hint types whose text depends only on the hint itself; their parsed
+    # documents are kept and swapped in instead of re-parsing the HTML
+    _STATIC_HINTS = frozenset({"welcome", "level_change", "rhythm_good"})
+    
     def __init__(self):
         super().__init__()
         self.current_hints = []
         self.hint_history = []
         self.coaching_mode = "beginner"  # beginner, intermediate, advanced
+        self.section_tips = []
+        # (hint_type, message) -> parsed document for static hints
+        self._static_docs: Dict[Tuple[str, str], QTextDocument] = {}
+        # (from_chord, to_chord) -> (strings to keep, strings to move)
+        self._transition_cache: Dict[Tuple[str, str], Optional[Tuple[List[int], List[int]]]] = {}
         
         self.init_ui()
         
@@ -54,16 +139,13 @@ class PracticeCoach(QWidget):
         self.hint_display = QTextEdit()
         self.hint_display.setMaximumHeight(120)
         self.hint_display.setReadOnly(True)
-        self.hint_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 2px solid #e9ecef;
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 11px;
-                color: #495057;
-            }
-        """)
+        self.hint_display.setStyleSheet(self._HINT_QSS)
+        # Document for changing hints; owned here so swapping in a cached
+        # static document never deletes it
+        self.hint_display.ensurePolished()
+        self._hint_doc = QTextDocument(self)
+        self._hint_doc.setDefaultFont(self.hint_display.font())
+        self.hint_display.setDocument(self._hint_doc)
         layout.addWidget(self.hint_display)
         
         # Action buttons
@@ -88,12 +170,7 @@ class PracticeCoach(QWidget):
         
     def show_welcome_message(self):
         """Show initial welcome and setup message."""
-        welcome_msg = """
-        <b>Добро пожаловать в режим изучения песен! 🎸</b><br><br>
-        Выберите песню из списка выше, и я помогу вам освоить её пошагово.<br>
-        Начинайте медленно и постепенно увеличивайте темп.
-        """
-        self.hint_display.setHtml(welcome_msg)
+        self._set_hint_html(_WELCOME_HTML, "welcome")
         
     def cycle_coaching_level(self):
         """Cycle through coaching levels."""
@@ -120,19 +197,18 @@ class PracticeCoach(QWidget):
         if not song:
             return
             
-        # Analyze chord complexity
+        # Complex chords only matter in beginner mode; stop once the hint is full
         complex_chords = []
-        beginner_chords = []
-        
-        chords = getattr(song, 'all_chords', song.progression if hasattr(song, 'progression') else [])
         
-        for chord_name in chords:
-            chord_diagram = get_chord_diagram(chord_name)
-            if chord_diagram:
-                if chord_diagram.difficulty == "advanced":
+        if self.coaching_mode == "beginner":
+            chords = getattr(song, 'all_chords', song.progression if hasattr(song, 'progression') else [])
+            
+            for chord_name in chords:
+                chord_diagram = _cached_get_chord_diagram(chord_name)
+                if chord_diagram and chord_diagram.difficulty == "advanced":
                     complex_chords.append(chord_name)
-                elif chord_diagram.difficulty == "beginner":
-                    beginner_chords.append(chord_name)
+                    if len(complex_chords) >= _MAX_COMPLEX_CHORDS:
+                        break
         
         # Generate coaching based on analysis
         if complex_chords and self.coaching_mode == "beginner":
@@ -144,95 +220,88 @@ class PracticeCoach(QWidget):
             
     def show_chord_difficulty_hint(self, complex_chords: List[str], song):
         """Show hint about complex chords in the song."""
-        chord_list = ", ".join(complex_chords)
-        hint = f"""
-        <b>Внимание: сложные аккорды!</b><br><br>
-        В песне "{song.title}" есть сложные аккорды: <b>{chord_list}</b><br><br>
-        <b>Совет:</b> Сначала потренируйтесь переходить между этими аккордами медленно,
-        без ритма. Только когда пальцы запомнят позиции, добавляйте бой.
-        """
+        hint = _CHORD_DIFFICULTY_HTML.format_map(
+            {"title": song.title, "chords": ", ".join(complex_chords)}
+        )
         
         self.show_hint("chord_difficulty", hint)
         self.add_chord_practice_tips(complex_chords)
         
     def show_tempo_hint(self, bpm: int):
         """Show hint about song tempo."""
-        hint = f"""
-        <b>Быстрый темп: {bpm} BPM</b><br><br>
-        Это довольно быстрая песня. Рекомендую:<br>
-        • Начать с темпа {max(60, bpm // 2)} BPM<br>
-        • Постепенно увеличивать на 5-10 BPM<br>
-        • Следить за чистотой смен аккордов<br>
-        """
+        hint = _TEMPO_HTML.format_map({"bpm": bpm, "start_bpm": max(60, bpm // 2)})
         
         self.show_hint("tempo_warning", hint)
         
     def show_song_overview_hint(self, song):
         """Show general overview and tips for the song."""
-        difficulty_emoji = {"beginner": "🟢", "intermediate": "🟡", "advanced": "🔴"}
         difficulty = getattr(song, 'difficulty', 'beginner')
         
-        hint = f"""
-        <b>Песня: {song.title}</b> {difficulty_emoji.get(difficulty, '⚪')}<br>
-        <b>Исполнитель:</b> {song.artist}<br>
-        <b>Темп:</b> {song.bpm} BPM<br><br>
-        
-        <b>Подготовка:</b><br>
-        1. Проверьте аппликатуры всех аккордов<br>
-        2. Потренируйте переходы между аккордами<br>
-        3. Послушайте оригинал для понимания ритма<br>
-        """
+        hint = _SONG_OVERVIEW_HTML.format_map({
+            "title": song.title,
+            "emoji": _DIFFICULTY_EMOJI.get(difficulty, '⚪'),
+            "artist": song.artist,
+            "bpm": song.bpm,
+        })
         
         self.show_hint("song_overview", hint)
         
     def show_chord_transition_hint(self, from_chord: str, to_chord: str):
         """Show specific hint for chord transitions."""
-        from_diagram = get_chord_diagram(from_chord)
-        to_diagram = get_chord_diagram(to_chord)
-        
-        if not from_diagram or not to_diagram:
+        analysis = self._analyze_transition(from_chord, to_chord)
+        if analysis is None:
             return
-            
-        # Analyze finger movements
-        common_fingers = []
-        moving_fingers = []
-        
-        for i, (from_fret, to_fret) in enumerate(zip(from_diagram.frets, to_diagram.frets)):
-            if from_fret == to_fret and from_fret > 0:
-                common_fingers.append(i + 1)  # String numbers 1-6
-            elif from_fret != to_fret:
-                moving_fingers.append(i + 1)
+        common_fingers, moving_fingers = analysis
                 
-        hint = f"""
-        <b>Переход {from_chord} → {to_chord}</b><br><br>
-        """
+        parts = [_TRANSITION_HEADER_HTML.format_map({"from_chord": from_chord, "to_chord": to_chord})]
         
         if common_fingers:
-            hint += f"✅ Не двигайте пальцы на струнах: {', '.join(map(str, common_fingers))}<br>"
+            parts.append(_TRANSITION_KEEP_HTML.format_map({"strings": ", ".join(map(str, common_fingers))}))
         
         if moving_fingers:
-            hint += f"👆 Переставьте пальцы на струнах: {', '.join(map(str, moving_fingers))}<br>"
+            parts.append(_TRANSITION_MOVE_HTML.format_map({"strings": ", ".join(map(str, moving_fingers))}))
             
-        hint += "<br><b>Совет:</b> Сначала уберите ненужные пальцы, затем поставьте новые."
+        parts.append(_TRANSITION_TIP_HTML)
+        hint = "".join(parts)
         
         self.show_hint("chord_transition", hint)
         
-    def show_rhythm_coaching(self, pattern_name: str, step_accuracy: List[float]):
+    def _analyze_transition(self, from_chord: str, to_chord: str) -> Optional[Tuple[List[int], List[int]]]:
+        """Return strings whose fingers stay and move, or None if a diagram is missing."""
+        key = (from_chord, to_chord)
+        if key in self._transition_cache:
+            return self._transition_cache[key]
+            
+        from_diagram = _cached_get_chord_diagram(from_chord)
+        to_diagram = _cached_get_chord_diagram(to_chord)
+        
+        analysis = None
+        if from_diagram and to_diagram:
+            # Analyze finger movements
+            common_fingers = []
+            moving_fingers = []
+            
+            for i, (from_fret, to_fret) in enumerate(zip(from_diagram.frets, to_diagram.frets)):
+                if from_fret == to_fret and from_fret > 0:
+                    common_fingers.append(i + 1)  # String numbers 1-6
+                elif from_fret != to_fret:
+                    moving_fingers.append(i + 1)
+            analysis = (common_fingers, moving_fingers)
+            
+        self._transition_cache[key] = analysis
+        return analysis
+        
+    def show_rhythm_coaching(self, pattern_name: str, step_accuracy: Union[np.ndarray, List[float]]):
         """Provide coaching based on rhythm accuracy."""
-        if not step_accuracy:
+        # Arrays from the timing analysis are used as-is; lists convert once
+        deviations = np.asarray(step_accuracy, dtype=np.float64)
+        if deviations.size == 0:
             return
             
-        avg_accuracy = sum(abs(x) for x in step_accuracy) / len(step_accuracy)
+        avg_accuracy = float(np.abs(deviations).mean())
         
         if avg_accuracy > 50:  # More than 50ms off on average
-            hint = f"""
-            <b>Работа над ритмом</b><br><br>
-            Средняя погрешность: {avg_accuracy:.1f} мс<br><br>
-            <b>Советы:</b><br>
-            • Сконцентрируйтесь на метрономе<br>
-            • Играйте медленнее, но точнее<br>
-            • Считайте вслух: "раз-и-два-и-три-и-четыре-и"<br>
-            """
+            hint = _RHYTHM_HTML.format_map({"accuracy": avg_accuracy})
             
             self.show_hint("rhythm_accuracy", hint)
         elif avg_accuracy < 20:  # Very good timing
@@ -241,7 +310,7 @@ class PracticeCoach(QWidget):
     def show_hint(self, hint_type: str, message: str):
         """Show a coaching hint."""
         self.current_hints = [{"type": hint_type, "message": message}]
-        self.hint_display.setHtml(message)
+        self._set_hint_html(message, hint_type)
         
         self.next_tip_btn.setEnabled(False)
         self.details_btn.setEnabled(True)
@@ -249,12 +318,29 @@ class PracticeCoach(QWidget):
         # Add to history
         self.hint_history.append({"type": hint_type, "message": message})
         
+    def _set_hint_html(self, html: str, hint_type: str):
+        """Display hint HTML, reusing the parsed document for static hints."""
+        if hint_type not in self._STATIC_HINTS:
+            if self.hint_display.document() is not self._hint_doc:
+                self.hint_display.setDocument(self._hint_doc)
+            self.hint_display.setHtml(html)
+            return
+            
+        key = (hint_type, html)
+        doc = self._static_docs.get(key)
+        if doc is None:
+            doc = QTextDocument(self)
+            doc.setDefaultFont(self.hint_display.font())
+            doc.setHtml(html)
+            self._static_docs[key] = doc
+        self.hint_display.setDocument(doc)
+        
     def add_chord_practice_tips(self, chords: List[str]):
         """Add specific practice tips for difficult chords."""
         tips = []
         
         for chord in chords:
-            chord_diagram = get_chord_diagram(chord)
+            chord_diagram = _cached_get_chord_diagram(chord)
             if not chord_diagram:
                 continue
                 
@@ -279,7 +365,7 @@ class PracticeCoach(QWidget):
         if len(self.current_hints) > 1:
             self.current_hints.pop(0)
             current_tip = self.current_hints[0]
-            self.hint_display.setHtml(current_tip["message"])
+            self._set_hint_html(current_tip["message"], current_tip["type"])
             
             if len(self.current_hints) <= 1:
                 self.next_tip_btn.setEnabled(False)
@@ -307,11 +393,11 @@ class PracticeCoach(QWidget):
             
     def prepare_section_coaching(self, section):
         """Prepare coaching tips specific to a song section."""
-        if len(section.chords) >= 2:
+        chords = section.chords
+        if len(chords) >= 2:
             # Prepare transition tips for consecutive chords
-            for i in range(len(section.chords) - 1):
-                from_chord = section.chords[i]
-                to_chord = section.chords[i + 1]
+            for from_chord, to_chord in pairwise(chords):
+                self._analyze_transition(from_chord, to_chord)
                 
                 # Add transition tip to queue
                 tip = {
@@ -319,6 +405,4 @@ class PracticeCoach(QWidget):
                     "message": f"Подготовьте переход {from_chord} → {to_chord} в этой секции"
                 }
                 
-                if not hasattr(self, 'section_tips'):
-                    self.section_tips = []
                 self.section_tips.append(tip)
\ No newline at end of file
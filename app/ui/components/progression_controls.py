@@ -38,14 +38,17 @@ class ProgressionControlsWidget(QWidget):
 
     def set_song(self, song):
         """Set the current song and update display."""
+        if song is self.current_song:
+            return
         self.current_song = song
         if song:
             self.song_name_label.setText(f"{song.artist} - {song.title}")
             # Enable button only if there are multiple progressions/sections
-            self.next_button.setEnabled(song.has_extended_structure())
+            extended = song.has_extended_structure()
         else:
             self.song_name_label.setText("Песня не выбрана")
-            self.next_button.setEnabled(False)
+            extended = False
+        self.next_button.setEnabled(extended)
 
     def set_button_enabled(self, enabled: bool):
         """Enable or disable the next progression button."""
@@ -9,6 +9,21 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
+from app.core.patterns import section_display_name
+
+# Info skeleton, filled with str.format_map
+_SONG_INFO_HTML = """
+<b>Песня:</b> {title}<br>
+<b>Исполнитель:</b> {artist}<br>
+<b>Размер:</b> {time_sig}<br>
+<b>Темп:</b> {bpm} BPM<br>
+<b>Сложность:</b> {difficulty}<br><br>
+<b>Заметки:</b><br>
+{notes}
+"""
+
+_SECTIONS_HTML = "<br><br><b>Секции:</b> {sections}"
+
 
 class SongInfoPopup(QDialog):
     """Popup dialog showing detailed song information."""
@@ -53,21 +68,21 @@ class SongInfoPopup(QDialog):
             return
 
         song = self.current_song
-        time_sig = f"{song.time_sig[0]}/{song.time_sig[1]}"
-
-        info_text = f"""
-<b>Песня:</b> {song.title}<br>
-<b>Исполнитель:</b> {song.artist}<br>
-<b>Размер:</b> {time_sig}<br>
-<b>Темп:</b> {song.bpm} BPM<br>
-<b>Сложность:</b> {song.difficulty or "Не указана"}<br><br>
-<b>Заметки:</b><br>
-{song.notes}
-        """.strip()
+        info_text = _SONG_INFO_HTML.format_map(
+            {
+                "title": song.title,
+                "artist": song.artist,
+                "time_sig": f"{song.time_sig[0]}/{song.time_sig[1]}",
+                "bpm": song.bpm,
+                "difficulty": song.difficulty or "Не указана",
+                "notes": song.notes,
+            }
+        ).strip()
 
         if song.has_extended_structure():
-            sections = song.get_section_names()
-            sections_text = ", ".join([s.replace("_", " ").title() for s in sections])
-            info_text += f"<br><br><b>Секции:</b> {sections_text}"
+            sections_text = ", ".join(map(section_display_name, song.get_section_names()))
+            info_text = "".join(
+                (info_text, _SECTIONS_HTML.format_map({"sections": sections_text}))
+            )
 
         self.song_info.setHtml(info_text)
\ No newline at end of file
@@ -3,28 +3,105 @@ Song structure visualization widget that shows the overall song layout.
 """
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont
-from typing import Optional, List, Dict
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import (
+    QPainter, QPainterPath, QPen, QBrush, QColor, QFont, QPixmap, QPolygonF, QRegion,
+    QStaticText, QTransform
+)
+from typing import Optional, List, Dict, Tuple
+
+from app.core.patterns import SongSection, section_display_name
+
+def _section_style(bg: str, border: str, text: str) -> Tuple[QBrush, QPen, QPen]:
+    """Build the box brush, border pen and label pen for a section color scheme."""
+    return QBrush(QColor(bg)), QPen(QColor(border), 2), QPen(QColor(text))
+
+
+# Section type -> (background brush, border pen, text pen)
+_SECTION_STYLES: Dict[str, Tuple[QBrush, QPen, QPen]] = {
+    name: _section_style(bg, border, text)
+    for name, (bg, border, text) in {
+        "intro": ("#e8f5e8", "#4caf50", "#2e7d32"),     # Green
+        "verse": ("#e3f2fd", "#2196f3", "#1565c0"),     # Blue  
+        "pre_chorus": ("#fff3e0", "#ff9800", "#e65100"), # Orange
+        "chorus": ("#fce4ec", "#e91e63", "#ad1457"),     # Pink
+        "bridge": ("#f3e5f5", "#9c27b0", "#6a1b9a"),    # Purple
+        "outro": ("#efebe9", "#795548", "#4e342e"),      # Brown
+    }.items()
+}
+_DEFAULT_STYLE = _section_style("#f5f5f5", "#9e9e9e", "#424242")  # Gray
+_CURRENT_STYLE = _section_style("#ffeb3b", "#fbc02d", "#f57f17")  # Yellow highlight
 
 
 class SongStructureWidget(QWidget):
     """Widget that displays the song structure with current position."""
     
+    # Paint resources shared by every frame
+    _PLACEHOLDER_FONT = QFont("Arial", 12)
+    _PLACEHOLDER_PEN = QPen(QColor("#bdc3c7"))
+    _PROGRESSION_FONT = QFont("Arial", 12, QFont.Weight.Bold)
+    _PROGRESSION_PEN = QPen(QColor("#2c3e50"))
+    _INFO_FONT = QFont("Arial", 10)
+    _INFO_PEN = QPen(QColor("#7f8c8d"))
+    _SECTION_FONT = QFont("Arial", 9, QFont.Weight.Bold)
+    _REPEAT_FONT = QFont("Arial", 7)
+    _ARROW_BRUSH = QBrush(QColor("#f44336"))  # Red arrow
+    _ARROW_PEN = QPen(QColor("#f44336"))
+    
+    # Progress arrow pointing up, tip 10px above its anchor point
+    _ARROW_PATH = QPainterPath()
+    _ARROW_PATH.addPolygon(QPolygonF([
+        QPointF(0, -10),    # Top point
+        QPointF(-8, 0),     # Bottom left
+        QPointF(-3, 0),     # Bottom left inner
+        QPointF(-3, 5),     # Bottom left stem
+        QPointF(3, 5),      # Bottom right stem
+        QPointF(3, 0),      # Bottom right inner
+        QPointF(8, 0),      # Bottom right
+    ]))
+    _ARROW_PATH.closeSubpath()
+    
+    # Section box layout
+    _SECTION_MARGIN = 10
+    _SECTION_SPACING = 10
+    _SECTION_HEIGHT = 30
+    
     def __init__(self):
         super().__init__()
         self.song = None
         self.current_section = None
         self.current_section_index = 0
+        # (name, section, display name, laid-out label) in song order, and name -> position
+        self._sections: List[Tuple[str, Optional[SongSection], str, QStaticText]] = []
+        self._section_index: Dict[str, int] = {}
+        # Every section box in its normal colors, for the size and DPR in the key
+        self._structure_pixmap: Optional[QPixmap] = None
+        self._structure_key = None
         self.setMinimumHeight(80)
         
     def set_song(self, song):
         """Set the song to visualize."""
         self.song = song
+        self._sections = []
+        for name in (song.get_section_names() if song else []):
+            display_name = section_display_name(name)
+            self._sections.append(
+                (name, song.get_section(name), display_name, self._make_label(display_name))
+            )
+        self._section_index = {entry[0]: i for i, entry in enumerate(self._sections)}
+        self._structure_pixmap = None
         self.current_section = None
         self.current_section_index = 0
         self.update()
         
+    @classmethod
+    def _make_label(cls, display_name: str) -> QStaticText:
+        """Lay out a section name once so painting skips text shaping."""
+        label = QStaticText(display_name)
+        label.setTextFormat(Qt.TextFormat.PlainText)
+        label.prepare(QTransform(), cls._SECTION_FONT)
+        return label
+        
     def set_current_section(self, section_name: str, section_index: int = 0):
         """Set the currently playing section."""
         self.current_section = section_name
@@ -38,7 +115,6 @@ class SongStructureWidget(QWidget):
             return
             
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         if not self.song.has_extended_structure():
             self._paint_simple_structure(painter)
@@ -48,99 +124,119 @@ class SongStructureWidget(QWidget):
     def _paint_empty_state(self):
         """Paint empty state when no song is loaded."""
         painter = QPainter(self)
-        painter.setFont(QFont("Arial", 12))
-        painter.setPen(QPen(QColor("#bdc3c7")))
+        painter.setFont(self._PLACEHOLDER_FONT)
+        painter.setPen(self._PLACEHOLDER_PEN)
         painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Структура песни")
         
     def _paint_simple_structure(self, painter: QPainter):
         """Paint simple structure for songs without sections."""
-        painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        painter.setPen(QPen(QColor("#2c3e50")))
+        painter.setFont(self._PROGRESSION_FONT)
+        painter.setPen(self._PROGRESSION_PEN)
         
         # Simple progression display
         text = f"Прогрессия: {' - '.join(self.song.progression)}"
         painter.drawText(10, 25, text)
         
         # Additional info
-        painter.setFont(QFont("Arial", 10))
-        painter.setPen(QPen(QColor("#7f8c8d")))
+        painter.setFont(self._INFO_FONT)
+        painter.setPen(self._INFO_PEN)
         info_text = f"Паттерн: {self.song.pattern_id} | BPM: {self.song.bpm}"
         painter.drawText(10, 45, info_text)
         
     def _paint_extended_structure(self, painter: QPainter):
         """Paint extended structure with sections."""
-        if not self.song.structure:
-            return
-            
-        sections = self.song.get_section_names()
+        sections = self._sections
         if not sections:
             return
             
-        # Calculate layout
-        margin = 10
-        section_spacing = 10
-        total_width = self.width() - 2 * margin
-        section_width = max(60, (total_width - (len(sections) - 1) * section_spacing) // len(sections))
-        section_height = 30
-        y_pos = (self.height() - section_height) // 2
-        
-        # Draw sections
-        for i, section_name in enumerate(sections):
-            x_pos = margin + i * (section_width + section_spacing)
-            section = self.song.get_section(section_name)
-            
-            # Colors based on section type and state
-            bg_color, border_color, text_color = self._get_section_colors(
-                section_name, i == self.current_section_index
-            )
-            
-            # Draw section box
-            painter.setBrush(QBrush(bg_color))
-            painter.setPen(QPen(border_color, 2))
-            painter.drawRoundedRect(x_pos, y_pos, section_width, section_height, 6, 6)
-            
-            # Draw section name
-            painter.setFont(QFont("Arial", 9, QFont.Weight.Bold))
-            painter.setPen(QPen(text_color))
+        section_width, y_pos = self._section_layout(len(sections))
+        key = (self.width(), self.height(), self.devicePixelRatioF())
+        if self._structure_pixmap is None or self._structure_key != key:
+            self._structure_pixmap = self._render_structure_pixmap(sections, section_width, y_pos)
+            self._structure_key = key
             
-            display_name = section_name.replace("_", " ").title()
-            painter.drawText(x_pos, y_pos, section_width, section_height,
-                           Qt.AlignmentFlag.AlignCenter, display_name)
+        current = self.current_section_index
+        if current >= len(sections):
+            painter.drawPixmap(0, 0, self._structure_pixmap)
+            return
             
-            # Draw repeat indicator if section repeats
-            if section and section.repeat > 1:
-                painter.setFont(QFont("Arial", 7))
-                repeat_text = f"x{section.repeat}"
-                painter.drawText(x_pos + section_width - 15, y_pos - 5, repeat_text)
-                
+        # Blit everything except the current section's column, then redraw it highlighted
+        x_pos = self._SECTION_MARGIN + current * (section_width + self._SECTION_SPACING)
+        column = QRegion(x_pos - 2, 0, section_width + 4, self.height())
+        painter.setClipRegion(QRegion(self.rect()).subtracted(column))
+        painter.drawPixmap(0, 0, self._structure_pixmap)
+        painter.setClipping(False)
+        
+        # Only the rounded box and the arrow need antialiasing
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._paint_section(painter, sections[current], x_pos, y_pos, section_width, True)
+        
         # Draw progress indicator
-        if self.current_section_index < len(sections):
-            self._draw_progress_arrow(painter, margin, section_width, 
-                                    section_spacing, y_pos, section_height)
-                                    
-    def _get_section_colors(self, section_name: str, is_current: bool):
-        """Get colors for a section based on its type and state."""
-        # Section type colors
-        section_colors = {
-            "intro": ("#e8f5e8", "#4caf50", "#2e7d32"),     # Green
-            "verse": ("#e3f2fd", "#2196f3", "#1565c0"),     # Blue  
-            "pre_chorus": ("#fff3e0", "#ff9800", "#e65100"), # Orange
-            "chorus": ("#fce4ec", "#e91e63", "#ad1457"),     # Pink
-            "bridge": ("#f3e5f5", "#9c27b0", "#6a1b9a"),    # Purple
-            "outro": ("#efebe9", "#795548", "#4e342e"),      # Brown
-        }
-        
-        # Default colors
-        default_colors = ("#f5f5f5", "#9e9e9e", "#424242")  # Gray
-        bg_color, border_color, text_color = section_colors.get(section_name, default_colors)
+        self._draw_progress_arrow(painter, self._SECTION_MARGIN, section_width,
+                                self._SECTION_SPACING, y_pos, self._SECTION_HEIGHT)
+                                
+    def _section_layout(self, count: int):
+        """Return the section box width and top for ``count`` sections."""
+        total_width = self.width() - 2 * self._SECTION_MARGIN
+        section_width = max(60, (total_width - (count - 1) * self._SECTION_SPACING) // count)
+        y_pos = (self.height() - self._SECTION_HEIGHT) // 2
+        return section_width, y_pos
         
-        if is_current:
-            # Highlight current section
-            bg_color = "#ffeb3b"  # Yellow highlight
-            border_color = "#fbc02d"
-            text_color = "#f57f17"
+    def _render_structure_pixmap(self, sections: List[Tuple[str, Optional[SongSection], str, QStaticText]],
+                                 section_width: int, y_pos: int) -> QPixmap:
+        """Render every section box, unhighlighted, into a widget-sized pixmap."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for i, entry in enumerate(sections):
+            x_pos = self._SECTION_MARGIN + i * (section_width + self._SECTION_SPACING)
+            self._paint_section(painter, entry, x_pos, y_pos, section_width, False)
+        painter.end()
+        return pixmap
+        
+    def _paint_section(self, painter: QPainter, entry: Tuple[str, Optional[SongSection], str, QStaticText],
+                       x_pos: int, y_pos: int, section_width: int, is_current: bool):
+        """Paint one section box with its name and repeat indicator."""
+        section_height = self._SECTION_HEIGHT
+        section_name, section, _, label = entry
+        
+        # Paint resources based on section type and state
+        bg_brush, border_pen, text_pen = self._get_section_style(section_name, is_current)
+        
+        # Draw section box
+        painter.setBrush(bg_brush)
+        painter.setPen(border_pen)
+        painter.drawRoundedRect(x_pos, y_pos, section_width, section_height, 6, 6)
+        
+        # Draw section name
+        painter.setFont(self._SECTION_FONT)
+        painter.setPen(text_pen)
+        
+        # Clip long names to their box, as drawText into the box rect did
+        label_size = label.size()
+        painter.setClipRect(x_pos, y_pos, section_width, section_height)
+        painter.drawStaticText(
+            QPointF(x_pos + (section_width - label_size.width()) / 2,
+                    y_pos + (section_height - label_size.height()) / 2),
+            label,
+        )
+        painter.setClipping(False)
+        
+        # Draw repeat indicator if section repeats
+        if section and section.repeat > 1:
+            painter.setFont(self._REPEAT_FONT)
+            repeat_text = f"x{section.repeat}"
+            painter.drawText(x_pos + section_width - 15, y_pos - 5, repeat_text)
             
-        return QColor(bg_color), QColor(border_color), QColor(text_color)
+    def _get_section_style(self, section_name: str, is_current: bool) -> Tuple[QBrush, QPen, QPen]:
+        """Get the brush and pens for a section based on its type and state."""
+        if is_current:
+            return _CURRENT_STYLE
+        return _SECTION_STYLES.get(section_name, _DEFAULT_STYLE)
         
     def _draw_progress_arrow(self, painter: QPainter, margin: int, section_width: int,
                            section_spacing: int, y_pos: int, section_height: int):
@@ -149,38 +245,27 @@ class SongStructureWidget(QWidget):
         arrow_y = y_pos + section_height + 10
         
         # Draw arrow pointing up to current section
-        painter.setBrush(QBrush(QColor("#f44336")))  # Red arrow
-        painter.setPen(QPen(QColor("#f44336")))
-        
-        # Arrow points
-        points = [
-            (arrow_x, arrow_y - 10),      # Top point
-            (arrow_x - 8, arrow_y),       # Bottom left
-            (arrow_x - 3, arrow_y),       # Bottom left inner
-            (arrow_x - 3, arrow_y + 5),   # Bottom left stem
-            (arrow_x + 3, arrow_y + 5),   # Bottom right stem
-            (arrow_x + 3, arrow_y),       # Bottom right inner
-            (arrow_x + 8, arrow_y),       # Bottom right
-        ]
-        
-        from PySide6.QtGui import QPolygon
-        from PySide6.QtCore import QPoint
-        
-        polygon = QPolygon([QPoint(x, y) for x, y in points])
-        painter.drawPolygon(polygon)
+        painter.setBrush(self._ARROW_BRUSH)
+        painter.setPen(self._ARROW_PEN)
+        painter.translate(arrow_x, arrow_y)
+        painter.drawPath(self._ARROW_PATH)
+        painter.translate(-arrow_x, -arrow_y)
         
     def get_section_info(self) -> Optional[Dict]:
         """Get information about the current section."""
         if not self.song or not self.current_section:
             return None
             
-        section = self.song.get_section(self.current_section)
+        index = self._section_index.get(self.current_section)
+        if index is None:
+            return None
+        name, section, display_name, _ = self._sections[index]
         if not section:
             return None
             
         return {
-            "name": self.current_section,
-            "display_name": self.current_section.replace("_", " ").title(),
+            "name": name,
+            "display_name": display_name,
             "chords": section.chords,
             "pattern": section.pattern,
             "bars": section.bars,
@@ -1,7 +1,21 @@
+from functools import lru_cache
+
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QTimer, QPoint, QRect
-from PySide6.QtGui import QPainter, QPen, QBrush, QFont, QColor, QPixmap, QPolygon
-from typing import Optional
+from PySide6.QtCore import Qt, QTimer, QPointF, QRect
+from PySide6.QtGui import (
+    QPainter,
+    QPen,
+    QBrush,
+    QFont,
+    QFontMetricsF,
+    QColor,
+    QPainterPath,
+    QPixmap,
+    QPolygonF,
+    QStaticText,
+    QTransform,
+)
+from typing import List, Optional
 from time import monotonic
 
 from app.ui.icons import get_technique_icon
@@ -10,6 +24,16 @@ from app.ui.icons import get_technique_icon
 class StepsPreviewWidget(QWidget):
     """Widget showing upcoming strumming steps with large arrows."""
 
+    # Fonts shared by every frame
+    _PLACEHOLDER_FONT = QFont("Arial", 12)
+    _TITLE_FONT = QFont("Arial", 12, QFont.Weight.Bold)
+    _LABEL_FONT = QFont("Arial", 10)
+
+    # Rests are always drawn in translucent gray
+    _REST_COLOR = QColor(150, 150, 170, 120)
+    _REST_PEN = QPen(_REST_COLOR)
+    _REST_BRUSH = QBrush(_REST_COLOR)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(300, 200)
@@ -20,10 +44,19 @@ class StepsPreviewWidget(QWidget):
         self.current_step = 0
         self.preview_count = 2  # Show next 2 steps (current + next)
 
+        # Paint fields of the pattern steps, one list per field, by step index
+        self._dirs: List[str] = []
+        self._accented: List[bool] = []
+        self._techniques: List[str] = []
+        self._bar_length = 1
+        # Seconds from each step to the next at the current BPM
+        self._step_durations: List[float] = []
+
         # Timing for fill animation
         self.bpm = 120
         self.last_step_time = None
         self.fill_progress = 0.0  # 0.0 to 1.0, progress until next beat
+        self._fill_pixels = 0  # Fill height as last painted
 
         # Animation timer
         self.animation_timer = QTimer()
@@ -37,6 +70,11 @@ class StepsPreviewWidget(QWidget):
         self.small_arrow_size = 50  # Small arrow for action+1 (reduced for top corner)
         self.vertical_spacing = 100
 
+        # Rows each part of the pane can touch; recomputed on resize
+        self._title_rect = QRect()
+        self._main_step_rect = QRect()
+        self._small_step_rect = QRect()
+
         # Colors
         self.bg_color = QColor(245, 245, 250)
         self.next_color = QColor(100, 150, 255)  # Blue for next
@@ -45,9 +83,65 @@ class StepsPreviewWidget(QWidget):
         self.text_color = QColor(50, 50, 70)
         self.fill_color = QColor(150, 255, 150, 80)  # Light green with transparency
 
+        # Pens and brushes built once from the colors above, keyed by accent.
+        # Arrow heads are filled solid in their shaft color.
+        self._title_pen = QPen(self.text_color, 2)
+        self._text_pen = QPen(self.text_color, 1)
+        self._main_pens = {
+            True: self._arrow_pen(self.accent_color, 8),
+            False: self._arrow_pen(self.next_color, 6),
+        }
+        self._main_brushes = {
+            True: QBrush(self.accent_color),
+            False: QBrush(self.next_color),
+        }
+        self._small_pens = {
+            True: self._arrow_pen(self.accent_color, 4),
+            False: self._arrow_pen(self.upcoming_color, 3),
+        }
+        self._small_brushes = {
+            True: QBrush(self.accent_color),
+            False: QBrush(self.upcoming_color),
+        }
+        self._small_label_pens = {
+            True: QPen(self.accent_color, 1),
+            False: QPen(self.upcoming_color, 1),
+        }
+
+        # Fixed labels laid out once; ascents turn drawText baselines into tops
+        self._title_text = self._make_static_text("Удар:", self._TITLE_FONT)
+        self._title_ascent = QFontMetricsF(self._TITLE_FONT).ascent()
+        self._then_text = self._make_static_text("затем", self._LABEL_FONT)
+        self._label_ascent = QFontMetricsF(self._LABEL_FONT).ascent()
+
+    @staticmethod
+    def _arrow_pen(color: QColor, width: int) -> QPen:
+        """Return a round-capped pen for arrow shafts."""
+        return QPen(
+            color,
+            width,
+            Qt.PenStyle.SolidLine,
+            Qt.PenCapStyle.RoundCap,
+            Qt.PenJoinStyle.RoundJoin,
+        )
+
+    @staticmethod
+    def _make_static_text(text: str, font: QFont) -> QStaticText:
+        """Lay out a fixed label once so painting skips text shaping."""
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.prepare(QTransform(), font)
+        return static_text
+
     def set_pattern(self, pattern):
         """Set the strumming pattern."""
         self.pattern = pattern
+        steps = pattern.steps if pattern else []
+        self._dirs = [step.dir for step in steps]
+        self._accented = [step.accent > 0.5 for step in steps]
+        self._techniques = [step.technique for step in steps]
+        self._bar_length = pattern.steps_per_bar if pattern else 1
+        self._update_step_durations()
         self.update()
 
     def set_current_step(self, step: int):
@@ -60,6 +154,21 @@ class StepsPreviewWidget(QWidget):
     def set_bpm(self, bpm: int):
         """Set current BPM for timing calculations."""
         self.bpm = bpm
+        self._update_step_durations()
+
+    def _update_step_durations(self):
+        """Precompute each step's duration from its normalized t spacing."""
+        if not self.pattern:
+            self._step_durations = []
+            return
+
+        beats_per_bar = self.pattern.time_sig[0]
+        bar_duration = 60.0 / self.bpm * beats_per_bar if self.bpm else 0
+        times = [step.t for step in self.pattern.steps]
+        self._step_durations = [
+            bar_duration * ((next_t - t) % 1.0) if bar_duration else 0
+            for t, next_t in zip(times, times[1:] + times[:1])
+        ]
 
     def update_fill_progress(self):
         """Update fill progress based on elapsed time since last step."""
@@ -67,15 +176,8 @@ class StepsPreviewWidget(QWidget):
             self.fill_progress = 0.0
             return
 
-        # Calculate time per step based on normalized t values
-        beats_per_bar = self.pattern.time_sig[0]
-        bar_duration = 60.0 / self.bpm * beats_per_bar if self.bpm else 0
-
-        step_idx = self.current_step % len(self.pattern.steps)
-        current_step = self.pattern.steps[step_idx]
-        next_step = self.pattern.steps[(step_idx + 1) % len(self.pattern.steps)]
-        delta_t = (next_step.t - current_step.t) % 1.0
-        step_duration = bar_duration * delta_t if bar_duration else 0
+        durations = self._step_durations
+        step_duration = durations[self.current_step % len(durations)]
 
         elapsed = monotonic() - self.last_step_time
         if step_duration > 0:
@@ -83,7 +185,27 @@ class StepsPreviewWidget(QWidget):
         else:
             self.fill_progress = 0.0
 
-        self.update()
+        # Repaint only the rows the fill bar gained or lost, if any
+        fill_pixels = int(self.height() * self.fill_progress)
+        if fill_pixels != self._fill_pixels:
+            top = self.height() - max(fill_pixels, self._fill_pixels)
+            self.update(0, top, self.width(), abs(fill_pixels - self._fill_pixels) + 1)
+
+    def resizeEvent(self, event):
+        """Recompute the bands used to skip drawing outside the update region."""
+        super().resizeEvent(event)
+        width = self.width()
+        self._title_rect = QRect(0, 0, width, 30)
+
+        # Main step: arrow centered vertically, technique cue below it
+        main_size = int(self.main_arrow_size * 1.2)
+        main_top = self.height() // 2 - main_size // 2
+        self._main_step_rect = QRect(0, main_top, width, main_size + 50)
+
+        # Action+1: "затем" label above the arrow, cue to its right
+        small_size = int(self.small_arrow_size * 1.2)
+        small_top = 60 - small_size // 2 - 30
+        self._small_step_rect = QRect(0, small_top, width, small_size + 40)
 
     def get_upcoming_steps(self):
         """Get list of upcoming steps to display."""
@@ -91,45 +213,47 @@ class StepsPreviewWidget(QWidget):
             return []
 
         upcoming = []
-        bar_length = self.pattern.steps_per_bar
-
         for i in range(self.preview_count):
-            step_idx = (self.current_step + i) % bar_length
-            if step_idx < len(self.pattern.steps):
-                upcoming.append((i, self.pattern.steps[step_idx]))
-            else:
-                upcoming.append((i, None))
-
+            step_idx = self._step_index(i)
+            upcoming.append((i, None if step_idx is None else self.pattern.steps[step_idx]))
         return upcoming
 
+    def _step_index(self, offset: int) -> Optional[int]:
+        """Return the index of the step ``offset`` positions ahead, if it exists."""
+        step_idx = (self.current_step + offset) % self._bar_length
+        return step_idx if step_idx < len(self._dirs) else None
+
     def paintEvent(self, event):
         """Draw the preview pane."""
+        # Background, fill bar and labels are axis-aligned: no antialiasing
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Background
         painter.fillRect(self.rect(), self.bg_color)
 
         # Draw animated fill (light green progress)
+        self._fill_pixels = 0
         if self.pattern and self.fill_progress > 0:
             fill_height = int(self.height() * self.fill_progress)
             fill_rect = painter.window()
             fill_rect.setTop(self.height() - fill_height)
             painter.fillRect(fill_rect, self.fill_color)
+            self._fill_pixels = fill_height
 
         if not self.pattern:
             painter.setPen(self.upcoming_color)
-            painter.setFont(QFont("Arial", 12))
+            painter.setFont(self._PLACEHOLDER_FONT)
             painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Выберите ритм")
             return
 
-        # Title in top left
-        painter.setPen(QPen(self.text_color, 2))
-        painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        painter.drawText(10, 20, "Удар:")
+        # Fill-bar ticks only repaint a thin strip; skip parts outside it
+        region = event.region()
 
-        # Draw upcoming steps
-        upcoming_steps = self.get_upcoming_steps()
+        # Title in top left
+        if region.intersects(self._title_rect):
+            painter.setPen(self._title_pen)
+            painter.setFont(self._TITLE_FONT)
+            painter.drawStaticText(QPointF(10, 20 - self._title_ascent), self._title_text)
 
         # Center positions
         center_x = self.width() // 2
@@ -139,89 +263,80 @@ class StepsPreviewWidget(QWidget):
         small_x = self.width() - 60  # 60px from right edge
         small_y = 60  # 60px from top
 
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
         # Draw main next step (big arrow)
-        if len(upcoming_steps) > 0 and upcoming_steps[0][1]:
-            step = upcoming_steps[0][1]
-            self.draw_main_step(painter, center_x, main_y, step)
+        if self.preview_count > 0 and region.intersects(self._main_step_rect):
+            step_idx = self._step_index(0)
+            if step_idx is not None:
+                self.draw_main_step(painter, center_x, main_y, step_idx)
 
         # Draw action+1 (small arrow in top right)
-        if len(upcoming_steps) > 1 and upcoming_steps[1][1]:
-            step = upcoming_steps[1][1]
-            self.draw_small_step(painter, small_x, small_y, step)
+        if self.preview_count > 1 and region.intersects(self._small_step_rect):
+            step_idx = self._step_index(1)
+            if step_idx is not None:
+                self.draw_small_step(painter, small_x, small_y, step_idx)
 
-    def draw_main_step(self, painter, x, y, step):
+    def draw_main_step(self, painter, x, y, step_idx: int):
         """Draw the main (next) step with large arrow in center."""
         # Colors and sizes based on accent
-        if step.accent > 0.5:
-            color = self.accent_color
+        accented = self._accented[step_idx]
+        if accented:
             arrow_size = int(self.main_arrow_size * 1.2)
-            line_width = 8
         else:
-            color = self.next_color
             arrow_size = self.main_arrow_size
-            line_width = 6
-
-        painter.setPen(
-            QPen(
-                color,
-                line_width,
-                Qt.PenStyle.SolidLine,
-                Qt.PenCapStyle.RoundCap,
-                Qt.PenJoinStyle.RoundJoin,
-            )
-        )
-        painter.setBrush(QBrush(QColor(color.red(), color.green(), color.blue(), 120)))
+
+        painter.setPen(self._main_pens[accented])
+        painter.setBrush(self._main_brushes[accented])
 
         # Draw main arrow
-        if step.dir == "D":
+        direction = self._dirs[step_idx]
+        if direction == "D":
             self.draw_large_down_arrow(painter, x, y, arrow_size)
-        elif step.dir == "U":
+        elif direction == "U":
             self.draw_large_up_arrow(painter, x, y, arrow_size)
-        elif step.dir == "-":
+        elif direction == "-":
             self.draw_large_rest(painter, x, y, arrow_size)
 
         # Draw technique cue below the arrow
-        self.draw_technique_cue(painter, x, y + arrow_size // 2 + 10, step.technique)
+        self.draw_technique_cue(
+            painter, x, y + arrow_size // 2 + 10, self._techniques[step_idx]
+        )
 
-    def draw_small_step(self, painter, x, y, step):
+    def draw_small_step(self, painter, x, y, step_idx: int):
         """Draw the action+1 step with smaller arrow in top right corner."""
         # Colors and sizes based on accent (similar to main step but smaller)
-        if step.accent > 0.5:
-            color = self.accent_color
+        accented = self._accented[step_idx]
+        if accented:
             arrow_size = int(self.small_arrow_size * 1.2)
-            line_width = 4
         else:
-            color = self.upcoming_color
             arrow_size = self.small_arrow_size
-            line_width = 3
-
-        painter.setPen(
-            QPen(
-                color,
-                line_width,
-                Qt.PenStyle.SolidLine,
-                Qt.PenCapStyle.RoundCap,
-                Qt.PenJoinStyle.RoundJoin,
-            )
-        )
-        painter.setBrush(QBrush(QColor(color.red(), color.green(), color.blue(), 80)))
+
+        painter.setPen(self._small_pens[accented])
+        painter.setBrush(self._small_brushes[accented])
 
         # Draw small arrow
-        if step.dir == "D":
+        direction = self._dirs[step_idx]
+        if direction == "D":
             self.draw_large_down_arrow(painter, x, y, arrow_size)
-        elif step.dir == "U":
+        elif direction == "U":
             self.draw_large_up_arrow(painter, x, y, arrow_size)
-        elif step.dir == "-":
+        elif direction == "-":
             self.draw_large_rest(painter, x, y, arrow_size)
 
         # Draw "затем" label above small arrow in top right corner
-        painter.setFont(QFont("Arial", 10))
-        painter.setPen(QPen(color, 1))
-        painter.drawText(x - 15, y - arrow_size // 2 - 15, "затем")
+        painter.setFont(self._LABEL_FONT)
+        painter.setPen(self._small_label_pens[accented])
+        label_top = y - arrow_size // 2 - 15 - self._label_ascent
+        painter.drawStaticText(QPointF(x - 15, label_top), self._then_text)
 
         # Technique cue to the right of the small arrow
         self.draw_technique_cue(
-            painter, x + arrow_size // 2 + 10, y, step.technique, position="right"
+            painter,
+            x + arrow_size // 2 + 10,
+            y,
+            self._techniques[step_idx],
+            position="right",
         )
 
     def draw_technique_cue(
@@ -237,8 +352,8 @@ class StepsPreviewWidget(QWidget):
             else:
                 painter.drawPixmap(x, y, pixmap)
         else:
-            painter.setFont(QFont("Arial", 10))
-            painter.setPen(QPen(self.text_color, 1))
+            painter.setFont(self._LABEL_FONT)
+            painter.setPen(self._text_pen)
             if position == "below":
                 painter.drawText(x - 20, y + 15, technique)
             elif position == "right":
@@ -246,56 +361,53 @@ class StepsPreviewWidget(QWidget):
             else:
                 painter.drawText(x, y, technique)
 
-    def draw_large_down_arrow(self, painter, x, y, size):
-        """Draw large downstroke arrow with filled head."""
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _arrow_path(size: int, direction: str) -> QPainterPath:
+        """Return shaft and head triangle as one path centered on (0, 0)."""
         # Vertical shaft
-        shaft_length = size // 2
-        painter.drawLine(x, y - shaft_length // 2, x, y + shaft_length // 2)
+        half_shaft = (size // 2) // 2
+        path = QPainterPath()
+        path.moveTo(0, -half_shaft)
+        path.lineTo(0, half_shaft)
 
-        # Arrow head - filled triangle like in timeline
+        # Arrow head - filled triangle like in timeline, tip at the shaft end
         head_width = int(size * 0.5)
         head_height = int(size * 0.35)
-        bottom = y + shaft_length // 2
-        points = [
-            QPoint(x, bottom),
-            QPoint(x - head_width // 2, bottom - head_height),
-            QPoint(x + head_width // 2, bottom - head_height),
-        ]
-        painter.save()
-        painter.setBrush(QBrush(painter.pen().color()))
-        painter.drawPolygon(QPolygon(points))
-        painter.restore()
+        if direction == "D":
+            tip, base = half_shaft, half_shaft - head_height
+        else:
+            tip, base = -half_shaft, -half_shaft + head_height
+        path.addPolygon(
+            QPolygonF(
+                [
+                    QPointF(0, tip),
+                    QPointF(-(head_width // 2), base),
+                    QPointF(head_width // 2, base),
+                ]
+            )
+        )
+        path.closeSubpath()
+        return path
 
-    def draw_large_up_arrow(self, painter, x, y, size):
-        """Draw large upstroke arrow with filled head."""
-        # Vertical shaft
-        shaft_length = size // 2
-        painter.drawLine(x, y - shaft_length // 2, x, y + shaft_length // 2)
+    def draw_large_down_arrow(self, painter, x, y, size):
+        """Draw large downstroke arrow with the painter's pen and head brush."""
+        painter.translate(x, y)
+        painter.drawPath(self._arrow_path(size, "D"))
+        painter.translate(-x, -y)
 
-        # Arrow head - filled triangle like in timeline
-        head_width = int(size * 0.5)
-        head_height = int(size * 0.35)
-        top = y - shaft_length // 2
-        points = [
-            QPoint(x, top),
-            QPoint(x - head_width // 2, top + head_height),
-            QPoint(x + head_width // 2, top + head_height),
-        ]
-        painter.save()
-        painter.setBrush(QBrush(painter.pen().color()))
-        painter.drawPolygon(QPolygon(points))
-        painter.restore()
+    def draw_large_up_arrow(self, painter, x, y, size):
+        """Draw large upstroke arrow with the painter's pen and head brush."""
+        painter.translate(x, y)
+        painter.drawPath(self._arrow_path(size, "U"))
+        painter.translate(-x, -y)
 
     def draw_large_rest(self, painter, x, y, size):
         """Draw large rest symbol as rounded rectangle like in timeline."""
         rest_size = int(size / 4)
 
-        painter.save()
-        color = QColor(150, 150, 170)  # Gray color for rests
-        color.setAlpha(120)
-        painter.setBrush(QBrush(color))
-        painter.setPen(QPen(color))
+        painter.setBrush(self._REST_BRUSH)
+        painter.setPen(self._REST_PEN)
 
         rest_rect = QRect(x - rest_size, y - rest_size // 2, rest_size * 2, rest_size)
         painter.drawRoundedRect(rest_rect, 2, 2)
-        painter.restore()
@@ -1,23 +1,53 @@
+from functools import lru_cache
 from time import monotonic
+from typing import Tuple
 
-from PySide6.QtCore import QPoint, QRect, Qt, Signal, QTimer, QSize
+from PySide6.QtCore import QLine, QPoint, QPointF, QRect, Qt, Signal, QTimer, QSize
 from PySide6.QtGui import (
     QBrush,
     QColor,
     QFont,
+    QFontMetricsF,
     QLinearGradient,
     QPainter,
+    QPainterPath,
     QPen,
+    QPixmap,
     QPolygon,
+    QStaticText,
+    QTransform,
 )
 from PySide6.QtWidgets import QWidget, QToolTip
 
+# Syllables of the subdivisions within a beat, by steps per beat
+_SUBDIVISION_TEMPLATES = {
+    1: ["1"],
+    2: ["1", "&"],
+    3: ["1", "&", "a"],
+    4: ["1", "e", "&", "a"],
+}
+
 
 class TimelineWidget(QWidget):
     """Visual timeline widget showing guitar strumming patterns with real-time animation."""
 
     step_hit = Signal(int)  # Emitted when a step is hit
 
+    # Scale of the current step right after it is hit
+    _HIT_SCALE = 1.15
+
+    # Fonts shared by every frame
+    _BEAT_FONT = QFont("Arial", 12, QFont.Bold)
+    _SUB_FONT = QFont("Arial", 10)
+    _COUNTDOWN_FONT = QFont("Arial", 8)
+
+    # Step arrow colors by accuracy, hit within good/ok threshold or missed
+    _GOOD_COLOR = QColor(50, 200, 100)
+    _OK_COLOR = QColor(255, 215, 0)
+    _MISS_COLOR = QColor(200, 60, 60)
+
+    _PROGRESS_BG_BRUSH = QBrush(QColor(200, 200, 220))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(200)
@@ -38,17 +68,18 @@ class TimelineWidget(QWidget):
         # Animation properties
         self._highlight_scale = 1.0
 
-        # Animation timer
-        self.animation_timer = QTimer()
+        # Highlight pulse timer, reset once 150 ms after each hit
+        self.animation_timer = QTimer(self)
         self.animation_timer.setSingleShot(True)
         self.animation_timer.timeout.connect(self.reset_highlight_scale)
 
         # Timing
         self.bpm = 120
         self.last_step_time = None
+        # Re-armed per step, only while a countdown is running
         self.countdown_timer = QTimer(self)
-        self.countdown_timer.timeout.connect(self.update)
-        self.countdown_timer.start(50)
+        self.countdown_timer.setSingleShot(True)
+        self.countdown_timer.timeout.connect(self._on_countdown_tick)
 
         # Colors
         self.bg_color = QColor(240, 240, 245)
@@ -57,6 +88,40 @@ class TimelineWidget(QWidget):
         self.accent_color = QColor(255, 200, 50)
         self.beat_color = QColor(100, 100, 120)
 
+        # Paint objects derived from the colors above
+        self._step_pens: dict[tuple[int, int], QPen] = {}
+        self._step_brushes: dict[int, QBrush] = {}
+        self._beat_pen = QPen(self.beat_color, 2)
+        self._progress_border_pen = QPen(self.step_color, 1)
+        self._indicator_pen = QPen(self.current_color, 3)
+        self._countdown_pen = QPen(self.current_color)
+        rest_color = QColor(self.step_color)
+        rest_color.setAlpha(120)
+        self._rest_brush = QBrush(rest_color)
+
+        # Layout rects, recomputed on resize: fretboard bar, the bar with its
+        # border pen (which reaches 1px outside), beat labels and progress bands
+        self._bar_rect = QRect()
+        self._bar_outline_rect = QRect()
+        self._beat_markers_rect = QRect()
+        self._progress_rect = QRect()
+
+        # Per-step shaft x and repaint rect, following the widget size
+        self._shaft_xs: list[int] = []
+        self._step_rects: list[QRect] = []
+        self._max_head_width = 0
+        # Step painters by direction
+        self._step_drawers = {
+            "D": self.draw_down_arrow,
+            "U": self.draw_up_arrow,
+            "-": self.draw_rest,
+        }
+
+        # Per-step direction, accent flag (accent > 0.5) and idle arrow color
+        self._dirs: list[str] = []
+        self._accented: list[bool] = []
+        self._idle_colors: list[QColor] = []
+
         # Accuracy visualization
         self.step_accuracy: dict[int, float] = {}
         self.good_threshold = 30  # ms
@@ -67,6 +132,11 @@ class TimelineWidget(QWidget):
 
         # Font
         self._font = QFont("Arial", 10, QFont.Bold)
+        self._countdown_ascent = QFontMetricsF(self._COUNTDOWN_FONT).ascent()
+
+        # Fretboard, grid and beat markers only change with size and layout
+        self._background_pixmap = None
+        self._background_key = None
 
     def sizeHint(self) -> QSize:
         """Provide a dynamic size hint for the widget."""
@@ -85,49 +155,70 @@ class TimelineWidget(QWidget):
             self.time_signature = pattern.time_sig
             self.update_geometry()
             self.step_accuracy.clear()
+            self._dirs = [step.dir for step in pattern.steps]
+            self._accented = [step.accent > 0.5 for step in pattern.steps]
+            self._idle_colors = [
+                self.accent_color if accented else self.step_color
+                for accented in self._accented
+            ]
+        self._update_step_positions()
         self.update()
 
     def set_bpm(self, bpm: int) -> None:
         """Set current tempo for countdown calculations."""
+        if bpm == self.bpm:
+            return
         self.bpm = bpm
-        self.update()
+        self._update_progress()
 
     def set_current_step(self, step: int):
         """Update the current step position with animation."""
         if self.current_step != step:
+            self.update(self._step_rect(self.current_step))
             self.current_step = step
+            self.update(self._step_rect(step))
             self.last_step_time = monotonic()
             self.animate_step_hit()
-            self.update()
+            self._update_progress()
+            self._schedule_countdown()
 
     def set_step_accuracy(self, step: int, deviation_ms: float) -> None:
         """Store accuracy information for a step."""
-        self.step_accuracy[step % self.steps_per_bar] = deviation_ms
-        self.update()
+        index = step % self.steps_per_bar
+        previous = self.step_accuracy.get(index)
+        self.step_accuracy[index] = deviation_ms
+        # The arrow only changes when the deviation falls in another color band
+        if previous is None or self._accuracy_color(previous) is not self._accuracy_color(
+            deviation_ms
+        ):
+            self.update(self._step_rect(index))
 
     def clear_accuracy(self) -> None:
         """Clear stored accuracy data."""
+        if not self.step_accuracy:
+            return
         self.step_accuracy.clear()
         self.update()
 
     def animate_step_hit(self):
         """Animate the current step highlight."""
         # Scale animation
-        self.highlight_scale = 1.15
-        self.update()
+        self.highlight_scale = self._HIT_SCALE
         self.animation_timer.start(150)
 
     def reset_highlight_scale(self):
         """Reset highlight scale after animation."""
         self.highlight_scale = 1.0
-        self.update()
 
     def get_highlight_scale(self):
         return self._highlight_scale
 
     def set_highlight_scale(self, value):
+        if value == self._highlight_scale:
+            return
         self._highlight_scale = value
-        self.update()
+        # Only the current step is drawn scaled
+        self.update(self._step_rect(self.current_step))
 
     highlight_scale = property(get_highlight_scale, set_highlight_scale)
 
@@ -141,10 +232,100 @@ class TimelineWidget(QWidget):
         self.setMinimumWidth(total_width)
         self.updateGeometry()
 
+    def resizeEvent(self, event):
+        """Recompute the layout rects and step positions for the new size."""
+        width, height, margin = self.width(), self.height(), self.margin
+        self._bar_rect = QRect(margin, margin, width - 2 * margin, height - 2 * margin)
+        self._bar_outline_rect = self._bar_rect.adjusted(-1, -1, 1, 1)
+        self._beat_markers_rect = QRect(0, margin - 27, width, 40)
+        # Progress bar starts 10px below the bar; the indicator reaches 8px higher
+        self._progress_rect = QRect(0, height - margin + 2, width, 42)
+        self._update_step_positions()
+        super().resizeEvent(event)
+
+    def _update_step_positions(self) -> None:
+        """Map each step's normalized t to its shaft x and repaint rect."""
+        if not self.pattern:
+            self._shaft_xs = []
+            self._step_rects = []
+            return
+        bar_width = self.width() - 2 * self.margin
+        step_width = bar_width / self.steps_per_bar
+        step_xs = [self.margin + step.t * bar_width for step in self.pattern.steps]
+        self._shaft_xs = [int(x + step_width / 2) for x in step_xs]
+        self._max_head_width = int(step_width * 0.8)
+
+        # Arrows stay inside their step cell and within 0.35 of the bar height
+        # around its center even when scaled, but a rest box reaches a quarter
+        # of the arrow size to each side of the shaft, which on a tall timeline
+        # is wider than the cell; the padding covers the pen width
+        pad = 8
+        bar_height = self.height() - 2 * self.margin
+        rest_half_width = int(int(bar_height * 0.6 * self._HIT_SCALE) / 4)
+        half_width = max(int(step_width / 2) + 1, rest_half_width) + pad
+        top = self.margin - pad
+        height = bar_height + 2 * pad
+        self._step_rects = [
+            QRect(x - half_width, top, 2 * half_width + 1, height) for x in self._shaft_xs
+        ]
+
+    def _step_pen(self, color: QColor, line_width: int) -> QPen:
+        """Return the arrow pen for ``color`` and ``line_width``, built once."""
+        key = (color.rgba(), line_width)
+        pen = self._step_pens.get(key)
+        if pen is None:
+            pen = QPen(color, line_width, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+            self._step_pens[key] = pen
+        return pen
+
+    def _step_brush(self, color: QColor) -> QBrush:
+        """Return the solid arrow head brush for ``color``, built once."""
+        key = color.rgba()
+        brush = self._step_brushes.get(key)
+        if brush is None:
+            brush = QBrush(color)
+            self._step_brushes[key] = brush
+        return brush
+
+    def _step_rect(self, index: int) -> QRect:
+        """Return the area step ``index`` can paint into, highlight included."""
+        if not self._step_rects:
+            return QRect()
+        return self._step_rects[index % len(self._step_rects)]
+
+    def _update_progress(self) -> None:
+        """Repaint only the progress bar and countdown."""
+        self.update(self._progress_rect)
+
+    def _current_step_ms(self) -> float:
+        """Return the duration in ms from the current step to the next one."""
+        if not self.bpm:
+            return 0
+        steps = self.pattern.steps
+        current_idx = self.current_step % len(steps)
+        bar_ms = 60000 / self.bpm * self.time_signature[0]
+        delta_t = (steps[(current_idx + 1) % len(steps)].t - steps[current_idx].t) % 1.0
+        return bar_ms * delta_t
+
+    def _schedule_countdown(self) -> None:
+        """Arm the next countdown repaint, about four per step."""
+        if not self.pattern or not self.pattern.steps or not self.bpm:
+            return
+        self.countdown_timer.start(max(16, int(self._current_step_ms() / 4)))
+
+    def _on_countdown_tick(self) -> None:
+        """Repaint the countdown and keep ticking until the next step is due."""
+        self._update_progress()
+        if self.last_step_time is None or not self.pattern or not self.pattern.steps:
+            return
+        elapsed = (monotonic() - self.last_step_time) * 1000
+        if elapsed < self._current_step_ms():
+            self._schedule_countdown()
+
     def paintEvent(self, event):
         """Draw the timeline visualization."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        region = event.region()
 
         # Compute dynamic metrics
         bar_width = self.width() - 2 * self.margin
@@ -155,9 +336,25 @@ class TimelineWidget(QWidget):
         start_y = self.margin
         center_y = start_y + bar_height / 2
 
-        # Draw fretboard background
-        bar_rect = QRect(int(start_x), int(start_y), int(bar_width), int(bar_height))
-        self.draw_fretboard(painter, bar_rect)
+        # Blit the cached fretboard, grid and beat markers (the border pen
+        # reaches 1px outside the bar)
+        bar_rect = self._bar_rect
+        if region.intersects(self._bar_outline_rect) or region.intersects(
+            self._beat_markers_rect
+        ):
+            key = (
+                self.width(),
+                self.height(),
+                self.devicePixelRatioF(),
+                self.pattern is not None,
+                self.steps_per_bar,
+                self.time_signature,
+                self.show_grid,
+            )
+            if self._background_pixmap is None or self._background_key != key:
+                self._background_pixmap = self._render_background(bar_rect)
+                self._background_key = key
+            painter.drawPixmap(0, 0, self._background_pixmap)
 
         if not self.pattern:
             painter.setPen(self.step_color)
@@ -165,27 +362,32 @@ class TimelineWidget(QWidget):
             painter.drawText(bar_rect, Qt.AlignCenter, "No pattern selected")
             return
 
-        # Optional grid
-        if self.show_grid:
-            self.draw_grid(painter, start_x, start_y, bar_width, bar_height)
-
-        # Draw beat markers above the fretboard
-        self.draw_beat_markers(painter, start_x, int(start_y - 25))
+        # Draw steps using normalized t positions, skipping those outside the region.
+        # Only the arrows and rests need antialiasing, everything else is axis-aligned
+        current_idx = self.current_step % len(self.pattern.steps)
+        step_rects = self._step_rects
+        shaft_xs = self._shaft_xs
+        painter.setRenderHint(QPainter.Antialiasing)
+        idle_sizes = self._step_sizes(1.0)
+        current_sizes = self._step_sizes(self.highlight_scale)
+        for i, direction in enumerate(self._dirs):
+            if not region.intersects(step_rects[i]):
+                continue
+            is_current = i == current_idx
+            self.draw_step(
+                painter, shaft_xs[i], center_y, direction, is_current, i,
+                current_sizes if is_current else idle_sizes,
+            )
+        painter.setRenderHint(QPainter.Antialiasing, False)
 
-        # Draw steps using normalized t positions
-        for i, step in enumerate(self.pattern.steps):
-            step_x = start_x + step.t * bar_width
-            is_current = i == self.current_step % len(self.pattern.steps)
-            self.draw_step(painter, step_x, center_y, step, is_current, i)
+        if not region.intersects(self._progress_rect):
+            return
 
         # Draw progress indicator below the fretboard with countdown
-        beats_per_bar = self.time_signature[0]
-        bar_ms = 60000 / self.bpm * beats_per_bar if self.bpm else 0
-        current_idx = self.current_step % len(self.pattern.steps)
         current_step = self.pattern.steps[current_idx]
         next_step = self.pattern.steps[(current_idx + 1) % len(self.pattern.steps)]
         delta_t = (next_step.t - current_step.t) % 1.0
-        step_ms = bar_ms * delta_t
+        step_ms = self._current_step_ms()
         if self.last_step_time is None:
             ms_until_next = step_ms
             progress_t = current_step.t
@@ -199,140 +401,155 @@ class TimelineWidget(QWidget):
             painter, start_x, int(start_y + bar_height + 10), progress_t, ms_until_next
         )
 
-    def draw_beat_markers(self, painter, start_x, y):
-        """Draw beat numbers with subdivision labels."""
-        beats_per_bar = self.time_signature[0]
-        steps_per_beat = self.steps_per_bar // beats_per_bar
-
-        beat_font = QFont("Arial", 12, QFont.Bold)
-        sub_font = QFont("Arial", 10)
-        painter.setPen(QPen(self.beat_color, 2))
-
-        # Template for common subdivision syllables
-        subdivision_templates = {
-            1: ["1"],
-            2: ["1", "&"],
-            3: ["1", "&", "a"],
-            4: ["1", "e", "&", "a"],
-        }
-        template = subdivision_templates.get(
+    def _render_background(self, bar_rect: QRect) -> QPixmap:
+        """Render the fretboard, grid and beat markers into a widget-sized pixmap."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        self.draw_fretboard(painter, bar_rect)
+        if self.pattern:
+            if self.show_grid:
+                self.draw_grid(
+                    painter, bar_rect.x(), bar_rect.y(), bar_rect.width(), bar_rect.height()
+                )
+            self.draw_beat_markers(painter, bar_rect.x(), bar_rect.y() - 25)
+        painter.end()
+        return pixmap
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _beat_labels(steps_per_bar: int, beats_per_bar: int) -> Tuple[Tuple[str, bool], ...]:
+        """Return each step's label and whether it starts a beat."""
+        steps_per_beat = steps_per_bar // beats_per_bar
+        template = _SUBDIVISION_TEMPLATES.get(
             steps_per_beat, [str(i + 1) for i in range(steps_per_beat)]
         )
+        return tuple(
+            (str(step // steps_per_beat + 1), True)
+            if step % steps_per_beat == 0
+            else (template[step % steps_per_beat], False)
+            for step in range(steps_per_bar)
+        )
 
-        for step in range(self.steps_per_bar):
-            beat = step // steps_per_beat
-            sub = step % steps_per_beat
-            label = template[sub]
-            if sub == 0:
-                label = str(beat + 1)
-                painter.setFont(beat_font)
-            else:
-                painter.setFont(sub_font)
+    def draw_beat_markers(self, painter, start_x, y):
+        """Draw beat numbers with subdivision labels."""
+        painter.setPen(self._beat_pen)
 
+        labels = self._beat_labels(self.steps_per_bar, self.time_signature[0])
+        beat_lines = []
+        for step, (label, on_beat) in enumerate(labels):
+            painter.setFont(self._BEAT_FONT if on_beat else self._SUB_FONT)
             text_x = int(start_x + (step + 0.5) * self.step_width)
             painter.drawText(text_x - 10, int(y), 20, 20, Qt.AlignCenter, label)
 
-            if sub == 0:
+            if on_beat:
                 line_x = int(start_x + step * self.step_width)
-                painter.drawLine(line_x, int(y + 15), line_x, int(y + 35))
+                beat_lines.append(QLine(line_x, int(y + 15), line_x, int(y + 35)))
+        painter.drawLines(beat_lines)
+
+    def _accuracy_color(self, deviation: float) -> QColor:
+        """Return the arrow color for a hit ``deviation`` ms off the beat."""
+        abs_dev = abs(deviation)
+        if abs_dev <= self.good_threshold:
+            return self._GOOD_COLOR
+        if abs_dev <= self.ok_threshold:
+            return self._OK_COLOR
+        return self._MISS_COLOR
+
+    def _step_sizes(self, scale):
+        """Return arrow size and plain/accented line widths for ``scale``."""
+        # Keep the arrow compact within the grid
+        arrow_size = int(self.step_height * 0.6 * scale)
+        line_width = max(4, int(4 * scale))
+        return arrow_size, line_width, int(line_width * 1.5)
 
-    def draw_step(self, painter, x, y, step, is_current, index):
-        """Draw a single step (arrow or rest)."""
-        if not step:
-            return
+    def draw_step(self, painter, shaft_x, y, direction, is_current, index, sizes=None):
+        """Draw step ``index`` (arrow or rest) centered on ``shaft_x``.
 
+        ``sizes`` is the ``_step_sizes`` result for the step's scale, computed
+        here when not passed in.
+        """
         # Set colors and scale based on current step and accuracy
         deviation = self.step_accuracy.get(index)
 
-        scale = self.highlight_scale if is_current else 1.0
+        if sizes is None:
+            sizes = self._step_sizes(self.highlight_scale if is_current else 1.0)
 
         if deviation is not None:
-            abs_dev = abs(deviation)
-            if abs_dev <= self.good_threshold:
-                pen_color = QColor(50, 200, 100)
-            elif abs_dev <= self.ok_threshold:
-                pen_color = QColor(255, 215, 0)
-            else:
-                pen_color = QColor(200, 60, 60)
+            pen_color = self._accuracy_color(deviation)
         else:
-            pen_color = (
-                QColor(self.current_color)
-                if is_current
-                else self.accent_color if step.accent > 0.5 else self.step_color
+            pen_color = self.current_color if is_current else self._idle_colors[index]
+
+        # Thicker line for accents
+        arrow_size, line_width, accent_width = sizes
+        if self._accented[index]:
+            line_width = accent_width
+
+        painter.setPen(self._step_pen(pen_color, line_width))
+        painter.setBrush(self._step_brush(pen_color))
+
+        draw = self._step_drawers.get(direction)
+        if draw is not None:
+            draw(painter, shaft_x, y, arrow_size)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _arrow_path(
+        direction: str, length: int, head_width: int, head_height: int
+    ) -> QPainterPath:
+        """Return shaft and head triangle as one path, shaft from (0, 0) down."""
+        path = QPainterPath()
+        path.moveTo(0, 0)
+        path.lineTo(0, length)
+
+        # Head tip sits on the shaft end the stroke points to
+        if direction == "D":
+            tip, base = length, length - head_height
+        else:
+            tip, base = 0, head_height
+        path.addPolygon(
+            QPolygon(
+                [
+                    QPoint(0, tip),
+                    QPoint(-(head_width // 2), base),
+                    QPoint(head_width // 2, base),
+                ]
             )
-
-        # Calculate arrow size with scale but keep it compact within the grid
-        arrow_size = int(self.step_height * 0.6 * scale)
-        line_width = max(4, int(4 * scale))
-
-        # Adjust for accent
-        if step.accent > 0.5:
-            line_width = int(line_width * 1.5)
-
-        painter.setPen(
-            QPen(pen_color, line_width, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
         )
-        painter.setBrush(Qt.NoBrush)
+        path.closeSubpath()
+        return path
+
+    def _draw_arrow(self, painter, shaft_x, y, size, direction):
+        """Draw an arrow with the painter's pen and head brush."""
+        half_size = size / 2
+        top = int(y - half_size)
+        bottom = int(y + half_size)
+        head_width = min(int(size * 0.5), self._max_head_width)
+        head_height = int(size * 0.35)
 
-        if step.dir == "D":
-            self.draw_down_arrow(painter, x, y, arrow_size)
-        elif step.dir == "U":
-            self.draw_up_arrow(painter, x, y, arrow_size)
-        elif step.dir == "-":
-            self.draw_rest(painter, x, y, arrow_size)
+        painter.translate(shaft_x, top)
+        painter.drawPath(self._arrow_path(direction, bottom - top, head_width, head_height))
+        painter.translate(-shaft_x, -top)
 
-    def draw_down_arrow(self, painter, x, y, size):
+    def draw_down_arrow(self, painter, shaft_x, y, size):
         """Draw downstroke arrow as a simple filled head with a slim shaft."""
-        shaft_x = int(x + self.step_width / 2)
-        top = int(y - size / 2)
-        bottom = int(y + size / 2)
-        painter.drawLine(shaft_x, top, shaft_x, bottom)
+        self._draw_arrow(painter, shaft_x, y, size, "D")
 
-        head_width = min(int(size * 0.5), int(self.step_width * 0.8))
-        head_height = int(size * 0.35)
-        points = [
-            QPoint(shaft_x, bottom),
-            QPoint(shaft_x - head_width // 2, bottom - head_height),
-            QPoint(shaft_x + head_width // 2, bottom - head_height),
-        ]
-        painter.save()
-        painter.setBrush(painter.pen().color())
-        painter.drawPolygon(QPolygon(points))
-        painter.restore()
-
-    def draw_up_arrow(self, painter, x, y, size):
+    def draw_up_arrow(self, painter, shaft_x, y, size):
         """Draw upstroke arrow as a simple filled head with a slim shaft."""
-        shaft_x = int(x + self.step_width / 2)
-        top = int(y - size / 2)
-        bottom = int(y + size / 2)
-        painter.drawLine(shaft_x, top, shaft_x, bottom)
+        self._draw_arrow(painter, shaft_x, y, size, "U")
 
-        head_width = min(int(size * 0.5), int(self.step_width * 0.8))
-        head_height = int(size * 0.35)
-        points = [
-            QPoint(shaft_x, top),
-            QPoint(shaft_x - head_width // 2, top + head_height),
-            QPoint(shaft_x + head_width // 2, top + head_height),
-        ]
-        painter.save()
-        painter.setBrush(painter.pen().color())
-        painter.drawPolygon(QPolygon(points))
-        painter.restore()
-
-    def draw_rest(self, painter, x, y, size):
-        """Draw rest symbol."""
-        rest_x = int(x + self.step_width / 2)
+    def draw_rest(self, painter, rest_x, y, size):
+        """Draw rest symbol centered on ``rest_x``."""
         rest_size = int(size / 4)
 
-        painter.save()
-        color = QColor(self.step_color)
-        color.setAlpha(120)
-        painter.setBrush(QBrush(color))
-        rest_rect = QRect(
-            rest_x - rest_size, int(y - rest_size / 2), rest_size * 2, rest_size
+        painter.setBrush(self._rest_brush)
+        painter.drawRoundedRect(
+            rest_x - rest_size, int(y - rest_size / 2), rest_size * 2, rest_size, 2, 2
         )
-        painter.drawRoundedRect(rest_rect, 2, 2)
-        painter.restore()
 
     def draw_progress(self, painter, start_x, y, progress_t, ms_until_next):
         """Draw progress bar showing position in the bar with countdown."""
@@ -343,8 +560,8 @@ class TimelineWidget(QWidget):
         progress_width = progress_t * bar_width
 
         # Background
-        painter.setPen(QPen(self.step_color, 1))
-        painter.setBrush(QBrush(QColor(200, 200, 220)))
+        painter.setPen(self._progress_border_pen)
+        painter.setBrush(self._PROGRESS_BG_BRUSH)
         painter.drawRect(int(start_x), int(y), int(bar_width), 10)
 
         # Progress fill
@@ -357,27 +574,35 @@ class TimelineWidget(QWidget):
 
         # Current position indicator
         indicator_x = int(start_x + progress_width)
-        painter.setPen(QPen(self.current_color, 3))
+        painter.setPen(self._indicator_pen)
         painter.drawLine(indicator_x, int(y - 5), indicator_x, int(y + 15))
 
-        # Countdown text
-        painter.setFont(QFont("Arial", 8))
-        painter.setPen(QPen(self.current_color))
-        painter.drawText(
-            indicator_x + 5,
-            int(y + 25),
-            f"{int(ms_until_next)} ms",
+        # Countdown text, in 10 ms steps so the laid out texts get reused
+        painter.setFont(self._COUNTDOWN_FONT)
+        painter.setPen(self._countdown_pen)
+        painter.drawStaticText(
+            QPointF(indicator_x + 5, int(y + 25) - self._countdown_ascent),
+            self._countdown_text(int(ms_until_next) // 10 * 10),
         )
 
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _countdown_text(cls, ms: int) -> QStaticText:
+        """Return the countdown label for ``ms``, laid out once."""
+        static_text = QStaticText(f"{ms} ms")
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.prepare(QTransform(), cls._COUNTDOWN_FONT)
+        return static_text
+
     def set_show_grid(self, show: bool) -> None:
         """Toggle visibility of the grid overlay."""
+        if show == self.show_grid:
+            return
         self.show_grid = show
         self.update()
 
     def draw_fretboard(self, painter: QPainter, rect: QRect) -> None:
         """Draw a simple 6-string guitar fretboard background."""
-        painter.save()
-
         # Wood-like background
         gradient = QLinearGradient(rect.topLeft(), rect.bottomLeft())
         gradient.setColorAt(0, QColor(200, 170, 120))
@@ -393,11 +618,11 @@ class TimelineWidget(QWidget):
         painter.setPen(string_pen)
         num_strings = 6
         spacing = rect.height() / (num_strings - 1)
+        strings = []
         for i in range(num_strings):
-            y = rect.top() + i * spacing
-            painter.drawLine(rect.left(), int(y), rect.right(), int(y))
-
-        painter.restore()
+            y = int(rect.top() + i * spacing)
+            strings.append(QLine(rect.left(), y, rect.right(), y))
+        painter.drawLines(strings)
 
     def draw_grid(
         self,
@@ -412,10 +637,11 @@ class TimelineWidget(QWidget):
         painter.setPen(pen)
         top = int(start_y)
         bottom = int(start_y + height)
-
+        lines = []
         for i in range(self.steps_per_bar + 1):
             x = int(start_x + i * self.step_width)
-            painter.drawLine(x, top, x, bottom)
+            lines.append(QLine(x, top, x, bottom))
+        painter.drawLines(lines)
 
     def mouseMoveEvent(self, event):
         """Show deviation tooltip when hovering over steps."""
@@ -440,3 +666,6 @@ class TimelineWidget(QWidget):
     def leaveEvent(self, event):  # type: ignore[override]
         QToolTip.hideText()
         super().leaveEvent(event)
+
+
+__all__ = ["TimelineWidget"]
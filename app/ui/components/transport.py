@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 from PySide6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -9,10 +11,12 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QGroupBox,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
 from PySide6.QtGui import QFont
 from typing import Dict, Optional
 
+from app.ui.styles import repolish
+
 
 class TransportControls(QWidget):
     """Transport controls for play/pause/stop and tempo adjustment."""
@@ -33,6 +37,14 @@ class TransportControls(QWidget):
         self.bpm_min = 60
         self.bpm_max = 200
         self.patterns = {}
+        # Set while a batched update defers bpm_changed to its outermost caller
+        self._suppress = False
+
+        # Coalesces slider/spinbox edits so bpm_changed fires once per pause
+        self._bpm_emit_timer = QTimer(self)
+        self._bpm_emit_timer.setSingleShot(True)
+        self._bpm_emit_timer.setInterval(120)
+        self._bpm_emit_timer.timeout.connect(self._emit_bpm)
 
         self.init_ui()
 
@@ -76,6 +88,7 @@ class TransportControls(QWidget):
 
         # Play/Pause button
         self.play_button = QPushButton("▶ Play")
+        self.play_button.setObjectName("playButton")
         self.play_button.setMinimumWidth(80)
         self.play_button.setMinimumHeight(40)
         self.play_button.clicked.connect(self.on_play_pause_clicked)
@@ -109,6 +122,7 @@ class TransportControls(QWidget):
         self.bpm_slider.setMaximum(self.bpm_max)
         self.bpm_slider.setValue(self.current_bpm)
         self.bpm_slider.valueChanged.connect(self.on_bpm_slider_changed)
+        self.bpm_slider.sliderReleased.connect(self._flush_bpm)
         layout.addWidget(self.bpm_slider)
 
         # BPM adjustment buttons
@@ -169,6 +183,7 @@ class TransportControls(QWidget):
 
         return group
 
+    @Slot()
     def on_play_pause_clicked(self):
         """Handle play/pause button click."""
         if self.is_playing:
@@ -178,6 +193,7 @@ class TransportControls(QWidget):
             self.play_clicked.emit()
             self.set_playing(True)
 
+    @Slot()
     def on_stop_clicked(self):
         """Handle stop button click."""
         self.stop_clicked.emit()
@@ -186,38 +202,69 @@ class TransportControls(QWidget):
     def set_playing(self, playing: bool):
         """Update playing state and button text."""
         self.is_playing = playing
-        if playing:
-            self.play_button.setText("⏸ Pause")
-            self.play_button.setStyleSheet("background-color: #ffdddd;")
-        else:
-            self.play_button.setText("▶ Play")
-            self.play_button.setStyleSheet("")
+        self.play_button.setText("⏸ Pause" if playing else "▶ Play")
+        self.play_button.setProperty("playing", playing)
+        repolish(self.play_button)
 
+    @Slot(int)
     def on_bpm_slider_changed(self, value: int):
         """Handle BPM slider change."""
         self.current_bpm = value
+        self.bpm_spinbox.setValue(value)
         self.update_bpm_displays()
-        self.bpm_changed.emit(value)
+        self._bpm_emit_timer.start()
 
+    @Slot(int)
     def on_bpm_spinbox_changed(self, value: int):
         """Handle BPM spinbox change."""
-        self.current_bpm = value
+        # Already in sync when the slider drove the change
+        if self.bpm_slider.value() == value:
+            return
+        # The slider handler updates the tempo and schedules bpm_changed
         self.bpm_slider.setValue(value)
-        self.update_bpm_displays()
-        self.bpm_changed.emit(value)
+
+    @Slot()
+    def _emit_bpm(self):
+        """Emit the settled BPM after slider/spinbox edits."""
+        self.bpm_changed.emit(self.current_bpm)
+
+    @Slot()
+    def _flush_bpm(self):
+        """Emit a pending BPM change right away, e.g. when the slider is released."""
+        if self._bpm_emit_timer.isActive():
+            self._bpm_emit_timer.stop()
+            self._emit_bpm()
 
     def adjust_bpm(self, delta: int):
         """Adjust BPM by delta amount."""
         new_bpm = max(self.bpm_min, min(self.bpm_max, self.current_bpm + delta))
         self.set_bpm(new_bpm)
 
+    @contextmanager
+    def _suppress_signals(self):
+        """Block slider/spinbox signals and hold back nested bpm_changed emissions."""
+        suppress = self._suppress
+        slider_blocked = self.bpm_slider.blockSignals(True)
+        spinbox_blocked = self.bpm_spinbox.blockSignals(True)
+        self._suppress = True
+        try:
+            yield
+        finally:
+            self._suppress = suppress
+            self.bpm_slider.blockSignals(slider_blocked)
+            self.bpm_spinbox.blockSignals(spinbox_blocked)
+
     def set_bpm(self, bpm: int):
         """Set BPM value."""
-        self.current_bpm = max(self.bpm_min, min(self.bpm_max, bpm))
-        self.bpm_slider.setValue(self.current_bpm)
-        self.bpm_spinbox.setValue(self.current_bpm)
-        self.update_bpm_displays()
-        self.bpm_changed.emit(self.current_bpm)
+        with self._suppress_signals():
+            self.current_bpm = max(self.bpm_min, min(self.bpm_max, bpm))
+            self.bpm_slider.setValue(self.current_bpm)
+            self.bpm_spinbox.setValue(self.current_bpm)
+            self.update_bpm_displays()
+        # Emitted right away, so drop any debounced emission still pending
+        self._bpm_emit_timer.stop()
+        if not self._suppress:
+            self.bpm_changed.emit(self.current_bpm)
 
     def update_bpm_displays(self):
         """Update BPM label and related displays."""
@@ -228,18 +275,23 @@ class TransportControls(QWidget):
         self.bpm_min = min_bpm
         self.bpm_max = max_bpm
 
-        self.bpm_slider.setMinimum(min_bpm)
-        self.bpm_slider.setMaximum(max_bpm)
-        self.bpm_spinbox.setMinimum(min_bpm)
-        self.bpm_spinbox.setMaximum(max_bpm)
+        # Blocked so the widgets clamping their values don't emit on their own
+        with self._suppress_signals():
+            self.bpm_slider.setMinimum(min_bpm)
+            self.bpm_slider.setMaximum(max_bpm)
+            self.bpm_spinbox.setMinimum(min_bpm)
+            self.bpm_spinbox.setMaximum(max_bpm)
+
+            self.bpm_min_label.setText(f"{min_bpm}")
+            self.bpm_max_label.setText(f"{max_bpm}")
 
-        self.bpm_min_label.setText(f"{min_bpm}")
-        self.bpm_max_label.setText(f"{max_bpm}")
+            # Clamp current BPM to new range
+            clamped = self.current_bpm < min_bpm or self.current_bpm > max_bpm
+            if clamped:
+                self.set_bpm(max(min_bpm, min(max_bpm, self.current_bpm)))
 
-        # Clamp current BPM to new range
-        if self.current_bpm < min_bpm or self.current_bpm > max_bpm:
-            clamped_bpm = max(min_bpm, min(max_bpm, self.current_bpm))
-            self.set_bpm(clamped_bpm)
+        if clamped and not self._suppress:
+            self.bpm_changed.emit(self.current_bpm)
 
     def set_patterns(self, patterns: Dict):
         """Set available patterns in the combo box."""
@@ -249,17 +301,21 @@ class TransportControls(QWidget):
         for pattern_id, pattern in patterns.items():
             self.pattern_combo.addItem(pattern.name, pattern_id)
 
-    def on_pattern_changed(self):
-        """Handle pattern selection change."""
+    @Slot(str)
+    def on_pattern_changed(self, _text: str = ""):
+        """Handle pattern selection change (the combo's item data is the pattern id)."""
         pattern_id = self.pattern_combo.currentData()
         if pattern_id and pattern_id in self.patterns:
             pattern = self.patterns[pattern_id]
 
-            # Update BPM range for this pattern
-            self.set_bpm_range(pattern.bpm_min, pattern.bpm_max)
+            with self._suppress_signals():
+                # Update BPM range for this pattern
+                self.set_bpm_range(pattern.bpm_min, pattern.bpm_max)
 
-            # Set default BPM for this pattern
-            self.set_bpm(pattern.bpm_default)
+                # Set default BPM for this pattern
+                self.set_bpm(pattern.bpm_default)
+            if not self._suppress:
+                self.bpm_changed.emit(self.current_bpm)
 
             # Update pattern info
             time_sig_str = f"{pattern.time_sig[0]}/{pattern.time_sig[1]}"
@@ -1,8 +1,14 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+from typing import Dict, Tuple
+
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                QSlider, QPushButton, QGroupBox, QCheckBox)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QFont
 
+# Mute button icon of each volume channel while unmuted
+_CHANNEL_ICONS = {'master': "🔊", 'click': "🎵", 'strum': "🎸"}
+_MUTED_ICON = "🔇"
+
 
 class VolumeControls(QWidget):
     """Volume control widget with sliders for different audio types."""
@@ -11,14 +17,16 @@ class VolumeControls(QWidget):
     mute_toggled = Signal(str, bool)     # volume_type, muted
     enabled_changed = Signal(str, bool)  # audio_type, enabled
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, continuous_update: bool = False):
         super().__init__(parent)
+        # When False, a slider drag emits volume_changed only on release
+        self.continuous_update = continuous_update
+        # Slider, percent label and mute button by channel name
+        self._channels: Dict[str, Tuple[QSlider, QLabel, QPushButton]] = {}
         self.init_ui()
         
         # Mute states
-        self._click_muted = False
-        self._strum_muted = False
-        self._master_muted = False
+        self._muted = {volume_type: False for volume_type in _CHANNEL_ICONS}
         
     def init_ui(self):
         """Initialize the volume controls UI."""
@@ -27,32 +35,10 @@ class VolumeControls(QWidget):
         # Master volume
         master_group = QGroupBox("🔊 Основная громкость")
         master_layout = QHBoxLayout(master_group)
-        
-        self.master_slider = QSlider(Qt.Orientation.Horizontal)
-        self.master_slider.setRange(0, 100)
-        self.master_slider.setValue(80)
-        self.master_slider.valueChanged.connect(
-            lambda v: self.volume_changed.emit('master', v / 100.0)
-        )
-        
-        self.master_label = QLabel("80%")
-        self.master_label.setMinimumWidth(35)
-        self.master_slider.valueChanged.connect(
-            lambda v: self.master_label.setText(f"{v}%")
-        )
-        
-        self.master_mute = QPushButton("🔊")
-        self.master_mute.setMinimumWidth(50)
-        self.master_mute.setMaximumWidth(80)  # Increased for display scaling
-        self.master_mute.setCheckable(True)
-        self.master_mute.toggled.connect(
-            lambda checked: self._toggle_mute('master', checked)
+        self.master_slider, self.master_label, self.master_mute = (
+            self._add_channel(master_layout, 'master', 80)
         )
         
-        master_layout.addWidget(self.master_slider)
-        master_layout.addWidget(self.master_label)
-        master_layout.addWidget(self.master_mute)
-        
         layout.addWidget(master_group)
         
         # Click and Strum controls in horizontal layout
@@ -63,30 +49,9 @@ class VolumeControls(QWidget):
         click_layout = QVBoxLayout(click_group)
         
         click_controls = QHBoxLayout()
-        self.click_slider = QSlider(Qt.Orientation.Horizontal)
-        self.click_slider.setRange(0, 100)
-        self.click_slider.setValue(70)
-        self.click_slider.valueChanged.connect(
-            lambda v: self.volume_changed.emit('click', v / 100.0)
-        )
-        
-        self.click_label = QLabel("70%")
-        self.click_label.setMinimumWidth(35)
-        self.click_slider.valueChanged.connect(
-            lambda v: self.click_label.setText(f"{v}%")
-        )
-        
-        self.click_mute = QPushButton("🎵")
-        self.click_mute.setMinimumWidth(50)
-        self.click_mute.setMaximumWidth(80)  # Increased for display scaling
-        self.click_mute.setCheckable(True)
-        self.click_mute.toggled.connect(
-            lambda checked: self._toggle_mute('click', checked)
+        self.click_slider, self.click_label, self.click_mute = (
+            self._add_channel(click_controls, 'click', 70)
         )
-        
-        click_controls.addWidget(self.click_slider)
-        click_controls.addWidget(self.click_label)
-        click_controls.addWidget(self.click_mute)
         click_layout.addLayout(click_controls)
         
         # Enable/disable checkbox for metronome
@@ -104,30 +69,9 @@ class VolumeControls(QWidget):
         strum_layout = QVBoxLayout(strum_group)
         
         strum_controls = QHBoxLayout()
-        self.strum_slider = QSlider(Qt.Orientation.Horizontal)
-        self.strum_slider.setRange(0, 100)
-        self.strum_slider.setValue(50)
-        self.strum_slider.valueChanged.connect(
-            lambda v: self.volume_changed.emit('strum', v / 100.0)
-        )
-        
-        self.strum_label = QLabel("50%")
-        self.strum_label.setMinimumWidth(35)
-        self.strum_slider.valueChanged.connect(
-            lambda v: self.strum_label.setText(f"{v}%")
+        self.strum_slider, self.strum_label, self.strum_mute = (
+            self._add_channel(strum_controls, 'strum', 50)
         )
-        
-        self.strum_mute = QPushButton("🎸")
-        self.strum_mute.setMinimumWidth(50)
-        self.strum_mute.setMaximumWidth(80)  # Increased for display scaling
-        self.strum_mute.setCheckable(True)
-        self.strum_mute.toggled.connect(
-            lambda checked: self._toggle_mute('strum', checked)
-        )
-        
-        strum_controls.addWidget(self.strum_slider)
-        strum_controls.addWidget(self.strum_label)
-        strum_controls.addWidget(self.strum_mute)
         strum_layout.addLayout(strum_controls)
         
         # Enable/disable checkbox for strum sounds
@@ -142,33 +86,69 @@ class VolumeControls(QWidget):
         
         layout.addLayout(controls_layout)
         
+    def _add_channel(self, layout: QHBoxLayout, volume_type: str,
+                     value: int) -> Tuple[QSlider, QLabel, QPushButton]:
+        """Add slider, percent label and mute button for a channel to layout."""
+        slider = QSlider(Qt.Orientation.Horizontal)
+        slider.setObjectName(volume_type)
+        slider.setRange(0, 100)
+        slider.setValue(value)
+        slider.valueChanged.connect(self._on_volume_value)
+        slider.sliderReleased.connect(self._on_volume_released)
+        
+        label = QLabel(f"{value}%")
+        label.setMinimumWidth(35)
+        
+        mute = QPushButton(_CHANNEL_ICONS[volume_type])
+        mute.setObjectName(volume_type)
+        mute.setMinimumWidth(50)
+        mute.setMaximumWidth(80)  # Increased for display scaling
+        mute.setCheckable(True)
+        mute.toggled.connect(self._on_mute_toggled)
+        
+        layout.addWidget(slider)
+        layout.addWidget(label)
+        layout.addWidget(mute)
+        
+        self._channels[volume_type] = (slider, label, mute)
+        return slider, label, mute
+        
+    @Slot(int)
+    def _on_volume_value(self, value: int):
+        """Show a slider's percentage and emit its volume unless the drag is deferred."""
+        slider = self.sender()
+        volume_type = slider.objectName()
+        self._channels[volume_type][1].setText(f"{value}%")
+        if self.continuous_update or not slider.isSliderDown():
+            self.volume_changed.emit(volume_type, value / 100.0)
+            
+    @Slot()
+    def _on_volume_released(self):
+        """Emit the volume a deferred slider drag ended on."""
+        if not self.continuous_update:
+            slider = self.sender()
+            self.volume_changed.emit(slider.objectName(), slider.value() / 100.0)
+            
+    @Slot(bool)
+    def _on_mute_toggled(self, muted: bool):
+        self._toggle_mute(self.sender().objectName(), muted)
+        
     def _toggle_mute(self, volume_type: str, muted: bool):
         """Handle mute toggle for different volume types."""
-        if volume_type == 'master':
-            self._master_muted = muted
-            self.master_mute.setText("🔇" if muted else "🔊")
-            # Mute by setting volume to 0
-            volume = 0.0 if muted else self.master_slider.value() / 100.0
-        elif volume_type == 'click':
-            self._click_muted = muted
-            self.click_mute.setText("🔇" if muted else "🎵")
-            volume = 0.0 if muted else self.click_slider.value() / 100.0
-        elif volume_type == 'strum':
-            self._strum_muted = muted
-            self.strum_mute.setText("🔇" if muted else "🎸")
-            volume = 0.0 if muted else self.strum_slider.value() / 100.0
-        else:
+        channel = self._channels.get(volume_type)
+        if channel is None:
             return
-            
+        slider, _, mute = channel
+        
+        self._muted[volume_type] = muted
+        mute.setText(_MUTED_ICON if muted else _CHANNEL_ICONS[volume_type])
+        # Mute by setting volume to 0
+        volume = 0.0 if muted else slider.value() / 100.0
+        
         self.volume_changed.emit(volume_type, volume)
         
     def set_volume(self, volume_type: str, value: float):
         """Set volume slider value (0.0 to 1.0)."""
-        int_value = int(value * 100)
-        
-        if volume_type == 'master':
-            self.master_slider.setValue(int_value)
-        elif volume_type == 'click':
-            self.click_slider.setValue(int_value)
-        elif volume_type == 'strum':
-            self.strum_slider.setValue(int_value)
\ No newline at end of file
+        channel = self._channels.get(volume_type)
+        if channel is not None:
+            channel[0].setValue(int(value * 100))
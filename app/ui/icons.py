@@ -4,7 +4,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QGuiApplication, QIcon, QPainter, QPixmap
 
 # Directory containing technique icons
 ICONS_DIR = Path(__file__).resolve().parents[2] / "assets" / "icons" / "techniques"
@@ -29,3 +30,38 @@ def get_technique_icon(name: str) -> Optional[QPixmap]:
         if path.exists():
             return QPixmap(str(path))
     return None
+
+
+def get_emoji_icon(emoji: str, size: int = 24) -> QIcon:
+    """Return a QIcon with ``emoji`` rasterized once per pixel ratio.
+
+    Parameters
+    ----------
+    emoji: str
+        Emoji glyph to render, e.g. "🔊".
+    size: int
+        Icon edge length in device-independent pixels.
+
+    Returns
+    -------
+    QIcon
+        Icon backed by a pixmap rendered at the highest screen pixel ratio,
+        or 1.0 when no screen is attached.
+    """
+    return _render_emoji_icon(emoji, size, QGuiApplication.instance().devicePixelRatio())
+
+
+@lru_cache(maxsize=None)
+def _render_emoji_icon(emoji: str, size: int, dpr: float) -> QIcon:
+    """Rasterize ``emoji`` into a ``size`` px icon at pixel ratio ``dpr``."""
+    pixmap = QPixmap(int(size * dpr), int(size * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    font = QFont()
+    font.setPixelSize(int(size * 0.8))
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.drawText(0, 0, size, size, Qt.AlignmentFlag.AlignCenter, emoji)
+    painter.end()
+    return QIcon(pixmap)
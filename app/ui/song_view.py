@@ -18,6 +18,7 @@ from .components.transport import TransportControls
 from .components.progression_controls import ProgressionControlsWidget
 from .components.chord_display import ChordDisplayWidget
 from .components.song_info_popup import SongInfoPopup
+from app.core.patterns import section_display_name
 
 
 class SongView(QWidget):
@@ -241,7 +242,7 @@ class SongView(QWidget):
             # Add sections from structure
             section_names = self.current_song.get_section_names()
             for section_name in section_names:
-                display_name = section_name.replace("_", " ").title()
+                display_name = section_display_name(section_name)
                 self.section_combo.addItem(display_name, section_name)
 
             # Enable navigation buttons
@@ -280,7 +281,7 @@ class SongView(QWidget):
         self.current_section = section
 
         # Update section label
-        display_name = section_name.replace("_", " ").title()
+        display_name = section_display_name(section_name)
         self.current_section_label.setText(f"Секция: {display_name}")
 
         # Update progress
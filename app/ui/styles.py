@@ -0,0 +1,146 @@
+"""Application-wide Qt stylesheet and helpers for property-driven styling."""
+
+from PySide6.QtWidgets import QWidget
+
+# Installed once on the QApplication. Widgets opt into specific rules via
+# objectName selectors or dynamic properties instead of carrying their own
+# per-widget stylesheets.
+APP_QSS = """
+QMainWindow {
+    background-color: #f8f9fa;
+}
+
+QGroupBox {
+    font-weight: bold;
+    font-size: 14px;
+    color: #2c3e50;
+    border: 2px solid #bdc3c7;
+    border-radius: 8px;
+    margin-top: 10px;
+    padding-top: 10px;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    subcontrol-position: top left;
+    padding: 0 10px;
+    background-color: #f8f9fa;
+}
+
+QComboBox {
+    border: 1px solid #bdc3c7;
+    border-radius: 4px;
+    padding: 5px;
+    background-color: white;
+}
+
+QComboBox:focus {
+    border: 2px solid #3498db;
+}
+
+QPushButton {
+    border: 1px solid #bdc3c7;
+    border-radius: 6px;
+    padding: 8px 16px;
+    background-color: #ecf0f1;
+    font-size: 12px;
+}
+
+QPushButton:hover {
+    background-color: #d5dbdb;
+}
+
+QPushButton:pressed {
+    background-color: #bdc3c7;
+}
+
+QPushButton:disabled {
+    color: #95a5a6;
+    background-color: #f8f9fa;
+}
+QLabel#appTitle {
+    color: #2c3e50;
+    margin: 10px;
+}
+
+QLabel#appVersion {
+    color: #7f8c8d;
+    font-size: 12px;
+}
+
+QLabel#welcomeLabel {
+    margin: 20px;
+    color: #34495e;
+}
+
+QPushButton#practiceButton,
+QPushButton#songButton {
+    color: white;
+    border: none;
+    border-radius: 8px;
+    font-size: 14px;
+    font-weight: bold;
+}
+
+QPushButton#practiceButton {
+    background-color: #3498db;
+}
+
+QPushButton#practiceButton:hover {
+    background-color: #2980b9;
+}
+
+QPushButton#practiceButton:pressed {
+    background-color: #21618c;
+}
+
+QPushButton#songButton {
+    background-color: #e74c3c;
+}
+
+QPushButton#songButton:hover {
+    background-color: #c0392b;
+}
+
+QPushButton#songButton:pressed {
+    background-color: #a93226;
+}
+
+QPushButton#quizButton {
+    background-color: #bdc3c7;
+    color: #7f8c8d;
+    border-radius: 6px;
+}
+
+QLabel#patternPreview {
+    background-color: #ecf0f1;
+    border: 1px solid #bdc3c7;
+    border-radius: 6px;
+    padding: 10px;
+    margin-top: 10px;
+}
+
+QLabel#tipsLabel {
+    background-color: #fff3cd;
+    border: 1px solid #ffeaa7;
+    border-radius: 6px;
+    padding: 15px;
+    color: #856404;
+}
+
+QPushButton#playButton[playing="true"] {
+    background-color: #ffdddd;
+}
+
+QLabel#noChordsLabel {
+    color: #666;
+    font-style: italic;
+}
+"""
+
+
+def repolish(widget: QWidget) -> None:
+    """Re-evaluate stylesheet rules after a dynamic property change."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
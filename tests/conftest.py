@@ -0,0 +1,37 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from app.core.patterns import Step, StrumPattern
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Shared QApplication for widget tests."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def make_pattern():
+    """Return a factory for one-bar patterns cycling through ``dirs``."""
+
+    def make(steps_per_bar=4, dirs="DU", name="Test", bpm_default=120, bpm_min=60, bpm_max=180):
+        return StrumPattern(
+            id=name.lower(),
+            name=name,
+            time_sig=(4, 4),
+            steps_per_bar=steps_per_bar,
+            steps=[
+                Step(t=i / steps_per_bar, dir=dirs[i % len(dirs)])
+                for i in range(steps_per_bar)
+            ],
+            bpm_default=bpm_default,
+            bpm_min=bpm_min,
+            bpm_max=bpm_max,
+            notes="",
+        )
+
+    return make
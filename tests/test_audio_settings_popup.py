@@ -0,0 +1,26 @@
+from app.ui.components.audio_settings_popup import AudioSettingsPopup
+
+
+def test_programmatic_setters_do_not_emit(qapp):
+    popup = AudioSettingsPopup()
+    emitted = []
+    popup.volume_changed.connect(lambda *args: emitted.append(("volume", args)))
+    popup.mute_toggled.connect(lambda *args: emitted.append(("mute", args)))
+    popup.enabled_changed.connect(lambda *args: emitted.append(("enabled", args)))
+    popup.instrument_changed.connect(lambda *args: emitted.append(("instr", args)))
+
+    popup.set_master_volume(0.3, True)
+    popup.set_click_volume(0.4, True, False)
+    popup.set_strum_volume(0.6, False, False)
+    popup.set_instrument("piano", ["guitar", "piano"])
+
+    assert emitted == []
+    assert popup.master_slider.value() == 30
+    assert popup.master_mute_btn.isChecked()
+    assert not popup.click_enable_cb.isChecked()
+    assert not popup.strum_slider.isEnabled()
+    assert popup.instrument_combo.currentText() == "piano"
+
+    # User interaction still reaches the handlers
+    popup.master_mute_btn.setChecked(False)
+    assert ("volume", ("master", 0.3)) in emitted
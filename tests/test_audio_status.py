@@ -0,0 +1,32 @@
+from app.ui.components.audio_status import AudioStatusWidget
+
+
+class DummyAudio:
+    def __init__(self):
+        self.available = True
+        self.name = "Speakers"
+
+    def is_available(self):
+        return self.available
+
+    def get_device_info(self):
+        return {"name": self.name}
+
+
+def test_update_status_skips_unchanged_state(qapp, monkeypatch):
+    audio = DummyAudio()
+    widget = AudioStatusWidget(audio)
+    assert widget.status_label.text() == "🔊 Audio: Speakers"
+
+    calls = []
+    monkeypatch.setattr(
+        widget.status_label, "setStyleSheet", lambda qss: calls.append(qss)
+    )
+
+    widget.update_status()
+    assert calls == []
+
+    audio.available = False
+    widget.update_status()
+    assert calls == ["color: orange;"]
+    assert "Unavailable" in widget.status_label.text()
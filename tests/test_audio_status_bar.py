@@ -0,0 +1,49 @@
+from app.ui.components.audio_status_bar import AudioStatusBar
+
+
+def test_batched_setters_refresh_icons_once(qapp, monkeypatch):
+    bar = AudioStatusBar()
+    refreshes = []
+    original = AudioStatusBar.update_icon_states
+
+    def counting_update(self):
+        if not self._suspend:
+            refreshes.append(True)
+        original(self)
+
+    monkeypatch.setattr(AudioStatusBar, "update_icon_states", counting_update)
+
+    with bar._batched():
+        bar.set_master_volume(0.5, True)
+        bar.set_click_volume(0.4, enabled=False)
+        bar.set_strum_volume(0.3)
+
+    assert len(refreshes) == 1
+    assert bar.master_btn.isChecked()
+    assert bar.click_btn.toolTip() == "Metronome: DISABLED"
+
+
+def test_update_icon_states_skips_unchanged_buttons(qapp, monkeypatch):
+    bar = AudioStatusBar()
+    calls = []
+    monkeypatch.setattr(bar.click_btn, "setIcon", lambda icon: calls.append(icon))
+    monkeypatch.setattr(
+        bar.click_btn, "setToolTip", lambda tip: calls.append(tip)
+    )
+
+    bar.update_icon_states()
+    assert calls == []
+
+    bar.set_click_volume(0.2)
+    assert calls == ["Metronome: 20%"]
+
+
+def test_clicking_muted_master_keeps_checked_in_sync(qapp):
+    bar = AudioStatusBar()
+    bar.set_master_volume(0.0)
+    assert bar.master_btn.isChecked()
+
+    # Zero volume still shows as muted even after the user toggles mute off
+    bar.master_btn.click()
+    bar.master_btn.click()
+    assert bar.master_btn.isChecked()
@@ -0,0 +1,73 @@
+from PySide6.QtGui import QPixmapCache
+
+from app.ui.components.chord_display import ChordWidget
+
+
+def test_chord_widget_reuses_rendered_pixmap(qapp, monkeypatch):
+    QPixmapCache.clear()
+    first = ChordWidget("Am")
+    second = ChordWidget("Am")
+    first.resize(120, 160)
+    second.resize(120, 160)
+
+    renders = []
+    original = ChordWidget._render_pixmap
+
+    def counting_render(self, dpr):
+        renders.append(self.chord_name)
+        return original(self, dpr)
+
+    monkeypatch.setattr(ChordWidget, "_render_pixmap", counting_render)
+
+    first.grab()
+    second.grab()
+    assert renders == ["Am"]
+
+    first.set_highlighted(True)
+    first.grab()
+    assert renders == ["Am", "Am"]
+
+
+class _Song:
+    def __init__(self, progression):
+        self.progression = progression
+
+
+def test_chord_display_reuses_widgets_on_progression_change(qapp):
+    from app.ui.components.chord_display import ChordDisplayWidget
+
+    display = ChordDisplayWidget()
+    display.set_song(_Song(["C", "G", "Am"]))
+    widgets = list(display.chord_labels)
+
+    display.set_song(_Song(["C", "F"]))
+    assert display.chord_labels == widgets[:2]
+    assert [w.chord_name for w in display.chord_labels] == ["C", "F"]
+
+    display.set_song(_Song(["C", "F", "G", "Em"]))
+    assert display.chord_labels[:2] == widgets[:2]
+    assert [w.chord_name for w in display.chord_labels] == ["C", "F", "G", "Em"]
+
+
+def test_highlight_chord_coalesces_to_single_highlight(qapp):
+    from app.ui.components.chord_display import ChordDisplayWidget
+
+    display = ChordDisplayWidget()
+    display.set_song(_Song(["C", "G", "Am", "F"]))
+
+    display.highlight_chord(1)
+    display.highlight_chord(3)
+    assert not any(w.is_highlighted for w in display.chord_labels)
+    qapp.processEvents()
+    assert [w.is_highlighted for w in display.chord_labels] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+
+    display.set_song(_Song(["C", "G"]))
+    assert not any(w.is_highlighted for w in display.chord_labels)
+    display.highlight_chord(0)
+    qapp.processEvents()
+    assert display.chord_labels[0].is_highlighted
@@ -0,0 +1,69 @@
+from app.core.patterns import Song, SongSection
+from app.ui.components.song_structure_widget import SongStructureWidget
+
+
+def _song():
+    structure = {
+        name: SongSection(name=name, chords=["C", "G"], pattern="basic", repeat=repeat)
+        for name, repeat in (("intro", 1), ("verse", 2), ("chorus", 3))
+    }
+    return Song(
+        title="Song",
+        artist="Artist",
+        bpm=100,
+        time_sig=(4, 4),
+        pattern_id="basic",
+        progression=["C", "G"],
+        notes="",
+        structure=structure,
+    )
+
+
+def test_section_boxes_rendered_once_per_song_and_size(qapp, monkeypatch):
+    widget = SongStructureWidget()
+    widget.resize(400, 90)
+    widget.set_song(_song())
+
+    renders = []
+    original = SongStructureWidget._render_structure_pixmap
+
+    def counting_render(self, *args):
+        renders.append(args)
+        return original(self, *args)
+
+    monkeypatch.setattr(SongStructureWidget, "_render_structure_pixmap", counting_render)
+
+    widget.grab()
+    for index, name in enumerate(["verse", "chorus", "intro"], start=1):
+        widget.set_current_section(name, index % 3)
+        widget.grab()
+    assert len(renders) == 1
+
+    widget.resize(500, 90)
+    widget.grab()
+    assert len(renders) == 2
+
+    widget.set_song(_song())
+    widget.grab()
+    assert len(renders) == 3
+
+
+def test_long_section_names_stay_inside_narrow_boxes(qapp):
+    names = ["intro", "verse", "pre_chorus", "chorus", "bridge", "instrumental_break"]
+    song = _song()
+    song.structure = {
+        name: SongSection(name=name, chords=["C"], pattern="basic") for name in names
+    }
+    widget = SongStructureWidget()
+    widget.resize(400, 90)
+    widget.set_song(song)
+    widget.set_current_section("pre_chorus", 2)
+
+    image = widget.grab().toImage()
+    background = image.pixel(0, 0)
+    section_width, y_pos = widget._section_layout(len(names))
+    spacing = SongStructureWidget._SECTION_SPACING
+    for i in range(len(names) - 1):
+        gap_x = SongStructureWidget._SECTION_MARGIN + (i + 1) * (section_width + spacing) - spacing // 2
+        for y in range(y_pos + 2, y_pos + SongStructureWidget._SECTION_HEIGHT - 2):
+            assert image.pixel(gap_x, y) == background
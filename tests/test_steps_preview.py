@@ -0,0 +1,26 @@
+import app.ui.components.steps_preview as steps_preview
+from app.ui.components.steps_preview import StepsPreviewWidget
+
+
+def test_fill_tick_repaints_only_changed_strip(qapp, make_pattern, monkeypatch):
+    widget = StepsPreviewWidget()
+    widget.animation_timer.stop()
+    widget.resize(300, 200)
+    widget.set_pattern(make_pattern())
+    widget.set_bpm(120)  # 0.5 s per step
+
+    now = [100.0]
+    monkeypatch.setattr(steps_preview, "monotonic", lambda: now[0])
+    widget.set_current_step(1)
+
+    updates = []
+    monkeypatch.setattr(widget, "update", lambda *args: updates.append(args))
+
+    now[0] += 0.125
+    widget.update_fill_progress()
+    assert updates == [(0, 150, 300, 51)]
+
+    # Same fill height as last painted: nothing to repaint
+    widget._fill_pixels = 50
+    widget.update_fill_progress()
+    assert len(updates) == 1
@@ -0,0 +1,113 @@
+import app.ui.components.timeline as timeline
+from app.ui.components.timeline import TimelineWidget
+
+
+def test_background_rendered_once_per_size_and_layout(qapp, make_pattern, monkeypatch):
+    widget = TimelineWidget()
+    widget.countdown_timer.stop()
+    widget.resize(900, 240)
+    widget.set_pattern(make_pattern(8))
+
+    renders = []
+    original = TimelineWidget._render_background
+
+    def counting_render(self, *args):
+        renders.append(args)
+        return original(self, *args)
+
+    monkeypatch.setattr(TimelineWidget, "_render_background", counting_render)
+
+    widget.grab()
+    for step in range(1, 4):
+        widget.set_current_step(step)
+        widget.set_step_accuracy(step, 10.0)
+        widget.grab()
+    assert len(renders) == 1
+
+    widget.set_show_grid(False)
+    widget.grab()
+    assert len(renders) == 2
+
+    widget.resize(1000, 240)
+    widget.grab()
+    assert len(renders) == 3
+
+
+def test_countdown_timer_runs_only_until_next_step(qapp, make_pattern, monkeypatch):
+    widget = TimelineWidget()
+    widget.set_pattern(make_pattern(8))
+    widget.set_bpm(120)  # 250 ms per step
+    assert not widget.countdown_timer.isActive()
+
+    now = [100.0]
+    monkeypatch.setattr(timeline, "monotonic", lambda: now[0])
+    widget.set_current_step(1)
+    assert widget.countdown_timer.isActive()
+    assert widget.countdown_timer.interval() == 62
+
+    now[0] += 0.1
+    widget.countdown_timer.stop()
+    widget._on_countdown_tick()
+    assert widget.countdown_timer.isActive()
+
+    now[0] += 0.2
+    widget.countdown_timer.stop()
+    widget._on_countdown_tick()
+    assert not widget.countdown_timer.isActive()
+
+
+def test_unchanged_state_schedules_no_repaint(qapp, make_pattern, monkeypatch):
+    widget = TimelineWidget()
+    widget.countdown_timer.stop()
+    widget.resize(900, 240)
+    widget.set_pattern(make_pattern(8))
+    widget.set_bpm(100)
+    widget.set_step_accuracy(2, 10.0)
+
+    updates = []
+    monkeypatch.setattr(widget, "update", lambda *args: updates.append(args))
+
+    widget.set_bpm(100)
+    widget.set_show_grid(widget.show_grid)
+    widget.highlight_scale = widget.highlight_scale
+    widget.set_step_accuracy(2, 20.0)  # Still within the good threshold
+    assert updates == []
+
+    widget.set_step_accuracy(2, 50.0)
+    assert len(updates) == 1
+
+
+def test_partial_repaints_match_full_render_on_tall_timeline(qapp, make_pattern, monkeypatch):
+    from PySide6.QtCore import QRect
+    from PySide6.QtGui import QImage, QRegion
+
+    monkeypatch.setattr(timeline, "monotonic", lambda: 100.0)
+    pattern = make_pattern(8, dirs="D-", name="Rests")
+    widget = TimelineWidget()
+    widget.resize(800, 500)
+    widget.set_pattern(pattern)
+    widget.show()
+    qapp.processEvents()
+    widget.countdown_timer.stop()
+
+    image = QImage(widget.size(), QImage.Format.Format_ARGB32)
+    widget.render(image)
+
+    regions = []
+    monkeypatch.setattr(
+        widget, "update", lambda *args: regions.append(QRect(*args) if args else widget.rect())
+    )
+    for op in (
+        lambda: widget.set_current_step(1),
+        widget.reset_highlight_scale,
+        lambda: widget.set_current_step(2),
+        lambda: widget.set_current_step(3),
+        widget.reset_highlight_scale,
+    ):
+        regions.clear()
+        op()
+        for rect in regions:
+            widget.render(image, rect.topLeft(), QRegion(rect))
+        full = QImage(widget.size(), QImage.Format.Format_ARGB32)
+        widget.render(full)
+        assert image == full
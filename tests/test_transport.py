@@ -0,0 +1,50 @@
+from app.ui.components.transport import TransportControls
+
+
+def test_slider_drag_emits_bpm_once_on_release(qapp):
+    transport = TransportControls()
+    emitted = []
+    transport.bpm_changed.connect(emitted.append)
+
+    for value in range(100, 111):
+        transport.bpm_slider.setValue(value)
+    assert emitted == []
+    assert transport.bpm_label.text() == "110 BPM"
+
+    transport.bpm_slider.sliderReleased.emit()
+    assert emitted == [110]
+    assert not transport._bpm_emit_timer.isActive()
+
+
+def test_set_bpm_emits_immediately(qapp):
+    transport = TransportControls()
+    emitted = []
+    transport.bpm_changed.connect(emitted.append)
+
+    transport.set_bpm(90)
+    assert emitted == [90]
+    assert not transport._bpm_emit_timer.isActive()
+
+
+def test_pattern_switch_emits_bpm_once(qapp, make_pattern):
+    transport = TransportControls()
+    pattern = make_pattern(dirs="D", name="Slow", bpm_default=70, bpm_min=40, bpm_max=100)
+    transport.set_bpm(180)
+    transport.set_patterns({"slow": pattern})
+
+    emitted = []
+    transport.bpm_changed.connect(emitted.append)
+    transport.on_pattern_changed("Slow")
+    assert emitted == [70]
+    assert transport.bpm_slider.value() == transport.bpm_spinbox.value() == 70
+    assert not transport._bpm_emit_timer.isActive()
+
+
+def test_slider_and_spinbox_stay_in_sync(qapp):
+    transport = TransportControls()
+    transport.bpm_slider.setValue(130)
+    assert transport.bpm_spinbox.value() == 130
+
+    transport.bpm_spinbox.setValue(140)
+    assert transport.bpm_slider.value() == 140
+    assert transport.current_bpm == 140
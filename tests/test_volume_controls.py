@@ -0,0 +1,31 @@
+from app.ui.components.volume_controls import VolumeControls
+
+
+def _drag(slider, values):
+    slider.setSliderDown(True)
+    for value in values:
+        slider.setValue(value)
+    slider.setSliderDown(False)  # Emits sliderReleased
+
+
+def test_drag_emits_volume_on_release_only(qapp):
+    controls = VolumeControls()
+    emitted = []
+    controls.volume_changed.connect(lambda *args: emitted.append(args))
+
+    _drag(controls.master_slider, range(50, 60))
+    assert emitted == [("master", 0.59)]
+    assert controls.master_label.text() == "59%"
+
+    # Changes outside a drag (keyboard, set_volume) still emit right away
+    controls.set_volume("click", 0.3)
+    assert emitted[-1] == ("click", 0.3)
+
+
+def test_continuous_update_emits_every_value(qapp):
+    controls = VolumeControls(continuous_update=True)
+    emitted = []
+    controls.volume_changed.connect(lambda *args: emitted.append(args))
+
+    _drag(controls.strum_slider, [60, 61, 62])
+    assert emitted == [("strum", 0.6), ("strum", 0.61), ("strum", 0.62)]